@@ -0,0 +1,116 @@
+"""
+LLM 백엔드 인터페이스
+ProposalAnalyzer가 모델을 호출할 때 의존하는 계약 (Gemini, 로컬 스텁 등으로 교체 가능)
+"""
+from typing import Any, AsyncIterator, Dict, Optional
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+class LLMBackend:
+    """
+    모델 호출 백엔드 기본 클래스
+
+    구현 클래스는 send_detailed, async_send_detailed, stream_async를 제공해야 하며
+    메타데이터는 {"finish_reason": "STOP" | "MAX_TOKENS" | None, "usage": {...}} 형식을 따름
+    """
+
+    name = "base"
+
+    def is_configured(self) -> bool:
+        """호출 가능한 상태인지 확인"""
+        return True
+
+    def send(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str]:
+        """
+        요청 전송
+
+        Args:
+            prompt: 전송할 프롬프트 (prefix가 있으면 그 뒤에 이어지는 가변 부분)
+            generation_config: 생성 설정 (response_mime_type, response_schema 등)
+            prefix: 매 호출 동일한 프롬프트 앞부분
+
+        Returns:
+            (성공 여부, 응답 텍스트 또는 에러 메시지)
+        """
+        success, result, _ = self.send_detailed(prompt, generation_config=generation_config, prefix=prefix)
+        return success, result
+
+    def send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """
+        요청 전송 (종료 사유/토큰 사용량 포함)
+
+        Returns:
+            (성공 여부, 응답 텍스트 또는 에러 메시지, 메타데이터 - 실패 시 빈 dict)
+        """
+        raise NotImplementedError
+
+    async def async_send(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str]:
+        """요청 전송 (asyncio)"""
+        success, result, _ = await self.async_send_detailed(prompt, generation_config=generation_config, prefix=prefix)
+        return success, result
+
+    async def async_send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """요청 전송 (asyncio, 종료 사유/토큰 사용량 포함)"""
+        raise NotImplementedError
+
+    def stream_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 요청 (응답 텍스트 조각을 도착 순서대로 반환)
+
+        Args:
+            meta: 전달하면 스트림 종료 시 종료 사유/토큰 사용량을 채움
+
+        Raises:
+            RuntimeError: 요청 실패 (사용자에게 보여줄 에러 메시지 포함)
+        """
+        raise NotImplementedError
+
+    async def count_tokens_async(self, text: str) -> tuple[bool, int | str]:
+        """
+        텍스트의 실제 토큰 수 계산 (문서/프롬프트 전체에 1회 사용, 기본 구현은 오프라인 추정값)
+
+        Returns:
+            (성공 여부, 토큰 수 또는 에러 메시지)
+        """
+        from backend.analyzer.prompt.optimizer import token_optimizer
+        return True, token_optimizer.estimate_tokens(text)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """백엔드 통계 조회"""
+        return {"name": self.name}
+
+
+def create_backend(api_key: str = None, kind: str = None) -> LLMBackend:
+    """
+    LLM 백엔드 생성
+
+    Args:
+        api_key: Gemini API 키 (stub은 사용하지 않음)
+        kind: "gemini" 또는 "stub" (없으면 설정값)
+    """
+    kind = (kind or settings.LLM_BACKEND).lower()
+
+    if kind == "stub":
+        from backend.analyzer.backends.stub import stub_backend
+        return stub_backend
+
+    if kind != "gemini":
+        logger.warning(f"알 수 없는 LLM 백엔드: {kind} (gemini 사용)")
+
+    from backend.analyzer.backends.gemini import GeminiBackend
+    return GeminiBackend(api_key)
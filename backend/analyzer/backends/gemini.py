@@ -0,0 +1,58 @@
+"""
+Gemini LLM 백엔드
+키별 클라이언트 풀, 속도 제한, 컨텍스트 캐시, 재시도를 포함한 GeminiRequest를 백엔드 인터페이스로 제공
+"""
+from typing import Any, AsyncIterator, Dict, Optional
+from backend.analyzer.backends.base import LLMBackend
+from backend.analyzer.gemini.client import create_client
+from backend.analyzer.gemini.request import create_request_handler
+
+
+class GeminiBackend(LLMBackend):
+    """Gemini API 백엔드"""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str = None):
+        """
+        백엔드 초기화
+
+        Args:
+            api_key: Gemini API 키 (없으면 설정에서 로드)
+        """
+        self.client = create_client(api_key)
+        self.request_handler = create_request_handler(self.client)
+
+    def is_configured(self) -> bool:
+        """API 설정 여부 확인"""
+        return self.client.is_configured()
+
+    def send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """요청 전송 (재시도 포함, 종료 사유/토큰 사용량 포함)"""
+        return self.request_handler.send_detailed(prompt, generation_config=generation_config, prefix=prefix)
+
+    async def async_send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """요청 전송 (asyncio, 재시도 포함)"""
+        return await self.request_handler.async_send_detailed(prompt, generation_config=generation_config, prefix=prefix)
+
+    def stream_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """스트리밍 요청 (첫 조각 전 실패만 재시도)"""
+        return self.request_handler.stream_async(prompt, generation_config=generation_config, prefix=prefix, meta=meta)
+
+    async def count_tokens_async(self, text: str) -> tuple[bool, int | str]:
+        """count_tokens API로 토큰 수 계산 (요청자 키, 속도 제한 적용)"""
+        return await self.request_handler.count_tokens_async(text)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """백엔드 정보 조회"""
+        return {"name": self.name, **self.client.get_model_info()}
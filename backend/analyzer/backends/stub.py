@@ -0,0 +1,213 @@
+"""
+로컬 스텁 LLM 백엔드
+네트워크/API 할당량 없이 /api/analyze와 캐시를 부하 테스트하기 위한 결정적 응답 생성기
+(응답 스키마를 만족하는 JSON, 설정 가능한 지연/지터/오류율)
+
+사용법:
+    LLM_BACKEND=stub
+    LLM_STUB_LATENCY_SECONDS=0.5
+    LLM_STUB_JITTER_SECONDS=0.2
+    LLM_STUB_ERROR_RATE=0.05
+    LLM_STUB_SEED=42
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union, get_args, get_origin
+from pydantic import BaseModel
+from config.settings import settings
+from config.api_config import gemini_config
+from backend.analyzer.backends.base import LLMBackend
+from backend.analyzer.prompt.optimizer import token_optimizer
+from backend.utils.logger import logger
+from backend.utils.metrics import metrics
+
+# 스트리밍 응답 조각 크기 (문자)
+STREAM_CHUNK_CHARS = 256
+
+
+def sample_from_model(model: type) -> Dict[str, Any]:
+    """
+    Pydantic 모델을 만족하는 샘플 dict 생성 (필드 설명을 값으로 사용)
+
+    Args:
+        model: 응답 스키마 (BaseModel 하위 클래스)
+
+    Returns:
+        model_validate를 통과하는 dict
+    """
+    return {name: _sample_value(field.annotation, field.description) for name, field in model.model_fields.items()}
+
+
+def _sample_value(annotation: Any, description: Optional[str]) -> Any:
+    """타입 주석에 맞는 샘플 값"""
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item,) = get_args(annotation) or (str,)
+        return [_sample_value(item, description) for _ in range(2)]
+    if origin is Union:
+        options = [option for option in get_args(annotation) if option is not type(None)]
+        return _sample_value(options[0], description)
+    if origin is Literal:
+        return get_args(annotation)[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return sample_from_model(annotation)
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if annotation is bool:
+            return True
+        if annotation is int:
+            return 1
+        if annotation is float:
+            return 1.0
+    return f"스텁 {description or '값'}"[:80]
+
+
+class StubBackend(LLMBackend):
+    """결정적 응답 + 모의 지연/장애를 제공하는 로컬 백엔드"""
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency: float = None,
+        jitter: float = None,
+        error_rate: float = None,
+        seed: int = None,
+        response_text: str = None,
+        max_output_tokens: int = None
+    ):
+        """
+        스텁 백엔드 초기화
+
+        Args:
+            latency: 호출당 평균 응답 지연 (초)
+            jitter: 지연 변동폭 (초, latency ± jitter 범위에서 균등 분포)
+            error_rate: 호출 실패 비율 (0.0 ~ 1.0)
+            seed: 지연/실패 난수 시드 (같은 시드면 같은 순서로 재현, 없으면 매번 다름)
+            response_text: 고정 응답 텍스트 (없으면 JSON 모드는 스키마 샘플, 그 외는 입력 요약)
+            max_output_tokens: 출력 토큰 한도 (넘으면 잘라서 MAX_TOKENS로 종료)
+        """
+        self.latency = settings.LLM_STUB_LATENCY_SECONDS if latency is None else latency
+        self.jitter = settings.LLM_STUB_JITTER_SECONDS if jitter is None else jitter
+        self.error_rate = settings.LLM_STUB_ERROR_RATE if error_rate is None else error_rate
+        self.response_text = response_text
+        self.max_output_tokens = max_output_tokens or gemini_config.MAX_OUTPUT_TOKENS
+        self._random = random.Random(settings.LLM_STUB_SEED if seed is None else seed)
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "errors": 0, "truncated": 0, "input_tokens": 0, "output_tokens": 0}
+
+    def _draw(self) -> tuple[float, bool]:
+        """이번 호출의 지연 시간과 실패 여부 (난수열 순서를 보장하기 위해 잠금 안에서 추출)"""
+        with self._lock:
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            failed = self._random.random() < self.error_rate
+            self._stats["calls"] += 1
+            if failed:
+                self._stats["errors"] += 1
+        metrics.inc("llm_requests_total", backend=self.name, outcome="error" if failed else "success")
+        return delay, failed
+
+    def _respond(
+        self, prompt: str, generation_config: Optional[Dict], prefix: Optional[str]
+    ) -> tuple[str, Dict[str, Any]]:
+        """응답 텍스트와 메타데이터 생성 (입력이 같으면 항상 같은 응답)"""
+        input_tokens = token_optimizer.estimate_tokens(f"{prefix or ''}{prompt}")
+        config = generation_config or {}
+
+        if self.response_text is not None:
+            text = self.response_text
+        elif config.get("response_mime_type") == "application/json":
+            schema = config.get("response_schema")
+            if isinstance(schema, type) and issubclass(schema, BaseModel):
+                text = json.dumps(sample_from_model(schema), ensure_ascii=False)
+            else:
+                text = json.dumps({"content": f"스텁 응답 (입력 {input_tokens} 토큰)"}, ensure_ascii=False)
+        else:
+            text = f"스텁 응답 (입력 {input_tokens} 토큰)"
+
+        finish_reason = "STOP"
+        output_tokens = token_optimizer.estimate_tokens(text)
+        if output_tokens > self.max_output_tokens:
+            text = text[:len(text) * self.max_output_tokens // output_tokens]
+            output_tokens = self.max_output_tokens
+            finish_reason = "MAX_TOKENS"
+
+        with self._lock:
+            self._stats["input_tokens"] += input_tokens
+            self._stats["output_tokens"] += output_tokens
+            if finish_reason == "MAX_TOKENS":
+                self._stats["truncated"] += 1
+
+        usage = {"prompt_tokens": input_tokens, "cached_tokens": 0, "output_tokens": output_tokens}
+        for kind in ("prompt", "output", "cached"):
+            metrics.inc("llm_tokens_total", usage[f"{kind}_tokens"], backend=self.name, kind=kind)
+        return text, {"finish_reason": finish_reason, "usage": usage}
+
+    def send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """요청 전송 (모의 지연 후 응답 또는 모의 장애)"""
+        delay, failed = self._draw()
+        with metrics.span("llm.call"):
+            time.sleep(delay)
+        if failed:
+            logger.warning("스텁 백엔드 모의 장애 응답")
+            return False, "스텁 백엔드 모의 장애입니다. 잠시 후 다시 시도해주세요.", {}
+        text, meta = self._respond(prompt, generation_config, prefix)
+        return True, text, meta
+
+    async def async_send_detailed(
+        self, prompt: str, generation_config: Optional[Dict] = None, prefix: Optional[str] = None
+    ) -> tuple[bool, str, Dict[str, Any]]:
+        """요청 전송 (asyncio, 이벤트 루프를 블로킹하지 않는 모의 지연)"""
+        delay, failed = self._draw()
+        with metrics.span("llm.call"):
+            await asyncio.sleep(delay)
+        if failed:
+            logger.warning("스텁 백엔드 모의 장애 응답")
+            return False, "스텁 백엔드 모의 장애입니다. 잠시 후 다시 시도해주세요.", {}
+        text, meta = self._respond(prompt, generation_config, prefix)
+        return True, text, meta
+
+    async def stream_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """스트리밍 요청 (모의 지연을 조각 사이에 나누어 적용)"""
+        delay, failed = self._draw()
+        if failed:
+            await asyncio.sleep(delay)
+            raise RuntimeError("스텁 백엔드 모의 장애입니다. 잠시 후 다시 시도해주세요.")
+
+        text, response_meta = self._respond(prompt, generation_config, prefix)
+        pieces = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)] or [""]
+        for piece in pieces:
+            await asyncio.sleep(delay / len(pieces))
+            yield piece
+        metrics.record("llm.call", delay)
+
+        if meta is not None:
+            meta.update(response_meta)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스텁 호출 통계 조회"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "latency": self.latency,
+                "jitter": self.jitter,
+                "error_rate": self.error_rate,
+                **self._stats,
+            }
+
+
+# 전역 인스턴스 (분석기마다 새로 만들지 않고 공유하여 난수열과 호출 통계를 유지)
+stub_backend = StubBackend()
@@ -2,11 +2,11 @@
 Gemini API 클라이언트
 API 초기화 및 연결 관리
 """
-import google.generativeai as genai
 from config.settings import settings
 from config.api_config import gemini_config
 from backend.utils.logger import logger
 from backend.utils.error_handler import error_handler
+from backend.analyzer.gemini.client_pool import gemini_client_pool
 
 
 class GeminiClient:
@@ -24,26 +24,18 @@ class GeminiClient:
         self._configure()
     
     def _configure(self):
-        """API 설정"""
+        """API 설정 (키별 클라이언트 풀에서 재사용, 전역 genai 설정은 변경하지 않음)"""
         try:
-            genai.configure(api_key=self.api_key)
+            if not self.api_key:
+                raise ValueError("API key is empty")
             
-            self.model = genai.GenerativeModel(
-                model_name=gemini_config.MODEL_NAME,
-                generation_config={
-                    "temperature": gemini_config.TEMPERATURE,
-                    "top_p": gemini_config.TOP_P,
-                    "top_k": gemini_config.TOP_K,
-                    "max_output_tokens": gemini_config.MAX_OUTPUT_TOKENS,
-                },
-                safety_settings=gemini_config.SAFETY_SETTINGS
-            )
+            self.model = gemini_client_pool.get_model(self.api_key)
             
             logger.info(f"Gemini API 초기화 완료: {gemini_config.MODEL_NAME}")
             
         except Exception as e:
             logger.error(f"Gemini API 초기화 실패: {str(e)}")
-            if "API key not valid" in str(e) or "400" in str(e):
+            if "API key" in str(e) or "400" in str(e):
                 raise ValueError("유효하지 않은 API Key입니다. 키를 다시 확인해주세요.")
             raise
     
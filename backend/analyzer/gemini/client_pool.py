@@ -0,0 +1,275 @@
+"""
+Gemini 클라이언트 풀
+API 키별 모델/전송 연결을 재사용하고, 전역 genai.configure 상태를 사용하지 않음
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any
+import grpc
+import google.ai.generativelanguage as glm
+import google.generativeai as genai
+from google.ai.generativelanguage_v1beta.services.cache_service.transports import CacheServiceGrpcTransport
+from google.ai.generativelanguage_v1beta.services.generative_service.transports import (
+    GenerativeServiceGrpcTransport,
+    GenerativeServiceGrpcAsyncIOTransport,
+)
+from google.api_core import gapic_v1
+from config.settings import settings
+from config.api_config import gemini_config
+from backend.utils.logger import logger
+
+
+class PooledClient:
+    """API 키 1개에 대한 전송 연결 및 모델 보관"""
+
+    def __init__(self, api_key: str):
+        """
+        키별 클라이언트 초기화 (전송 연결은 첫 사용 시 생성)
+
+        Args:
+            api_key: Gemini API 키
+        """
+        self._client_options = {"api_key": api_key}
+        if settings.GEMINI_API_ENDPOINT:
+            self._client_options["api_endpoint"] = settings.GEMINI_API_ENDPOINT
+        self._client_info = gapic_v1.client_info.ClientInfo(user_agent=f"narastore genai-py/{genai.__version__}")
+        self._client = None
+        self._cache_client = None
+        # grpc.aio 채널은 생성된 이벤트 루프에서만 사용할 수 있으므로 루프별로 보관
+        # (채널이 루프를 강하게 참조하므로 약한 참조로는 해제되지 않음, 닫힌 루프의 항목은 조회 시 정리)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.model = self._create_model()
+
+    def _create_model(self, cached_content: str = None) -> "PooledGenerativeModel":
+        """기본 생성 설정의 모델 생성 (cached_content가 있으면 해당 캐시를 컨텍스트로 사용)"""
+        model = PooledGenerativeModel(
+            self,
+            model_name=gemini_config.MODEL_NAME,
+            generation_config={
+                "temperature": gemini_config.TEMPERATURE,
+                "top_p": gemini_config.TOP_P,
+                "top_k": gemini_config.TOP_K,
+                "max_output_tokens": gemini_config.MAX_OUTPUT_TOKENS,
+            },
+            safety_settings=gemini_config.SAFETY_SETTINGS
+        )
+        # GenerativeModel.from_cached_content는 캐시 조회를 전역 클라이언트로 하므로 사용하지 않고 직접 지정
+        if cached_content:
+            model._cached_content = cached_content
+        return model
+
+    def cached_model(self, cached_content: str) -> "PooledGenerativeModel":
+        """
+        서버 측 캐시를 컨텍스트로 사용하는 모델 생성 (전송 연결은 공유)
+
+        Args:
+            cached_content: 캐시 리소스 이름 (cachedContents/...)
+        """
+        return self._create_model(cached_content)
+
+    def _create_client(self, client_cls, transport_cls):
+        """
+        서비스 클라이언트 생성
+        GEMINI_API_INSECURE이면 TLS 없이 GEMINI_API_ENDPOINT에 직접 연결 (로컬 스텁 서버용)
+        """
+        if settings.GEMINI_API_INSECURE and settings.GEMINI_API_ENDPOINT:
+            endpoint = settings.GEMINI_API_ENDPOINT
+            if transport_cls is GenerativeServiceGrpcAsyncIOTransport:
+                channel = grpc.aio.insecure_channel(endpoint)
+            else:
+                channel = grpc.insecure_channel(endpoint)
+            return client_cls(transport=transport_cls(host=endpoint, channel=channel), client_info=self._client_info)
+        return client_cls(client_options=self._client_options, client_info=self._client_info)
+
+    @property
+    def client(self) -> glm.GenerativeServiceClient:
+        """동기 클라이언트 (지연 생성)"""
+        with self._lock:
+            if self._client is None:
+                self._client = self._create_client(glm.GenerativeServiceClient, GenerativeServiceGrpcTransport)
+            return self._client
+
+    @property
+    def cache_client(self) -> glm.CacheServiceClient:
+        """컨텍스트 캐시 관리 클라이언트 (지연 생성)"""
+        with self._lock:
+            if self._cache_client is None:
+                self._cache_client = self._create_client(glm.CacheServiceClient, CacheServiceGrpcTransport)
+            return self._cache_client
+
+    @property
+    def async_client(self) -> glm.GenerativeServiceAsyncClient:
+        """현재 이벤트 루프용 비동기 클라이언트 (루프별 지연 생성)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for other in [other for other in self._async_clients if other.is_closed()]:
+                del self._async_clients[other]
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._create_client(glm.GenerativeServiceAsyncClient, GenerativeServiceGrpcAsyncIOTransport)
+                self._async_clients[loop] = client
+            return client
+
+    def close(self):
+        """
+        동기/비동기 전송 연결 종료
+        grpc.aio 채널 종료는 코루틴이므로 채널이 속한 이벤트 루프에 예약 (이미 닫힌 루프의 채널은 함께 정리됨)
+        """
+        with self._lock:
+            clients = [self._client, self._cache_client]
+            async_clients = list(self._async_clients.items())
+            self._client = self._cache_client = None
+            self._async_clients.clear()
+        for client in clients:
+            if client is None:
+                continue
+            try:
+                client.transport.close()
+            except Exception as e:
+                logger.warning(f"Gemini 클라이언트 종료 실패: {str(e)}")
+        for loop, client in async_clients:
+            if loop.is_closed():
+                continue
+            try:
+                asyncio.run_coroutine_threadsafe(client.transport.close(), loop)
+            except Exception as e:
+                logger.warning(f"Gemini 비동기 클라이언트 종료 실패: {str(e)}")
+
+
+class PooledGenerativeModel(genai.GenerativeModel):
+    """풀의 키별 전송 연결을 사용하는 GenerativeModel (전역 기본 클라이언트 미사용)"""
+
+    def __init__(self, pooled: PooledClient, **kwargs):
+        self._pooled = pooled
+        super().__init__(**kwargs)
+
+    @property
+    def _client(self):
+        return self._pooled.client
+
+    @_client.setter
+    def _client(self, value):
+        # GenerativeModel.__init__의 None 초기화 무시
+        pass
+
+    @property
+    def _async_client(self):
+        return self._pooled.async_client
+
+    @_async_client.setter
+    def _async_client(self, value):
+        pass
+
+
+class GeminiClientPool:
+    """API 키(해시)별 클라이언트 레지스트리 (유휴 시간 만료 + 최대 개수 제한)"""
+
+    def __init__(self, max_clients: int = None, idle_seconds: int = None):
+        """
+        풀 초기화
+
+        Args:
+            max_clients: 동시에 유지할 최대 클라이언트 수 (초과 시 가장 오래 사용하지 않은 키부터 정리)
+            idle_seconds: 이 시간 동안 사용하지 않은 클라이언트 정리 (초)
+        """
+        self.max_clients = max_clients or settings.GEMINI_CLIENT_POOL_MAX
+        self.idle_seconds = idle_seconds or settings.GEMINI_CLIENT_IDLE_SECONDS
+        self._clients: "OrderedDict[str, PooledClient]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(api_key: str) -> str:
+        """API 키 해시 (원문 키를 레지스트리 키로 쓰지 않음)"""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def acquire(self, api_key: str) -> PooledClient:
+        """
+        API 키에 해당하는 클라이언트 조회 (없으면 생성)
+
+        Args:
+            api_key: Gemini API 키
+
+        Returns:
+            재사용 가능한 PooledClient
+        """
+        key = self._key(api_key)
+        evicted = []
+
+        with self._lock:
+            now = time.monotonic()
+            pooled = self._clients.get(key)
+
+            if pooled is not None:
+                self._clients.move_to_end(key)
+                self._stats["hits"] += 1
+            else:
+                pooled = PooledClient(api_key)
+                self._clients[key] = pooled
+                self._stats["misses"] += 1
+                logger.info(f"Gemini 클라이언트 생성: {key[:8]}... (활성 {len(self._clients)}개)")
+
+            pooled.last_used = now
+
+            # 유휴 클라이언트 및 최대 개수 초과분 정리 (오래 사용하지 않은 순)
+            for other_key, other in list(self._clients.items()):
+                over_capacity = len(self._clients) > self.max_clients
+                if other_key == key or (not over_capacity and now - other.last_used < self.idle_seconds):
+                    continue
+                del self._clients[other_key]
+                evicted.append(other)
+
+            self._stats["evictions"] += len(evicted)
+
+        if evicted:
+            logger.info(f"Gemini 클라이언트 정리: {len(evicted)}개")
+            for other in evicted:
+                self._close_later(other)
+
+        return pooled
+
+    @staticmethod
+    def _close_later(pooled: PooledClient):
+        """
+        정리된 클라이언트의 전송 연결 종료
+        진행 중인 요청이 있을 수 있으므로 마지막 사용 후 요청 타임아웃이 지난 뒤에 닫음
+        (닫힌 뒤 남은 참조로 호출되면 전송 연결이 다시 생성됨)
+        """
+        delay = pooled.last_used + gemini_config.TIMEOUT - time.monotonic()
+        if delay <= 0:
+            pooled.close()
+            return
+        timer = threading.Timer(delay, pooled.close)
+        timer.daemon = True
+        timer.start()
+
+    def get_model(self, api_key: str) -> PooledGenerativeModel:
+        """API 키에 해당하는 모델 조회"""
+        return self.acquire(api_key).model
+
+    def clear(self):
+        """모든 클라이언트 종료"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for pooled in clients:
+            pooled.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계 조회"""
+        with self._lock:
+            return {
+                "live": len(self._clients),
+                "max_clients": self.max_clients,
+                "idle_seconds": self.idle_seconds,
+                **self._stats,
+            }
+
+
+# 전역 인스턴스
+gemini_client_pool = GeminiClientPool()
@@ -0,0 +1,276 @@
+"""
+Gemini 컨텍스트 캐시
+매 호출마다 동일한 고정 프롬프트 앞부분(분석 지침)을 서버 측 CachedContent로 만들어 재사용
+캐시를 만들 수 없으면(비활성, 최소 토큰 미달, 미지원 모델 등) 호출자는 전체 프롬프트를 그대로 전송
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import google.ai.generativelanguage as glm
+from google.protobuf import duration_pb2
+from config.settings import settings
+from config.api_config import gemini_config
+from backend.analyzer.gemini.client_pool import gemini_client_pool, PooledClient, PooledGenerativeModel
+from backend.analyzer.prompt.optimizer import token_optimizer
+from backend.utils.logger import logger
+
+
+class _CacheEntry:
+    """캐시 1건 (생성된 리소스 또는 생성 실패 기록)"""
+
+    def __init__(self, expires_at: float, name: str = None, pooled: PooledClient = None):
+        self.expires_at = expires_at
+        self.name = name
+        # 캐시를 만든 키의 클라이언트 (삭제 시 사용) 및 캐시를 컨텍스트로 사용하는 모델
+        self.pooled = pooled
+        self.model = pooled.cached_model(name) if pooled is not None else None
+
+
+class ContextCacheRegistry:
+    """API 키 + 모델 + 프롬프트 앞부분별 CachedContent 레지스트리"""
+
+    # 만료 직전 캐시는 호출 도중 사라질 수 있으므로 미리 새로 생성 (초)
+    REFRESH_MARGIN_SECONDS = 60
+    # 생성 실패 시 같은 조합으로 다시 시도하기까지 대기 (초)
+    FAILURE_COOLDOWN_SECONDS = 600
+    # 보관할 앞부분 토큰 추정치 수 (속도 제한용, 호출/재시도마다 문서 전체를 다시 추정하지 않도록)
+    PREFIX_TOKENS_CACHE_SIZE = 256
+
+    def __init__(self, enabled: bool = None, ttl_seconds: int = None, min_tokens: int = None):
+        """
+        레지스트리 초기화
+
+        Args:
+            enabled: 컨텍스트 캐시 사용 여부
+            ttl_seconds: 서버 측 캐시 유효 시간 (초)
+            min_tokens: 캐시를 만들 최소 토큰 수 (모델별 하한 미만이면 생성 요청 자체를 생략)
+        """
+        self.enabled = settings.GEMINI_CONTEXT_CACHE_ENABLED if enabled is None else enabled
+        self.ttl_seconds = ttl_seconds or settings.GEMINI_CONTEXT_CACHE_TTL_SECONDS
+        self.min_tokens = settings.GEMINI_CONTEXT_CACHE_MIN_TOKENS if min_tokens is None else min_tokens
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        # 같은 조합의 캐시를 동시에 여러 개 만들지 않도록 키별 생성 잠금 (생성이 끝나면 제거)
+        self._create_locks: Dict[str, threading.Lock] = {}
+        # 앞부분 해시 -> 토큰 추정치 (캐시 사용 여부와 무관하게 유지, 추정치는 키/모델과 무관)
+        self._prefix_tokens: "OrderedDict[str, int]" = OrderedDict()
+        self._stats = {"hits": 0, "created": 0, "failures": 0, "invalidated": 0, "replaced": 0, "skipped": 0}
+
+    @staticmethod
+    def _key(api_key: str, prefix: str) -> str:
+        """레지스트리 키 (원문 API 키/프롬프트를 보관하지 않음)"""
+        digest = hashlib.sha256()
+        for part in (api_key, gemini_config.MODEL_NAME, prefix):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def prefix_tokens(self, prefix: str) -> int:
+        """
+        프롬프트 앞부분의 입력 토큰 추정치 (같은 앞부분은 1회만 추정)
+
+        Args:
+            prefix: 매 호출 동일한 프롬프트 앞부분
+
+        Returns:
+            추정 토큰 수 (앞부분이 없으면 0)
+        """
+        if not prefix:
+            return 0
+
+        digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+        with self._lock:
+            tokens = self._prefix_tokens.get(digest)
+            if tokens is not None:
+                self._prefix_tokens.move_to_end(digest)
+                return tokens
+
+        tokens = token_optimizer.estimate_tokens(prefix)
+        with self._lock:
+            self._prefix_tokens[digest] = tokens
+            while len(self._prefix_tokens) > self.PREFIX_TOKENS_CACHE_SIZE:
+                self._prefix_tokens.popitem(last=False)
+        return tokens
+
+    def _lookup(self, key: str) -> tuple[bool, Optional[PooledGenerativeModel]]:
+        """
+        유효한 항목 조회 (항목 존재 여부, 캐시 모델 - 실패 기록이면 None)
+        만료 임박 항목은 새 캐시로 교체할 때 서버 측 삭제까지 하도록 남겨둠
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            margin = self.REFRESH_MARGIN_SECONDS if entry.name else 0
+            if time.monotonic() >= entry.expires_at - margin:
+                return False, None
+            if entry.model is not None:
+                self._stats["hits"] += 1
+            return True, entry.model
+
+    def get_model(self, api_key: str, prefix: str) -> Optional[PooledGenerativeModel]:
+        """
+        프롬프트 앞부분을 캐시한 모델 조회 (없으면 생성)
+
+        Args:
+            api_key: Gemini API 키
+            prefix: 매 호출 동일한 프롬프트 앞부분
+
+        Returns:
+            캐시를 컨텍스트로 사용하는 모델, 사용할 수 없으면 None (전체 프롬프트 전송)
+        """
+        if not self.enabled or not prefix:
+            return None
+
+        key = self._key(api_key, prefix)
+        found, model = self._lookup(key)
+        if found:
+            return model
+
+        with self._lock:
+            create_lock = self._create_locks.setdefault(key, threading.Lock())
+
+        try:
+            with create_lock:
+                # 다른 스레드가 먼저 만들었을 수 있으므로 재확인
+                found, model = self._lookup(key)
+                if found:
+                    return model
+                return self._create(key, api_key, prefix)
+        finally:
+            # 결과(캐시 또는 실패 기록)가 항목으로 남으므로 잠금은 더 필요 없음
+            with self._lock:
+                if self._create_locks.get(key) is create_lock:
+                    del self._create_locks[key]
+
+    async def get_model_async(self, api_key: str, prefix: str) -> Optional[PooledGenerativeModel]:
+        """get_model의 asyncio 버전 (생성 호출은 스레드에서 수행하여 이벤트 루프를 블로킹하지 않음)"""
+        if not self.enabled or not prefix:
+            return None
+
+        found, model = self._lookup(self._key(api_key, prefix))
+        if found:
+            return model
+        return await asyncio.to_thread(self.get_model, api_key, prefix)
+
+    def _create(self, key: str, api_key: str, prefix: str) -> Optional[PooledGenerativeModel]:
+        """서버 측 캐시 생성 (실패하면 일정 시간 동안 같은 조합의 생성을 건너뜀)"""
+        now = time.monotonic()
+
+        if token_optimizer.estimate_tokens(prefix) < self.min_tokens:
+            with self._lock:
+                self._stats["skipped"] += 1
+                # 프롬프트가 바뀌지 않는 한 결과도 같으므로 TTL 동안 다시 판단하지 않음
+                replaced = self._replace(key, _CacheEntry(now + self.ttl_seconds), now)
+            self._delete_remote(replaced)
+            logger.info(f"컨텍스트 캐시 생략: 최소 토큰 수({self.min_tokens}) 미만")
+            return None
+
+        pooled = gemini_client_pool.acquire(api_key)
+        try:
+            cached = pooled.cache_client.create_cached_content(
+                cached_content=glm.CachedContent(
+                    model=f"models/{gemini_config.MODEL_NAME}",
+                    display_name="narastore-analysis-prefix",
+                    contents=[glm.Content(role="user", parts=[glm.Part(text=prefix)])],
+                    ttl=duration_pb2.Duration(seconds=self.ttl_seconds),
+                ),
+                timeout=gemini_config.TIMEOUT,
+            )
+        except Exception as e:
+            logger.warning(f"컨텍스트 캐시 생성 실패, 전체 프롬프트로 전송: {str(e)}")
+            with self._lock:
+                self._stats["failures"] += 1
+                replaced = self._replace(key, _CacheEntry(now + self.FAILURE_COOLDOWN_SECONDS), now)
+            self._delete_remote(replaced)
+            return None
+
+        entry = _CacheEntry(now + self.ttl_seconds, cached.name, pooled)
+        with self._lock:
+            self._stats["created"] += 1
+            replaced = self._replace(key, entry, now)
+        self._delete_remote(replaced)
+        logger.info(f"컨텍스트 캐시 생성: {cached.name} (TTL {self.ttl_seconds}초)")
+        return entry.model
+
+    def _replace(self, key: str, entry: _CacheEntry, now: float) -> Optional[_CacheEntry]:
+        """
+        항목 저장 (잠금 보유 상태에서 호출)
+        다른 조합의 만료된 항목도 함께 정리 (서버에서 이미 만료되었으므로 삭제 요청 불필요)
+
+        Returns:
+            교체되어 서버 측 삭제가 필요한 기존 캐시 항목 (없으면 None)
+        """
+        for other_key in [other_key for other_key, other in self._entries.items() if other.expires_at <= now]:
+            del self._entries[other_key]
+        replaced = self._entries.get(key)
+        self._entries[key] = entry
+        if replaced is not None and replaced.name and replaced.name != entry.name:
+            self._stats["replaced"] += 1
+            return replaced
+        return None
+
+    @staticmethod
+    def _delete_remote(entry: Optional[_CacheEntry]):
+        """서버 측 캐시 삭제 (TTL 전에 저장 비용 중단, 실패는 무시 - 남은 TTL 후 서버에서 만료)"""
+        if entry is None or not entry.name:
+            return
+        try:
+            entry.pooled.cache_client.delete_cached_content(name=entry.name, timeout=10)
+        except Exception as e:
+            logger.warning(f"컨텍스트 캐시 삭제 실패 ({entry.name}): {str(e)}")
+
+    def invalidate(self, api_key: str, prefix: str):
+        """
+        캐시 항목 제거 (서버에서 만료/삭제된 캐시를 참조한 호출이 실패한 경우)
+
+        Args:
+            api_key: Gemini API 키
+            prefix: 프롬프트 앞부분
+        """
+        with self._lock:
+            if self._entries.pop(self._key(api_key, prefix), None) is not None:
+                self._stats["invalidated"] += 1
+
+    @staticmethod
+    def is_cache_error(error: Exception) -> bool:
+        """만료되었거나 찾을 수 없는 캐시를 참조해 실패한 에러인지 확인"""
+        message = str(error).lower()
+        return "cachedcontent" in message or "cached content" in message
+
+    def clear(self, delete_remote: bool = False):
+        """
+        레지스트리 비우기
+
+        Args:
+            delete_remote: 서버 측 캐시도 삭제 (TTL 전에 저장 비용 중단, 실패는 무시)
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._create_locks.clear()
+
+        if not delete_remote:
+            return
+
+        for entry in entries:
+            self._delete_remote(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self._lock:
+            live = sum(1 for entry in self._entries.values() if entry.name)
+            return {
+                "enabled": self.enabled,
+                "live": live,
+                "ttl_seconds": self.ttl_seconds,
+                "min_tokens": self.min_tokens,
+                **self._stats,
+            }
+
+
+# 전역 인스턴스
+context_cache = ContextCacheRegistry()
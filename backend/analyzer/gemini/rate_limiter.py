@@ -0,0 +1,381 @@
+"""
+Gemini 호출 속도 제한
+API 키별 토큰 버킷(RPM/TPM) + 동시 실행 수 제한, 대기열은 마감 시간까지 FIFO로 대기
+"""
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+class RateLimitTimeout(Exception):
+    """대기 마감 시간 초과"""
+
+
+class _Waiter:
+    """대기열 항목 (스레드는 Event, 코루틴은 Future로 깨움)"""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._loop = loop
+        self._event = threading.Event() if loop is None else None
+        self._future = loop.create_future() if loop is not None else None
+
+    def reset(self):
+        """다음 대기를 위해 신호 초기화 (소유 스레드/루프에서 호출)"""
+        if self._loop is None:
+            self._event.clear()
+        elif self._future.done():
+            self._future = self._loop.create_future()
+
+    def wake(self):
+        """대기 중인 스레드/코루틴 깨우기 (어느 스레드에서든 호출 가능)"""
+        if self._loop is None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._set_future)
+
+    def _set_future(self):
+        if not self._future.done():
+            self._future.set_result(None)
+
+    def wait(self, timeout: float):
+        self._event.wait(timeout)
+
+    async def wait_async(self, timeout: float):
+        await asyncio.wait({self._future}, timeout=timeout)
+
+
+class _KeyBudget:
+    """API 키 1개의 예산 상태"""
+
+    def __init__(self, rpm: int, tpm: int, max_in_flight: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_in_flight = max_in_flight
+        self.request_tokens = float(rpm)
+        self.token_tokens = float(tpm)
+        self.updated_at = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.queue: "deque[_Waiter]" = deque()
+        self.stats = {"acquired": 0, "timeouts": 0, "throttled": 0, "wait_seconds": 0.0}
+
+    def refill(self, now: float):
+        """경과 시간만큼 버킷 충전"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.request_tokens = min(self.rpm, self.request_tokens + elapsed * self.rpm / 60)
+            self.token_tokens = min(self.tpm, self.token_tokens + elapsed * self.tpm / 60)
+            self.updated_at = now
+
+    def try_acquire(self, tokens: int, now: float) -> Optional[float]:
+        """
+        예산 차감 시도
+
+        Returns:
+            0이면 획득 성공, 양수면 예산이 찰 때까지 대기할 시간(초), None이면 동시 실행 슬롯 반환 대기
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        if self.in_flight >= self.max_in_flight:
+            return None
+
+        self.refill(now)
+        # 버킷 용량보다 큰 요청은 가득 찼을 때 통과시킴 (영구 대기 방지)
+        tokens = min(tokens, self.tpm)
+
+        waits = []
+        if self.request_tokens < 1:
+            waits.append((1 - self.request_tokens) * 60 / self.rpm)
+        if self.token_tokens < tokens:
+            waits.append((tokens - self.token_tokens) * 60 / self.tpm)
+        if waits:
+            return max(waits)
+
+        self.request_tokens -= 1
+        self.token_tokens -= tokens
+        self.in_flight += 1
+        return 0.0
+
+    def is_idle(self, now: float) -> bool:
+        """사용 중이 아니고 버킷이 가득 찬 상태 (삭제 후 새로 만들어도 동일)"""
+        if self.in_flight or self.queue or now < self.blocked_until:
+            return False
+        self.refill(now)
+        return self.request_tokens >= self.rpm and self.token_tokens >= self.tpm
+
+    def wake_head(self):
+        """대기열 맨 앞 항목 깨우기"""
+        if self.queue:
+            self.queue[0].wake()
+
+
+class RateLimitLease:
+    """획득한 예산 (호출 종료 후 release)"""
+
+    def __init__(self, limiter: "RateLimiter", key: str, tokens: int):
+        self._limiter = limiter
+        self._key = key
+        self.tokens = tokens
+        self._released = False
+
+    def release(self, actual_tokens: Optional[int] = None):
+        """
+        동시 실행 슬롯 반환
+
+        Args:
+            actual_tokens: 실제 사용 토큰 수 (usage_metadata, 추정치와의 차이를 TPM 버킷에 반영)
+        """
+        if self._released:
+            return
+        self._released = True
+        self._limiter._release(self._key, self.tokens, actual_tokens)
+
+
+class RateLimiter:
+    """API 키별 Gemini 호출 예산 관리 클래스 (동기/비동기 호출 경로 공용)"""
+
+    # 유휴 키 예산 정리 주기 (초)
+    PRUNE_INTERVAL_SECONDS = 60
+
+    def __init__(self, rpm: int = None, tpm: int = None, max_in_flight: int = None, queue_timeout: float = None):
+        """
+        제한기 초기화
+
+        Args:
+            rpm: 키당 분당 요청 수
+            tpm: 키당 분당 토큰 수
+            max_in_flight: 키당 동시 실행 요청 수
+            queue_timeout: 기본 대기 마감 시간 (초)
+        """
+        self.rpm = rpm or settings.GEMINI_RPM_LIMIT
+        self.tpm = tpm or settings.GEMINI_TPM_LIMIT
+        self.max_in_flight = max_in_flight or settings.GEMINI_MAX_IN_FLIGHT
+        self.queue_timeout = queue_timeout or settings.GEMINI_QUEUE_TIMEOUT_SECONDS
+        self._budgets: Dict[str, _KeyBudget] = {}
+        self._lock = threading.Lock()
+        self._pruned_at = time.monotonic()
+
+    @staticmethod
+    def _key(api_key: str) -> str:
+        """API 키 해시"""
+        return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+    def _budget(self, key: str) -> _KeyBudget:
+        """키 예산 조회 (잠금 보유 상태에서 호출)"""
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = _KeyBudget(self.rpm, self.tpm, self.max_in_flight)
+            self._budgets[key] = budget
+        return budget
+
+    def _prune(self, now: float):
+        """
+        유휴 키 예산 정리 (잠금 보유 상태에서 호출, 주기마다 1회)
+        버킷이 가득 찬 유휴 예산만 제거하므로 다시 호출해도 제한 동작은 같음 (키별 통계만 초기화)
+        """
+        if now - self._pruned_at < self.PRUNE_INTERVAL_SECONDS:
+            return
+        self._pruned_at = now
+        for key in [key for key, budget in self._budgets.items() if budget.is_idle(now)]:
+            del self._budgets[key]
+
+    def _poll(self, key: str, waiter: _Waiter, tokens: int) -> tuple:
+        """대기열 맨 앞이면 예산 획득 시도 → (lease 또는 None, 대기 시간)"""
+        with self._lock:
+            budget = self._budget(key)
+            wait = None
+            if budget.queue[0] is waiter:
+                wait = budget.try_acquire(tokens, time.monotonic())
+                if wait == 0:
+                    budget.queue.popleft()
+                    budget.stats["acquired"] += 1
+                    budget.wake_head()
+                    return RateLimitLease(self, key, tokens), 0
+            waiter.reset()
+            return None, wait
+
+    def _abandon(self, key: str, waiter: _Waiter):
+        """마감 초과/취소된 대기 항목 제거"""
+        with self._lock:
+            budget = self._budget(key)
+            if waiter in budget.queue:
+                was_head = budget.queue[0] is waiter
+                budget.queue.remove(waiter)
+                if was_head:
+                    budget.wake_head()
+
+    def _enqueue(self, api_key: str, waiter: _Waiter) -> str:
+        key = self._key(api_key)
+        with self._lock:
+            self._prune(time.monotonic())
+            self._budget(key).queue.append(waiter)
+        return key
+
+    def _timed_out(self, key: str, started: float, tokens: int):
+        with self._lock:
+            self._budget(key).stats["timeouts"] += 1
+        logger.warning(f"Gemini 호출 대기 시간 초과: {key[:8]}... ({time.monotonic() - started:.1f}초, {tokens} 토큰)")
+        raise RateLimitTimeout("요청이 많아 대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.")
+
+    def _record_wait(self, key: str, started: float):
+        waited = time.monotonic() - started
+        if waited > 0.01:
+            with self._lock:
+                self._budget(key).stats["wait_seconds"] += waited
+
+    def acquire(self, api_key: str, tokens: int, timeout: float = None) -> RateLimitLease:
+        """
+        예산 획득 (스레드, 마감 시간까지 FIFO 대기)
+
+        Args:
+            api_key: Gemini API 키
+            tokens: 예상 입력 토큰 수
+            timeout: 대기 마감 시간 (초)
+
+        Raises:
+            RateLimitTimeout: 마감 시간 내 획득 실패
+        """
+        waiter = _Waiter()
+        key = self._enqueue(api_key, waiter)
+        started = time.monotonic()
+        deadline = started + (timeout or self.queue_timeout)
+
+        try:
+            while True:
+                lease, wait = self._poll(key, waiter, tokens)
+                if lease:
+                    self._record_wait(key, started)
+                    return lease
+
+                # 마감 전에 예산이 찰 수 없으면 기다리지 않고 바로 실패
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (wait is not None and wait > remaining):
+                    self._timed_out(key, started, tokens)
+                waiter.wait(remaining if wait is None else min(wait, remaining))
+        finally:
+            self._abandon(key, waiter)
+
+    async def acquire_async(self, api_key: str, tokens: int, timeout: float = None) -> RateLimitLease:
+        """
+        예산 획득 (asyncio, 이벤트 루프를 블로킹하지 않고 마감 시간까지 FIFO 대기)
+
+        Raises:
+            RateLimitTimeout: 마감 시간 내 획득 실패
+        """
+        waiter = _Waiter(asyncio.get_running_loop())
+        key = self._enqueue(api_key, waiter)
+        started = time.monotonic()
+        deadline = started + (timeout or self.queue_timeout)
+
+        try:
+            while True:
+                lease, wait = self._poll(key, waiter, tokens)
+                if lease:
+                    self._record_wait(key, started)
+                    return lease
+
+                # 마감 전에 예산이 찰 수 없으면 기다리지 않고 바로 실패
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (wait is not None and wait > remaining):
+                    self._timed_out(key, started, tokens)
+                await waiter.wait_async(remaining if wait is None else min(wait, remaining))
+        finally:
+            self._abandon(key, waiter)
+
+    def _release(self, key: str, tokens: int, actual_tokens: Optional[int]):
+        """동시 실행 슬롯 반환 및 실제 사용량 정산"""
+        with self._lock:
+            budget = self._budget(key)
+            budget.in_flight = max(budget.in_flight - 1, 0)
+            if actual_tokens is not None:
+                budget.refill(time.monotonic())
+                budget.token_tokens = min(budget.tpm, budget.token_tokens + tokens - actual_tokens)
+            budget.wake_head()
+
+    def report_throttled(self, api_key: str, retry_after: Optional[float] = None) -> float:
+        """
+        429(할당량 초과) 응답 보고 → 해당 키의 신규 호출을 retry_after 동안 보류
+
+        Args:
+            api_key: Gemini API 키
+            retry_after: 서버가 알려준 재시도 대기 시간 (초, 없으면 1분 버킷 기준 추정)
+
+        Returns:
+            적용한 대기 시간 (초)
+        """
+        delay = retry_after if retry_after and retry_after > 0 else 60 / self.rpm * 2
+        key = self._key(api_key)
+        with self._lock:
+            budget = self._budget(key)
+            budget.blocked_until = max(budget.blocked_until, time.monotonic() + delay)
+            budget.stats["throttled"] += 1
+        logger.warning(f"Gemini 할당량 초과 응답: {key[:8]}... ({delay:.1f}초 보류)")
+        return delay
+
+    @staticmethod
+    def parse_retry_after(error: Exception) -> Optional[float]:
+        """
+        429 에러에서 재시도 대기 시간 추출 (RetryInfo 상세 또는 메시지의 'retry in Ns')
+
+        Returns:
+            대기 시간 (초) 또는 None
+        """
+        for detail in getattr(error, "details", None) or []:
+            retry_delay = getattr(detail, "retry_delay", None)
+            if retry_delay is not None:
+                seconds = getattr(retry_delay, "seconds", 0) + getattr(retry_delay, "nanos", 0) / 1e9
+                if seconds > 0:
+                    return seconds
+
+        match = re.search(r'retry[^0-9]{0,20}(\d+(?:\.\d+)?)\s*s', str(error), re.IGNORECASE)
+        if match:
+            return float(match.group(1))
+        return None
+
+    @staticmethod
+    def is_throttled(error: Exception) -> bool:
+        """429 / 할당량 초과 에러 여부"""
+        message = str(error)
+        return (
+            getattr(error, "code", None) == 429
+            or "429" in message
+            or "RESOURCE_EXHAUSTED" in message
+            or "quota" in message.lower()
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """키별 현재 예산 사용 현황"""
+        now = time.monotonic()
+        with self._lock:
+            keys = {}
+            for key, budget in self._budgets.items():
+                budget.refill(now)
+                keys[key[:8]] = {
+                    "requests_available": round(budget.request_tokens, 2),
+                    "tokens_available": int(budget.token_tokens),
+                    "in_flight": budget.in_flight,
+                    "queued": len(budget.queue),
+                    "blocked_for": round(max(budget.blocked_until - now, 0), 2),
+                    **{name: round(value, 3) for name, value in budget.stats.items()},
+                }
+
+        return {
+            "limits": {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "max_in_flight": self.max_in_flight,
+                "queue_timeout": self.queue_timeout,
+            },
+            "keys": keys,
+        }
+
+
+# 전역 인스턴스
+rate_limiter = RateLimiter()
@@ -2,11 +2,17 @@
 Gemini API 요청 처리
 요청 포맷팅 및 전송
 """
+import asyncio
+import random
 import time
-from typing import Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from backend.analyzer.gemini.client import GeminiClient
+from backend.analyzer.gemini.context_cache import context_cache
+from backend.analyzer.gemini.rate_limiter import rate_limiter, RateLimitTimeout
+from backend.analyzer.prompt.optimizer import token_optimizer
 from backend.utils.logger import logger
 from backend.utils.error_handler import error_handler
+from backend.utils.metrics import metrics
 from config.api_config import gemini_config
 
 
@@ -22,53 +28,444 @@ class GeminiRequest:
         """
         self.client = client
     
-    def send(self, prompt: str, retry_count: int = 0, generation_config: Optional[Dict] = None) -> tuple[bool, str | Dict]:
+    def send(
+        self,
+        prompt: str,
+        retry_count: int = 0,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None
+    ) -> tuple[bool, str | Dict]:
         """
         API 요청 전송
         
         Args:
-            prompt: 전송할 프롬프트
+            prompt: 전송할 프롬프트 (prefix가 있으면 그 뒤에 이어지는 가변 부분)
             retry_count: 재시도 횟수
             generation_config: 생성 설정 (JSON 모드 등)
+            prefix: 매 호출 동일한 프롬프트 앞부분 (컨텍스트 캐시로 재사용, 불가하면 prompt 앞에 붙여 전송)
             
         Returns:
             (성공 여부, 응답 텍스트 또는 에러 메시지)
         """
+        success, result, _ = self.send_detailed(prompt, retry_count, generation_config, prefix)
+        return success, result
+    
+    def send_detailed(
+        self,
+        prompt: str,
+        retry_count: int = 0,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None,
+        estimated_tokens: Optional[int] = None
+    ) -> tuple[bool, str | Dict, Dict[str, Any]]:
+        """
+        API 요청 전송 (종료 사유/토큰 사용량 포함)
+        
+        Args:
+            prompt: 전송할 프롬프트 (prefix가 있으면 그 뒤에 이어지는 가변 부분)
+            retry_count: 재시도 횟수
+            generation_config: 생성 설정 (JSON 모드 등)
+            prefix: 매 호출 동일한 프롬프트 앞부분 (컨텍스트 캐시로 재사용, 불가하면 prompt 앞에 붙여 전송)
+            estimated_tokens: 속도 제한용 입력 토큰 추정치 (재시도 시 이전 시도의 값을 재사용)
+            
+        Returns:
+            (성공 여부, 응답 텍스트 또는 에러 메시지, 메타데이터 {"finish_reason", "usage"} - 실패 시 빈 dict)
+        """
+        if estimated_tokens is None:
+            estimated_tokens = self._estimate_tokens(prompt, prefix)
+        lease = None
+        actual_tokens = None
         try:
             logger.info(f"Gemini API 요청 전송 (시도: {retry_count + 1})")
             
             # 모델 확인
             if not self.client.is_configured():
-                return False, "Gemini API가 초기화되지 않았습니다."
+                return False, "Gemini API가 초기화되지 않았습니다.", {}
+            
+            # 키별 RPM/TPM/동시 실행 예산 획득 (마감 시간까지 대기)
+            lease = rate_limiter.acquire(self.client.api_key, estimated_tokens)
             
-            # 요청 전송
-            if generation_config:
-                response = self.client.model.generate_content(prompt, generation_config=generation_config)
-            else:
-                response = self.client.model.generate_content(prompt)
+            # 요청 전송 (고정 앞부분은 캐시된 컨텍스트로 대체)
+            model, contents = self._resolve_prefix(context_cache.get_model(self.client.api_key, prefix), prompt, prefix)
+            with metrics.span("llm.call"):
+                response = model.generate_content(contents, **self._request_kwargs(generation_config))
+            actual_tokens = self._usage_tokens(response)
             
             # 응답 확인
             if not response or not response.text:
-                return False, "API 응답이 비어있습니다."
+                return False, "API 응답이 비어있습니다.", {}
             
             logger.info("Gemini API 요청 성공")
-            return True, response.text
+            return True, response.text, self._record_success(self._response_meta(response))
+            
+        except RateLimitTimeout as e:
+            return False, str(e), {}
             
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Gemini API 요청 실패: {error_msg}")
+            metrics.inc("llm_requests_total", backend="gemini", outcome="error")
+            
+            # 재시도 전에 동시 실행 슬롯 반환
+            if lease:
+                lease.release()
+                lease = None
             
-            # API 키 관련 에러인지 확인
-            if "API key" in error_msg or "400" in error_msg:
-                 return False, f"API 키 오류 또는 잘못된 요청입니다. ({error_msg})"
+            # API 키 관련 에러인지 확인 (만료된 컨텍스트 캐시 참조는 재시도)
+            if ("API key" in error_msg or "400" in error_msg) and not (prefix and context_cache.is_cache_error(e)):
+                 return False, f"API 키 오류 또는 잘못된 요청입니다. ({error_msg})", {}
             
-            # 재시도 로직
+            # 재시도 로직 (만료된 컨텍스트 캐시는 즉시, 429는 제한기가 retry-after 동안 보류, 그 외는 지수 백오프)
             if retry_count < gemini_config.MAX_RETRIES:
-                logger.info(f"{gemini_config.RETRY_DELAY}초 후 재시도...")
-                time.sleep(gemini_config.RETRY_DELAY)
-                return self.send(prompt, retry_count + 1, generation_config)
+                if prefix and context_cache.is_cache_error(e):
+                    self._record_retry("cache")
+                    context_cache.invalidate(self.client.api_key, prefix)
+                elif rate_limiter.is_throttled(e):
+                    self._record_retry("throttled")
+                    rate_limiter.report_throttled(self.client.api_key, rate_limiter.parse_retry_after(e))
+                else:
+                    self._record_retry("error")
+                    delay = self._backoff_delay(retry_count)
+                    logger.info(f"{delay:.1f}초 후 재시도...")
+                    time.sleep(delay)
+                return self.send_detailed(prompt, retry_count + 1, generation_config, prefix, estimated_tokens)
             
-            return error_handler.handle_api_error(e)
+            return (*error_handler.handle_api_error(e), {})
+            
+        finally:
+            if lease:
+                lease.release(actual_tokens)
+    
+    async def async_send(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None
+    ) -> tuple[bool, str | Dict]:
+        """
+        API 요청 전송 (asyncio, 이벤트 루프를 블로킹하지 않음)
+        
+        Args:
+            prompt: 전송할 프롬프트 (prefix가 있으면 그 뒤에 이어지는 가변 부분)
+            generation_config: 생성 설정 (JSON 모드 등)
+            prefix: 매 호출 동일한 프롬프트 앞부분 (컨텍스트 캐시로 재사용)
+            
+        Returns:
+            (성공 여부, 응답 텍스트 또는 에러 메시지)
+        """
+        success, result, _ = await self.async_send_detailed(prompt, generation_config, prefix)
+        return success, result
+    
+    async def async_send_detailed(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None
+    ) -> tuple[bool, str | Dict, Dict[str, Any]]:
+        """
+        API 요청 전송 (asyncio, 종료 사유/토큰 사용량 포함)
+        
+        Returns:
+            (성공 여부, 응답 텍스트 또는 에러 메시지, 메타데이터 {"finish_reason", "usage"} - 실패 시 빈 dict)
+        """
+        # 속도 제한용 입력 토큰 추정은 요청당 1회, 이벤트 루프 밖에서 수행 (재시도 시 재사용)
+        estimated_tokens = await asyncio.to_thread(self._estimate_tokens, prompt, prefix)
+        
+        for attempt in range(gemini_config.MAX_RETRIES + 1):
+            lease = None
+            actual_tokens = None
+            try:
+                logger.info(f"Gemini API 비동기 요청 전송 (시도: {attempt + 1})")
+                
+                # 모델 확인
+                if not self.client.is_configured():
+                    return False, "Gemini API가 초기화되지 않았습니다.", {}
+                
+                # 키별 RPM/TPM/동시 실행 예산 획득 (마감 시간까지 대기)
+                lease = await rate_limiter.acquire_async(self.client.api_key, estimated_tokens)
+                
+                # 요청 전송 (고정 앞부분은 캐시된 컨텍스트로 대체, 호출 단위 타임아웃)
+                model, contents = self._resolve_prefix(
+                    await context_cache.get_model_async(self.client.api_key, prefix), prompt, prefix
+                )
+                try:
+                    with metrics.span("llm.call"):
+                        response = await asyncio.wait_for(
+                            model.generate_content_async(contents, **self._request_kwargs(generation_config)),
+                            timeout=gemini_config.TIMEOUT
+                        )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"Gemini API timeout ({gemini_config.TIMEOUT}초 초과)")
+                actual_tokens = self._usage_tokens(response)
+                
+                # 응답 확인
+                if not response or not response.text:
+                    return False, "API 응답이 비어있습니다.", {}
+                
+                logger.info("Gemini API 비동기 요청 성공")
+                return True, response.text, self._record_success(self._response_meta(response))
+                
+            except RateLimitTimeout as e:
+                return False, str(e), {}
+                
+            except Exception as e:
+                error_msg = str(e)
+                logger.error(f"Gemini API 비동기 요청 실패: {error_msg}")
+                metrics.inc("llm_requests_total", backend="gemini", outcome="error")
+                
+                # 만료된 컨텍스트 캐시 참조는 캐시를 비우고 즉시 재시도
+                cache_error = bool(prefix) and context_cache.is_cache_error(e)
+                
+                # API 키 관련 에러는 재시도하지 않음
+                if ("API key" in error_msg or "400" in error_msg) and not cache_error:
+                    return False, f"API 키 오류 또는 잘못된 요청입니다. ({error_msg})", {}
+                
+                if attempt >= gemini_config.MAX_RETRIES:
+                    return (*error_handler.handle_api_error(e), {})
+                
+                # 429는 제한기가 retry-after 동안 보류, 그 외는 지수 백오프
+                if cache_error:
+                    self._record_retry("cache")
+                    context_cache.invalidate(self.client.api_key, prefix)
+                elif rate_limiter.is_throttled(e):
+                    self._record_retry("throttled")
+                    rate_limiter.report_throttled(self.client.api_key, rate_limiter.parse_retry_after(e))
+                else:
+                    self._record_retry("error")
+                    delay = self._backoff_delay(attempt)
+                    logger.info(f"{delay:.1f}초 후 재시도...")
+                    await asyncio.sleep(delay)
+                
+            finally:
+                if lease:
+                    lease.release(actual_tokens)
+        
+        return False, "API 요청에 실패했습니다.", {}
+    
+    async def stream_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        prefix: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        API 스트리밍 요청 (응답 텍스트 조각을 도착 순서대로 반환)
+        첫 조각을 받기 전 실패만 재시도하며, 조각 사이 대기 시간이 TIMEOUT을 넘으면 중단
+        
+        Args:
+            prompt: 전송할 프롬프트 (prefix가 있으면 그 뒤에 이어지는 가변 부분)
+            generation_config: 생성 설정 (JSON 모드 등)
+            prefix: 매 호출 동일한 프롬프트 앞부분 (컨텍스트 캐시로 재사용)
+            meta: 전달하면 스트림 종료 시 종료 사유/토큰 사용량을 채움 ({"finish_reason", "usage"})
+        
+        Yields:
+            응답 텍스트 조각
+        
+        Raises:
+            RuntimeError: 요청 실패 (사용자에게 보여줄 에러 메시지 포함)
+        """
+        if not self.client.is_configured():
+            raise RuntimeError("Gemini API가 초기화되지 않았습니다.")
+        
+        # 속도 제한용 입력 토큰 추정은 요청당 1회, 이벤트 루프 밖에서 수행 (재시도 시 재사용)
+        estimated_tokens = await asyncio.to_thread(self._estimate_tokens, prompt, prefix)
+        
+        for attempt in range(gemini_config.MAX_RETRIES + 1):
+            received = False
+            lease = None
+            actual_tokens = None
+            stream_meta: Dict[str, Any] = {}
+            try:
+                logger.info(f"Gemini API 스트리밍 요청 전송 (시도: {attempt + 1})")
+                
+                # 키별 RPM/TPM/동시 실행 예산 획득 (마감 시간까지 대기)
+                lease = await rate_limiter.acquire_async(self.client.api_key, estimated_tokens)
+                
+                model, contents = self._resolve_prefix(
+                    await context_cache.get_model_async(self.client.api_key, prefix), prompt, prefix
+                )
+                started = time.perf_counter()
+                response = await asyncio.wait_for(
+                    model.generate_content_async(
+                        contents, stream=True, **self._request_kwargs(generation_config)
+                    ),
+                    timeout=gemini_config.TIMEOUT
+                )
+                
+                chunks = response.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=gemini_config.TIMEOUT)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(f"Gemini API timeout ({gemini_config.TIMEOUT}초 동안 응답 없음)")
+                    
+                    actual_tokens = self._usage_tokens(chunk) or actual_tokens
+                    # 종료 사유와 사용량은 마지막 조각에만 포함됨
+                    stream_meta.update({key: value for key, value in self._response_meta(chunk).items() if value})
+                    
+                    # 텍스트가 없는 조각 (종료 사유만 있는 마지막 조각 등)은 건너뜀
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        continue
+                    
+                    if text:
+                        received = True
+                        yield text
+                
+                logger.info("Gemini API 스트리밍 요청 완료")
+                metrics.record("llm.call", time.perf_counter() - started)
+                self._record_success(stream_meta)
+                if meta is not None:
+                    meta.update(stream_meta)
+                return
+                
+            except RateLimitTimeout as e:
+                raise RuntimeError(str(e)) from e
+                
+            except Exception as e:
+                error_msg = str(e)
+                logger.error(f"Gemini API 스트리밍 요청 실패: {error_msg}")
+                metrics.inc("llm_requests_total", backend="gemini", outcome="error")
+                
+                # 만료된 컨텍스트 캐시 참조는 캐시를 비우고 즉시 재시도
+                cache_error = bool(prefix) and context_cache.is_cache_error(e)
+                
+                # API 키 오류 또는 이미 일부를 전달한 경우 재시도하지 않음
+                if ("API key" in error_msg or "400" in error_msg) and not cache_error:
+                    raise RuntimeError(f"API 키 오류 또는 잘못된 요청입니다. ({error_msg})") from e
+                
+                if received or attempt >= gemini_config.MAX_RETRIES:
+                    _, message = error_handler.handle_api_error(e)
+                    raise RuntimeError(message) from e
+                
+                # 429는 제한기가 retry-after 동안 보류, 그 외는 지수 백오프
+                if cache_error:
+                    self._record_retry("cache")
+                    context_cache.invalidate(self.client.api_key, prefix)
+                elif rate_limiter.is_throttled(e):
+                    self._record_retry("throttled")
+                    rate_limiter.report_throttled(self.client.api_key, rate_limiter.parse_retry_after(e))
+                else:
+                    self._record_retry("error")
+                    delay = self._backoff_delay(attempt)
+                    logger.info(f"{delay:.1f}초 후 재시도...")
+                    await asyncio.sleep(delay)
+                
+            finally:
+                if lease:
+                    lease.release(actual_tokens)
+    
+    async def count_tokens_async(self, text: str) -> tuple[bool, int | str]:
+        """
+        count_tokens API로 토큰 수 계산 (키별 호출 예산을 거쳐 요청 수 제한에 포함)
+        
+        Args:
+            text: 텍스트 (문서 또는 프롬프트 전체)
+        
+        Returns:
+            (성공 여부, 토큰 수 또는 에러 메시지)
+        """
+        if not self.client.is_configured():
+            return False, "Gemini API가 초기화되지 않았습니다."
+        
+        lease = None
+        try:
+            lease = await rate_limiter.acquire_async(self.client.api_key, 0)
+            with metrics.span("llm.count_tokens"):
+                response = await asyncio.wait_for(
+                    self.client.model.count_tokens_async(text, request_options={"timeout": gemini_config.TIMEOUT}),
+                    timeout=gemini_config.TIMEOUT
+                )
+            return True, int(response.total_tokens)
+        except asyncio.TimeoutError:
+            return False, f"Gemini API timeout ({gemini_config.TIMEOUT}초 초과)"
+        except Exception as e:
+            return False, str(e)
+        finally:
+            if lease:
+                lease.release()
+    
+    @staticmethod
+    def _request_kwargs(generation_config: Optional[Dict] = None) -> Dict:
+        """generate_content 호출 인자 구성 (타임아웃 포함)"""
+        kwargs = {"request_options": {"timeout": gemini_config.TIMEOUT}}
+        if generation_config:
+            kwargs["generation_config"] = generation_config
+        return kwargs
+    
+    def _resolve_prefix(self, cached_model, prompt: str, prefix: Optional[str]) -> tuple:
+        """
+        호출할 모델과 전송할 내용 결정
+        
+        Returns:
+            (모델, 내용) - 캐시가 있으면 (캐시 모델, 가변 부분), 없으면 (기본 모델, 앞부분 + 가변 부분)
+        """
+        if cached_model is not None:
+            return cached_model, prompt
+        if prefix:
+            return self.client.model, f"{prefix}{prompt}"
+        return self.client.model, prompt
+    
+    @staticmethod
+    def _estimate_tokens(prompt: str, prefix: Optional[str]) -> int:
+        """속도 제한용 입력 토큰 추정 (캐시된 앞부분도 TPM에 포함됨, 앞부분 추정치는 컨텍스트 캐시 레지스트리에 보관)"""
+        return token_optimizer.estimate_tokens(prompt) + context_cache.prefix_tokens(prefix)
+    
+    @staticmethod
+    def _usage_tokens(response) -> Optional[int]:
+        """응답의 실제 입력 토큰 수 (usage_metadata, 없으면 None)"""
+        try:
+            return response.usage_metadata.prompt_token_count or None
+        except (AttributeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _response_meta(response) -> Dict[str, Any]:
+        """응답 메타데이터 (종료 사유 이름, 토큰 사용량 - 값이 없으면 None/빈 dict)"""
+        meta: Dict[str, Any] = {"finish_reason": None, "usage": {}}
+        try:
+            reason = response.candidates[0].finish_reason
+            if reason:
+                meta["finish_reason"] = reason.name
+        except (AttributeError, IndexError, ValueError):
+            pass
+        try:
+            usage = response.usage_metadata
+            if usage.total_token_count:
+                meta["usage"] = {
+                    "prompt_tokens": usage.prompt_token_count,
+                    "cached_tokens": usage.cached_content_token_count,
+                    "output_tokens": usage.candidates_token_count,
+                }
+        except (AttributeError, ValueError):
+            pass
+        if meta["finish_reason"] == "MAX_TOKENS":
+            logger.warning(f"출력 토큰 한도({gemini_config.MAX_OUTPUT_TOKENS})에 도달하여 응답이 잘렸습니다.")
+        return meta
+    
+    @staticmethod
+    def _record_success(meta: Dict[str, Any]) -> Dict[str, Any]:
+        """성공한 호출의 결과/토큰 사용량 지표 기록 (메타데이터를 그대로 반환)"""
+        metrics.inc("llm_requests_total", backend="gemini", outcome="success")
+        usage = meta.get("usage") or {}
+        for kind in ("prompt", "output", "cached"):
+            metrics.inc("llm_tokens_total", usage.get(f"{kind}_tokens") or 0, backend="gemini", kind=kind)
+        return meta
+    
+    @staticmethod
+    def _record_retry(reason: str):
+        """재시도 지표 기록 (cache: 만료된 컨텍스트 캐시, throttled: 429, error: 그 외)"""
+        metrics.inc("llm_retries_total", backend="gemini", reason=reason)
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """지수 백오프 + 지터 (초)"""
+        delay = min(gemini_config.RETRY_DELAY * (2 ** attempt), gemini_config.MAX_RETRY_DELAY)
+        return delay + random.uniform(0, gemini_config.RETRY_DELAY)
     
     def send_with_context(
         self, 
@@ -4,13 +4,29 @@ Gemini API 응답 처리
 """
 import json
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Type
+from pydantic import BaseModel, ValidationError
 from backend.utils.logger import logger
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def _loads(text: str) -> Any:
+    """JSON 파싱 (orjson 우선, 실패 시 ValueError 계열 예외)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class GeminiResponse:
     """Gemini API 응답 처리 클래스"""
     
+    # 잘린 JSON을 닫을 때 사용할 닫는 괄호
+    _CLOSERS = {"{": "}", "[": "]"}
+
     @staticmethod
     def parse_json(response_text: str) -> tuple[bool, Dict | str]:
         """
@@ -22,30 +38,180 @@ class GeminiResponse:
         Returns:
             (성공 여부, 파싱된 데이터 또는 에러 메시지)
         """
+        success, data, _ = GeminiResponse.decode(response_text)
+        if success:
+            logger.info("JSON 응답 파싱 성공")
+        return success, data
+
+    @staticmethod
+    def decode(
+        response_text: str, schema: Optional[Type[BaseModel]] = None
+    ) -> tuple[bool, Any, Dict[str, Any]]:
+        """
+        모델 JSON 응답 디코딩 (스키마 검증 + 잘린 응답 복구)
+        스키마가 있으면 dict를 거치지 않고 model_validate_json으로 바로 검증하고,
+        MAX_OUTPUT_TOKENS 등으로 응답이 중간에 끊긴 경우 마지막 완결 지점에서 열린 구조를 닫아 복구
+        
+        Args:
+            response_text: API 응답 텍스트
+            schema: 검증할 Pydantic 모델 (없으면 파싱만 수행)
+            
+        Returns:
+            (성공 여부, 파싱된 데이터 또는 에러 메시지, 디코딩 보고서)
+            보고서: {"valid": 스키마 검증 통과, "repaired": 잘린 응답 복구 여부,
+                    "salvaged": 복구된 최상위 필드, "missing": 누락된 스키마 필드,
+                    "truncated_field": 중간에 끊겨 일부만 남은 최상위 필드, "errors": 검증 실패 위치}
+        """
+        report: Dict[str, Any] = {
+            "valid": False, "repaired": False, "salvaged": [], "missing": [], "truncated_field": None, "errors": []
+        }
+        json_text = GeminiResponse._extract_json_text(response_text or "")
+        
+        # 1. 온전한 응답: 스키마로 바로 검증 (대부분의 경우)
+        data, syntax_error = GeminiResponse._decode_text(json_text, schema, report)
+        if not syntax_error:
+            return True, data, report
+        
+        # 2. 문법 오류: 중간에 끊긴 응답으로 보고 복구 시도
+        repaired = GeminiResponse._close_truncated(json_text)
+        if repaired is None:
+            logger.error(f"JSON 파싱 실패 ({syntax_error}). 원본 응답 앞부분:\n{json_text[:500]}")
+            return False, f"응답을 JSON으로 파싱할 수 없습니다: {syntax_error}", report
+        
+        repaired_text, depth = repaired
+        data, error = GeminiResponse._decode_text(repaired_text, schema, report)
+        if error:
+            logger.error(f"잘린 JSON 복구 실패: {error}")
+            return False, f"응답을 JSON으로 파싱할 수 없습니다: {error}", report
+        if depth == 0:
+            return True, data, report
+        if not data:
+            logger.error(f"잘린 JSON 응답에서 복구할 내용이 없습니다 ({len(json_text)}자)")
+            return False, "응답이 중간에 끊겨 복구할 수 있는 내용이 없습니다.", report
+        
+        report["repaired"] = True
+        if isinstance(data, dict):
+            report["salvaged"] = list(data)
+            # 끊긴 지점이 최상위 필드 내부이면 마지막 필드는 일부만 남은 상태
+            if depth > 1 and data:
+                report["truncated_field"] = report["salvaged"][-1]
+            if schema is not None:
+                report["missing"] = [name for name in schema.model_fields if name not in data]
+        logger.warning(
+            f"잘린 JSON 응답 복구 ({len(json_text)}자): 복구 필드 {report['salvaged']}, "
+            f"일부만 복구 {report['truncated_field']}, 누락 필드 {report['missing']}"
+        )
+        return True, data, report
+
+    @staticmethod
+    def _decode_text(
+        json_text: str, schema: Optional[Type[BaseModel]], report: Dict[str, Any]
+    ) -> tuple[Any, Optional[str]]:
+        """JSON 텍스트 디코딩 (데이터, 문법 오류 메시지 - 스키마 불일치는 검증 없이 그대로 반환)"""
+        if schema is not None:
+            try:
+                data = schema.model_validate_json(json_text).model_dump()
+                report["valid"] = True
+                report["errors"] = []
+                return data, None
+            except ValidationError as e:
+                errors = e.errors()
+                if any(error["type"] == "json_invalid" for error in errors):
+                    return None, errors[0]["msg"]
+                # 문법은 정상이나 스키마와 다름: 누락 필드 보완 단계에 맡기고 원본 그대로 사용
+                report["errors"] = [".".join(str(part) for part in error["loc"]) for error in errors[:10]]
+        
         try:
-            # JSON 코드 블록 추출 시도
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # 중괄호로 시작하는 JSON 찾기
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    json_str = response_text
+            return _loads(json_text), None
+        except ValueError as e:
+            return None, str(e)
+
+    @staticmethod
+    def _extract_json_text(response_text: str) -> str:
+        """응답에서 JSON 부분 추출 (코드 블록/앞뒤 설명문 제거, 정규식 없이 위치 탐색만 수행)"""
+        text = response_text.strip()
+        if text[:1] in ("{", "["):
+            return text
+        
+        fence = text.find("```")
+        if fence != -1:
+            start = text.find("\n", fence)
+            start = len(text) if start == -1 else start + 1
+            end = text.find("```", start)
+            return text[start:end if end != -1 else len(text)].strip()
+        
+        # 앞쪽 설명문만 제거 (뒤쪽 설명문은 복구 단계에서 최상위 값이 닫히는 위치로 잘라냄)
+        starts = [position for position in (text.find("{"), text.find("[")) if position != -1]
+        return text[min(starts):] if starts else text
+
+    @staticmethod
+    def _close_truncated(json_text: str) -> Optional[tuple[str, int]]:
+        """
+        잘린 JSON을 마지막 완결 지점에서 자르고 열린 객체/배열을 닫음
+        완결 지점: 컨테이너 시작 직후, 값 문자열/컨테이너 종료 직후, 쉼표 직전
+        (끝에서 끊긴 숫자/리터럴, 값 없는 키, 닫히지 않은 문자열은 버림)
+        최상위 값이 이미 닫혀 있으면 뒤에 붙은 설명문만 잘라냄
+        
+        Args:
+            json_text: 잘린 JSON 텍스트
             
-            # JSON 파싱
-            data = json.loads(json_str)
-            logger.info("JSON 응답 파싱 성공")
-            return True, data
+        Returns:
+            (복구된 JSON 텍스트, 자른 지점의 중첩 깊이 - 뒤쪽 설명문만 자른 경우 0) 또는 None (복구 불가)
+        """
+        stack: List[str] = []
+        expect_key = False
+        safe_end = -1
+        safe_stack: tuple = ()
+        length = len(json_text)
+        i = 0
+        
+        while i < length:
+            char = json_text[i]
+            if char == '"':
+                # 문자열은 따옴표 위치로 건너뜀 (이스케이프된 따옴표 제외)
+                end = i + 1
+                while True:
+                    end = json_text.find('"', end)
+                    if end == -1:
+                        break
+                    backslash = end - 1
+                    while json_text[backslash] == "\\":
+                        backslash -= 1
+                    if (end - 1 - backslash) % 2 == 0:
+                        break
+                    end += 1
+                if end == -1:
+                    break
+                is_key = expect_key and stack and stack[-1] == "{"
+                i = end + 1
+                if not is_key:
+                    safe_end, safe_stack = i, tuple(stack)
+                continue
             
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {str(e)}")
-            return False, f"응답을 JSON으로 파싱할 수 없습니다: {str(e)}"
-        except Exception as e:
-            logger.error(f"응답 처리 실패: {str(e)}")
-            return False, f"응답 처리 중 오류 발생: {str(e)}"
+            if char in "{[":
+                stack.append(char)
+                expect_key = char == "{"
+                safe_end, safe_stack = i + 1, tuple(stack)
+            elif char in "}]":
+                if not stack or GeminiResponse._CLOSERS[stack[-1]] != char:
+                    return None
+                stack.pop()
+                safe_end, safe_stack = i + 1, tuple(stack)
+                if not stack:
+                    # 최상위 값이 이미 닫힘 (잘린 응답이 아니라 뒤에 다른 내용이 붙은 경우)
+                    return json_text[:i + 1], 0
+            elif char == ",":
+                safe_end, safe_stack = i, tuple(stack)
+                expect_key = bool(stack) and stack[-1] == "{"
+            elif char == ":":
+                expect_key = False
+            i += 1
+        
+        if safe_end == -1:
+            return None
+        
+        closers = "".join(GeminiResponse._CLOSERS[opener] for opener in reversed(safe_stack))
+        return json_text[:safe_end] + closers, len(safe_stack)
     
     @staticmethod
     def extract_sections(response_text: str) -> Dict[str, str]:
@@ -0,0 +1,141 @@
+"""
+스트리밍 JSON 파서
+Gemini 스트리밍 응답으로 도착하는 구조화 JSON을 점진적으로 읽어 완성된 섹션을 즉시 반환
+"""
+import json
+from typing import Any, Iterable, List, Tuple
+
+
+class StructuredStreamParser:
+    """
+    최상위 JSON 객체의 필드가 닫히는 즉시 (필드명, 값)을 반환하는 점진 파서
+    item_fields에 지정한 배열 필드는 요소(객체)가 닫힐 때마다 (필드명, 요소, 인덱스)로도 반환
+    """
+
+    def __init__(self, item_fields: Iterable[str] = ()):
+        """
+        파서 초기화
+
+        Args:
+            item_fields: 요소 단위로 내보낼 배열 필드명 (예: "requirements")
+        """
+        self.item_fields = set(item_fields)
+        self._text = ""
+        self._pos = 0
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+
+        self._expect_key = False
+        self._key_start = -1
+        self._key = None
+        self._value_start = -1
+        self._item_start = -1
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> List[Tuple]:
+        """
+        응답 조각 입력
+
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+
+        Returns:
+            완성된 이벤트 리스트
+            - ("field", 필드명, 값): 최상위 필드 완료
+            - ("item", 필드명, 요소, 인덱스): item_fields 배열의 요소 완료
+        """
+        self._text += chunk
+        events = []
+        text = self._text
+
+        for pos in range(self._pos, len(text)):
+            ch = text[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect_key and self._key_start >= 0:
+                        self._key = json.loads(text[self._key_start:pos + 1])
+                        self._key_start = -1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_start = pos
+
+            elif ch in "{[":
+                if not self._started:
+                    # 최상위 객체 시작 전 문자 (코드 블록 표시 등)는 무시
+                    if ch != "{":
+                        continue
+                    self._started = True
+                    self._expect_key = True
+                elif self._depth == 2 and self._key in self.item_fields and ch == "{":
+                    self._item_start = pos
+                self._depth += 1
+
+            elif ch in "}]":
+                if not self._started:
+                    continue
+                self._depth -= 1
+                if self._depth == 2 and self._item_start >= 0 and ch == "}":
+                    item = json.loads(text[self._item_start:pos + 1])
+                    events.append(("item", self._key, item, self._item_index))
+                    self._item_start = -1
+                    self._item_index += 1
+                elif self._depth == 0:
+                    events.extend(self._close_field(text, pos))
+
+            elif self._depth == 1:
+                if ch == ":":
+                    self._expect_key = False
+                    self._value_start = pos + 1
+                elif ch == ",":
+                    events.extend(self._close_field(text, pos))
+                    self._expect_key = True
+
+        self._pos = len(text)
+        return events
+
+    def _close_field(self, text: str, end: int) -> List[Tuple]:
+        """최상위 필드 값 완료 처리"""
+        if self._key is None or self._value_start < 0:
+            return []
+
+        value = json.loads(text[self._value_start:end])
+        event = ("field", self._key, value)
+        self._key = None
+        self._value_start = -1
+        self._item_index = 0
+        return [event]
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트"""
+        return self._text
+
+    @property
+    def is_complete(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._started and self._depth == 0
+
+    def result(self) -> Any:
+        """
+        전체 JSON 파싱 (스트림 종료 후 호출)
+
+        Raises:
+            json.JSONDecodeError: 응답이 완전한 JSON이 아닌 경우
+        """
+        start = self._text.find("{")
+        end = self._text.rfind("}")
+        if start < 0 or end < start:
+            raise json.JSONDecodeError("JSON 객체를 찾을 수 없습니다", self._text, 0)
+        return json.loads(self._text[start:end + 1])
@@ -0,0 +1,280 @@
+"""
+Gemini API 로컬 스텁 서버
+실제 API 대신 테스트/벤치마크에서 사용하는 gRPC 서버 (생성, 스트리밍, 토큰 계산, 컨텍스트 캐시)
+
+사용법:
+    python -m backend.analyzer.gemini.stub_server --port 50051 --latency 0.5
+
+    # 서버 설정
+    GEMINI_API_ENDPOINT=localhost:50051
+    GEMINI_API_INSECURE=true
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from concurrent import futures
+from typing import Any, Dict, List, Optional
+import grpc
+import google.ai.generativelanguage as glm
+from google.protobuf import timestamp_pb2
+from backend.analyzer.prompt.token_counter import HeuristicTokenCounter
+
+GENERATIVE_SERVICE = "google.ai.generativelanguage.v1beta.GenerativeService"
+CACHE_SERVICE = "google.ai.generativelanguage.v1beta.CacheService"
+
+# 스트리밍 응답 조각 크기 (문자)
+STREAM_CHUNK_CHARS = 256
+
+
+def sample_from_schema(schema: glm.Schema) -> Any:
+    """
+    응답 스키마(proto)를 만족하는 샘플 값 생성
+
+    Args:
+        schema: 요청의 generation_config.response_schema
+
+    Returns:
+        JSON 직렬화 가능한 값
+    """
+    kind = schema.type_
+    if kind == glm.Type.OBJECT:
+        return {name: sample_from_schema(field) for name, field in schema.properties.items()}
+    if kind == glm.Type.ARRAY:
+        return [sample_from_schema(schema.items) for _ in range(2)]
+    if kind == glm.Type.INTEGER:
+        return 1
+    if kind == glm.Type.NUMBER:
+        return 1.0
+    if kind == glm.Type.BOOLEAN:
+        return True
+    if schema.enum:
+        return schema.enum[0]
+    return f"스텁 {schema.description or '값'}"[:80]
+
+
+class StubGeminiServer:
+    """Gemini gRPC 스텁 서버 (호출 기록 포함)"""
+
+    def __init__(self, host: str = "localhost", port: int = 0, latency: float = 0.0, response_text: str = None):
+        """
+        스텁 서버 초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency: 호출마다 추가할 응답 지연 (초)
+            response_text: 고정 응답 텍스트 (없으면 JSON 모드는 스키마 샘플, 그 외는 프롬프트 요약)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.response_text = response_text
+        self._counter = HeuristicTokenCounter()
+        self._caches: Dict[str, glm.CachedContent] = {}
+        self._cache_tokens: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[grpc.Server] = None
+        # 호출 기록 (메서드명 -> 횟수, 캐시 사용 호출 수)
+        self.calls: Dict[str, int] = {}
+        self.cached_calls = 0
+
+    @property
+    def endpoint(self) -> str:
+        """GEMINI_API_ENDPOINT에 지정할 주소"""
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """서버 시작 후 접속 주소 반환"""
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        self._server.add_generic_rpc_handlers((
+            grpc.method_handlers_generic_handler(GENERATIVE_SERVICE, {
+                "GenerateContent": grpc.unary_unary_rpc_method_handler(
+                    self._generate_content,
+                    request_deserializer=glm.GenerateContentRequest.deserialize,
+                    response_serializer=glm.GenerateContentResponse.serialize,
+                ),
+                "StreamGenerateContent": grpc.unary_stream_rpc_method_handler(
+                    self._stream_generate_content,
+                    request_deserializer=glm.GenerateContentRequest.deserialize,
+                    response_serializer=glm.GenerateContentResponse.serialize,
+                ),
+                "CountTokens": grpc.unary_unary_rpc_method_handler(
+                    self._count_tokens,
+                    request_deserializer=glm.CountTokensRequest.deserialize,
+                    response_serializer=glm.CountTokensResponse.serialize,
+                ),
+            }),
+            grpc.method_handlers_generic_handler(CACHE_SERVICE, {
+                "CreateCachedContent": grpc.unary_unary_rpc_method_handler(
+                    self._create_cached_content,
+                    request_deserializer=glm.CreateCachedContentRequest.deserialize,
+                    response_serializer=glm.CachedContent.serialize,
+                ),
+                "GetCachedContent": grpc.unary_unary_rpc_method_handler(
+                    self._get_cached_content,
+                    request_deserializer=glm.GetCachedContentRequest.deserialize,
+                    response_serializer=glm.CachedContent.serialize,
+                ),
+                "DeleteCachedContent": grpc.unary_unary_rpc_method_handler(
+                    self._delete_cached_content,
+                    request_deserializer=glm.DeleteCachedContentRequest.deserialize,
+                    response_serializer=lambda _: b"",
+                ),
+            }),
+        ))
+        self.port = self._server.add_insecure_port(f"{self.host}:{self.port}")
+        self._server.start()
+        return self.endpoint
+
+    def stop(self, grace: float = 0):
+        """서버 종료"""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def wait(self):
+        """서버가 종료될 때까지 대기"""
+        if self._server is not None:
+            self._server.wait_for_termination()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _record(self, method: str):
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _contents_tokens(self, contents) -> int:
+        """요청 내용의 추정 토큰 수"""
+        return sum(self._counter.count(part.text) for content in contents for part in content.parts)
+
+    def _resolve_cache(self, request: glm.GenerateContentRequest, context) -> int:
+        """요청이 참조한 캐시의 토큰 수 (없는 캐시면 NOT_FOUND로 중단)"""
+        if not request.cached_content:
+            return 0
+        with self._lock:
+            cached = self._caches.get(request.cached_content)
+            tokens = self._cache_tokens.get(request.cached_content, 0)
+            if cached is not None:
+                self.cached_calls += 1
+        if cached is None or cached.expire_time.timestamp() < time.time():
+            context.abort(grpc.StatusCode.NOT_FOUND, f"CachedContent not found: {request.cached_content}")
+        return tokens
+
+    def _response_text(self, request: glm.GenerateContentRequest) -> str:
+        """응답 텍스트 생성"""
+        if self.response_text is not None:
+            return self.response_text
+        config = request.generation_config
+        summary = f"스텁 응답 (입력 {self._contents_tokens(request.contents)} 토큰)"
+        if config.response_mime_type == "application/json":
+            if "response_schema" in config:
+                return json.dumps(sample_from_schema(config.response_schema), ensure_ascii=False)
+            return json.dumps({"content": summary}, ensure_ascii=False)
+        return summary
+
+    def _limit_output(self, request: glm.GenerateContentRequest, text: str) -> tuple[str, bool]:
+        """max_output_tokens를 넘는 응답은 한도까지 자름 (실제 API의 MAX_TOKENS 종료 재현)"""
+        limit = request.generation_config.max_output_tokens
+        tokens = self._counter.count(text)
+        if not limit or tokens <= limit:
+            return text, False
+        return text[:len(text) * limit // tokens], True
+
+    def _build_response(
+        self, text: str, prompt_tokens: int = 0, cached_tokens: int = 0, final: bool = True, truncated: bool = False
+    ) -> glm.GenerateContentResponse:
+        """생성 응답 메시지 구성 (종료 사유와 사용량은 마지막 조각에만 포함)"""
+        candidate = glm.Candidate(index=0, content=glm.Content(role="model", parts=[glm.Part(text=text)]))
+        response = glm.GenerateContentResponse(candidates=[candidate])
+        if final:
+            FinishReason = glm.Candidate.FinishReason
+            candidate.finish_reason = FinishReason.MAX_TOKENS if truncated else FinishReason.STOP
+            output_tokens = self._counter.count(text)
+            response.usage_metadata = glm.GenerateContentResponse.UsageMetadata(
+                prompt_token_count=prompt_tokens + cached_tokens,
+                cached_content_token_count=cached_tokens,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + cached_tokens + output_tokens,
+            )
+        return response
+
+    def _generate_content(self, request: glm.GenerateContentRequest, context) -> glm.GenerateContentResponse:
+        self._record("GenerateContent")
+        cached_tokens = self._resolve_cache(request, context)
+        text, truncated = self._limit_output(request, self._response_text(request))
+        return self._build_response(text, self._contents_tokens(request.contents), cached_tokens, truncated=truncated)
+
+    def _stream_generate_content(self, request: glm.GenerateContentRequest, context):
+        self._record("StreamGenerateContent")
+        cached_tokens = self._resolve_cache(request, context)
+        text, truncated = self._limit_output(request, self._response_text(request))
+        pieces: List[str] = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)] or [""]
+        for index, piece in enumerate(pieces):
+            final = index == len(pieces) - 1
+            yield self._build_response(piece, self._contents_tokens(request.contents), cached_tokens, final, truncated)
+
+    def _count_tokens(self, request: glm.CountTokensRequest, context) -> glm.CountTokensResponse:
+        self._record("CountTokens")
+        contents = request.contents or request.generate_content_request.contents
+        return glm.CountTokensResponse(total_tokens=self._contents_tokens(contents))
+
+    def _create_cached_content(self, request: glm.CreateCachedContentRequest, context) -> glm.CachedContent:
+        self._record("CreateCachedContent")
+        cached = glm.CachedContent(request.cached_content)
+        ttl = cached.ttl.total_seconds() if "ttl" in cached else 3600
+        expire_time = timestamp_pb2.Timestamp()
+        expire_time.FromSeconds(int(time.time() + ttl))
+
+        tokens = self._contents_tokens(cached.contents)
+        cached.name = f"cachedContents/stub-{next(self._ids)}"
+        cached.expire_time = expire_time
+        cached.usage_metadata = glm.CachedContent.UsageMetadata(total_token_count=tokens)
+        with self._lock:
+            self._caches[cached.name] = cached
+            self._cache_tokens[cached.name] = tokens
+        return cached
+
+    def _get_cached_content(self, request: glm.GetCachedContentRequest, context) -> glm.CachedContent:
+        self._record("GetCachedContent")
+        with self._lock:
+            cached = self._caches.get(request.name)
+        if cached is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"CachedContent not found: {request.name}")
+        return cached
+
+    def _delete_cached_content(self, request: glm.DeleteCachedContentRequest, context):
+        self._record("DeleteCachedContent")
+        with self._lock:
+            self._caches.pop(request.name, None)
+            self._cache_tokens.pop(request.name, None)
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gemini API 로컬 스텁 서버")
+    parser.add_argument("--host", default="localhost", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=50051, help="포트")
+    parser.add_argument("--latency", type=float, default=0.0, help="호출마다 추가할 응답 지연 (초)")
+    args = parser.parse_args()
+
+    server = StubGeminiServer(args.host, args.port, args.latency)
+    endpoint = server.start()
+    print(f"Gemini 스텁 서버 실행 중: {endpoint} (GEMINI_API_ENDPOINT={endpoint}, GEMINI_API_INSECURE=true)")
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,14 @@
 """
 import os
 from typing import List, Tuple
-from backend.analyzer.parser.pdf_parser import pdf_parser
-from backend.analyzer.parser.hwp_parser import hwp_parser
-from backend.analyzer.parser.pptx_parser import pptx_parser
+from backend.analyzer.parser.parse_executor import parse_executor, PARSER_VERSION
 from backend.analyzer.parser.text_cleaner import text_cleaner
 from backend.utils.file_handler import file_handler
+from backend.utils.parse_cache import parse_cache
+from config.settings import settings
 from backend.utils.logger import logger
 from backend.utils.error_handler import error_handler
+from backend.utils.metrics import metrics
 
 
 class DocumentIntegrator:
@@ -27,40 +28,61 @@ class DocumentIntegrator:
         Returns:
             (성공 여부, 통합된 텍스트 또는 에러 메시지)
         """
+        temp_paths = []
         try:
-            combined_text = ""
-            
-            for idx, uploaded_file in enumerate(uploaded_files, 1):
-                logger.info(f"파일 {idx}/{len(uploaded_files)} 파싱 시작: {uploaded_file.name}")
-                
+            file_entries = []
+            for uploaded_file in uploaded_files:
                 # 임시 파일로 저장
                 temp_path = file_handler.create_temp_file(
                     suffix=os.path.splitext(uploaded_file.name)[1]
                 )
+                temp_paths.append(temp_path)
                 
                 with open(temp_path, "wb") as f:
                     f.write(uploaded_file.getvalue())
                 
-                # 파일 확장자에 따라 파서 선택
-                ext = file_handler.get_file_extension(temp_path)
+                file_entries.append((temp_path, uploaded_file.name))
+            
+            return DocumentIntegrator.parse_file_paths(file_entries)
+            
+        except Exception as e:
+            logger.error(f"문서 통합 중 오류: {str(e)}")
+            return error_handler.handle_general_error(e, "문서 통합")
+        
+        finally:
+            # 임시 파일 삭제
+            for temp_path in temp_paths:
+                file_handler.delete_file(temp_path)
+    
+    @staticmethod
+    def parse_file_paths(file_entries: List[Tuple[str, str]]) -> Tuple[bool, str]:
+        """
+        디스크에 있는 파일들을 직접 파싱 및 통합 (추가 복사 없음)
+        
+        Args:
+            file_entries: (파일 경로, 원본 파일명) 리스트
+            
+        Returns:
+            (성공 여부, 통합된 텍스트 또는 에러 메시지)
+        """
+        try:
+            text_parts = []
+            
+            for idx, (file_path, file_name) in enumerate(file_entries, 1):
+                logger.info(f"파일 {idx}/{len(file_entries)} 파싱 시작: {file_name}")
+                
+                # 파일 확장자 확인 (원본 파일명 기준)
+                ext = file_handler.get_file_extension(file_name)
                 
-                if ext == ".pdf":
-                    success, result = pdf_parser.extract_text(temp_path)
-                elif ext == ".hwp":
-                    success, result = hwp_parser.extract_text(temp_path)
-                elif ext == ".pptx":
-                    success, result = pptx_parser.extract_text(temp_path)
-                else:
-                    file_handler.delete_file(temp_path)
+                if ext not in (".pdf", ".hwp", ".pptx"):
                     return False, f"지원하지 않는 파일 형식: {ext}"
                 
-                # 임시 파일 삭제
-                file_handler.delete_file(temp_path)
+                success, text = DocumentIntegrator._extract_file_text(file_path, file_name)
                 
                 if not success:
                     error_msg = (
-                        f"파일 '{uploaded_file.name}' 파싱 실패\n\n"
-                        f"**원인**: {result}\n\n"
+                        f"파일 '{file_name}' 파싱 실패\n\n"
+                        f"**원인**: {text}\n\n"
                         f"**해결 방법**:\n"
                         f"- 파일이 손상되지 않았는지 확인하세요\n"
                         f"- 파일 형식이 표준 {ext.upper()} 형식인지 확인하세요\n"
@@ -68,35 +90,66 @@ class DocumentIntegrator:
                     )
                     return False, error_msg
                 
-                # 텍스트 추출
-                if isinstance(result, dict):
-                    text = result.get("text", "")
-                else:
-                    text = result
-                
                 # [FIX] 텍스트 유효성 검사 (헤더 추가 전)
                 if not text or len(text.strip()) < 50:
-                     return False, f"파일 '{uploaded_file.name}'에서 유효한 텍스트를 추출할 수 없습니다.\n스캔된 이미지 PDF이거나 내용이 비어있을 수 있습니다."
+                     return False, f"파일 '{file_name}'에서 유효한 텍스트를 추출할 수 없습니다.\n스캔된 이미지 PDF이거나 내용이 비어있을 수 있습니다."
                 
                 # 파일 구분자 추가
-                combined_text += f"\n\n{'='*80}\n"
-                combined_text += f"파일: {uploaded_file.name}\n"
-                combined_text += f"{'='*80}\n\n"
-                combined_text += text
+                text_parts.append(
+                    f"\n\n{'='*80}\n"
+                    f"파일: {file_name}\n"
+                    f"{'='*80}\n\n"
+                )
+                text_parts.append(text)
             
-            # 텍스트 유효성 검사 및 정제
-            cleaned_text = text_cleaner.clean(combined_text)
+            # 텍스트 유효성 검사 (파일별 텍스트는 이미 정제됨)
+            combined_text = "".join(text_parts)
             
-            if not cleaned_text or len(cleaned_text.strip()) < 50:
+            if len(combined_text.strip()) < 50:
                  return False, "문서에서 유효한 텍스트를 추출할 수 없습니다. 스캔된 이미지 PDF이거나 내용이 비어있을 수 있습니다.\n텍스트를 선택할 수 있는지 확인하거나 OCR 처리가 된 파일을 사용해주세요."
 
-            logger.info(f"총 {len(uploaded_files)}개 파일 파싱 완료 (텍스트 길이: {len(cleaned_text)})")
-            return True, cleaned_text
+            logger.info(f"총 {len(file_entries)}개 파일 파싱 완료 (텍스트 길이: {len(combined_text)})")
+            return True, combined_text
             
         except Exception as e:
             logger.error(f"문서 통합 중 오류: {str(e)}")
             return error_handler.handle_general_error(e, "문서 통합")
 
+    
+    @staticmethod
+    def _extract_file_text(file_path: str, file_name: str) -> Tuple[bool, str]:
+        """
+        단일 파일의 정제된 텍스트 추출 (파싱 캐시 우선)
+        
+        Returns:
+            (성공 여부, 정제된 텍스트 또는 에러 메시지)
+        """
+        cache_key = None
+        if settings.PARSE_CACHE_ENABLED:
+            with metrics.span("parse.cache_lookup"):
+                cache_key = parse_cache.make_key(file_path, PARSER_VERSION)
+                cached = parse_cache.get(cache_key)
+            metrics.inc("cache_requests_total", cache="parse", tier="disk", result="miss" if cached is None else "hit")
+            if cached is not None:
+                return True, cached
+        
+        # 파싱 프로세스 풀에서 텍스트 추출 (CPU 작업이 서버 프로세스를 점유하지 않음)
+        with metrics.span("parse.extract"):
+            success, result = parse_executor.parse(file_path, file_name)
+        if not success:
+            return False, result
+        
+        metrics.inc("parsed_bytes_total", os.path.getsize(file_path), format=os.path.splitext(file_name)[1].lower().lstrip("."))
+        logger.info(f"파일 파싱 통계: {file_name} {result.get('stats', {})}")
+        with metrics.span("parse.clean"):
+            text = text_cleaner.clean(result.get("text", ""))
+        
+        # 유효한 텍스트만 캐시 (스캔 이미지 등 실패 결과는 저장하지 않음)
+        if cache_key and len(text.strip()) >= 50:
+            parse_cache.set(cache_key, text)
+        
+        return True, text
+
 
 # 전역 인스턴스
 document_integrator = DocumentIntegrator()
@@ -3,13 +3,34 @@ HWP 파일 파싱
 olefile을 사용한 텍스트 추출
 """
 import olefile
+import re
 import zlib
 import struct
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator
+from config.settings import settings
 from backend.utils.logger import logger
 from backend.utils.error_handler import error_handler
 
 
+# HWP 5.0 레코드 태그 (HWPTAG_BEGIN = 0x10)
+HWPTAG_PARA_TEXT = 0x10 + 51
+
+# 8 WCHAR를 차지하는 인라인/확장 컨트롤 (컨트롤 코드 + 파라미터 6 WCHAR + 컨트롤 코드)
+_EXTENDED_CONTROL_RE = re.compile(r'([\x01-\x09\x0b\x0c\x0e-\x17])[\s\S]{6}\1')
+
+# 1 WCHAR 컨트롤 문자 치환 테이블 (줄바꿈/문단 끝은 개행, 나머지 제어 문자는 제거)
+_CONTROL_CHAR_TABLE = {code: None for code in range(32)}
+_CONTROL_CHAR_TABLE.update({
+    9: '\t',    # 탭 (인라인 컨트롤 처리 후 남은 경우)
+    10: '\n',   # 줄 바꿈
+    13: '\n',   # 문단 끝
+    24: '-',    # 하이픈
+    30: ' ',    # 묶음 빈칸
+    31: ' ',    # 고정폭 빈칸
+})
+
+
 class HWPParser:
     """HWP 파서 클래스"""
     
@@ -29,8 +50,9 @@ class HWPParser:
             
             ole = olefile.OleFileIO(file_path)
             
-            # 섹션 텍스트 추출
-            sections = []
+            # 섹션 스트림 읽기 (olefile은 스레드 안전하지 않으므로 순차 처리)
+            compressed = HWPParser._is_compressed(ole)
+            section_streams = []
             section_num = 0
             
             while True:
@@ -38,13 +60,21 @@ class HWPParser:
                 if not ole.exists(section_name):
                     break
                 
-                section_data = ole.openstream(section_name).read()
-                section_text = HWPParser._decompress_section(section_data)
-                sections.append(section_text)
+                section_streams.append(ole.openstream(section_name).read())
                 section_num += 1
             
             ole.close()
             
+            # 섹션 디코딩 (섹션이 많으면 병렬 처리, zlib 압축 해제는 GIL을 해제함)
+            if len(section_streams) >= settings.HWP_PARALLEL_MIN_SECTIONS:
+                with ThreadPoolExecutor(max_workers=min(len(section_streams), 8)) as pool:
+                    sections = list(pool.map(
+                        lambda data: HWPParser._decompress_section(data, compressed),
+                        section_streams
+                    ))
+            else:
+                sections = [HWPParser._decompress_section(data, compressed) for data in section_streams]
+            
             full_text = "\n\n".join(sections)
             
             result = {
@@ -59,41 +89,71 @@ class HWPParser:
             return error_handler.handle_parsing_error(e, "HWP")
     
     @staticmethod
-    def _decompress_section(data: bytes) -> str:
+    def _is_compressed(ole: olefile.OleFileIO) -> bool:
+        """FileHeader 속성 플래그에서 본문 압축 여부 확인 (bit 0)"""
+        try:
+            header = ole.openstream("FileHeader").read()
+            properties = struct.unpack_from('<I', header, 36)[0]
+            return bool(properties & 0x01)
+        except Exception:
+            # 헤더를 읽을 수 없으면 압축 해제를 시도
+            return True
+    
+    @staticmethod
+    def _decompress_section(data: bytes, compressed: bool = True) -> str:
         """
         HWP 섹션 데이터 압축 해제 및 텍스트 추출
+        레코드 헤더를 해석하여 PARA_TEXT 레코드만 UTF-16LE로 일괄 디코딩
         """
-        try:
-            # 압축 해제 시도
-            unpacked = zlib.decompress(data, -15)
-        except:
-            # 압축되지 않은 데이터
-            unpacked = data
-        
-        # 텍스트 추출 (간단한 방식)
-        text = ""
-        i = 0
-        while i < len(unpacked):
+        unpacked = data
+        if compressed:
             try:
-                # 한글 문자 추출 시도
-                if i + 1 < len(unpacked):
-                    char_code = struct.unpack('<H', unpacked[i:i+2])[0]
-                    if 0xAC00 <= char_code <= 0xD7A3:  # 한글 범위
-                        text += chr(char_code)
-                        i += 2
-                        continue
-                
-                # ASCII 문자
-                if 32 <= unpacked[i] <= 126:
-                    text += chr(unpacked[i])
-                elif unpacked[i] in [10, 13]:  # 줄바꿈
-                    text += '\n'
-                
-                i += 1
-            except:
-                i += 1
+                # 압축 해제 시도
+                unpacked = zlib.decompress(data, -15)
+            except zlib.error:
+                # 압축되지 않은 데이터
+                unpacked = data
         
-        return text
+        # 문단 텍스트 레코드 일괄 디코딩
+        text = "".join(
+            str(payload, 'utf-16-le', 'replace')
+            for payload in HWPParser._iter_para_text(unpacked)
+        )
+        
+        # 인라인/확장 컨트롤 제거 (탭은 공백 문자로 유지) 후 단일 문자 컨트롤 치환
+        text = _EXTENDED_CONTROL_RE.sub(lambda m: '\t' if m.group(1) == '\t' else '', text)
+        return text.translate(_CONTROL_CHAR_TABLE)
+    
+    @staticmethod
+    def _iter_para_text(data: bytes) -> Iterator[memoryview]:
+        """
+        레코드 스트림에서 PARA_TEXT 레코드 페이로드 순회 (복사 없이 memoryview 반환)
+        
+        레코드 헤더 (32bit): Tag ID 10bit | Level 10bit | Size 12bit
+        Size가 0xFFF이면 다음 4바이트가 실제 크기
+        """
+        view = memoryview(data)
+        length = len(data)
+        pos = 0
+        
+        while pos + 4 <= length:
+            header = struct.unpack_from('<I', data, pos)[0]
+            tag_id = header & 0x3FF
+            size = (header >> 20) & 0xFFF
+            pos += 4
+            
+            if size == 0xFFF:
+                if pos + 4 > length:
+                    break
+                size = struct.unpack_from('<I', data, pos)[0]
+                pos += 4
+            
+            if tag_id == HWPTAG_PARA_TEXT:
+                # 잘린 레코드는 UTF-16 경계에 맞춰 자름
+                end = min(pos + size, length)
+                yield view[pos:end - ((end - pos) % 2)]
+            
+            pos += size
 
 
 # 전역 인스턴스
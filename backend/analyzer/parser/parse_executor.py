@@ -0,0 +1,218 @@
+"""
+문서 파싱 실행기
+CPU 집약적인 텍스트 추출을 별도 프로세스 풀에서 실행
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Tuple
+from pypdf import PdfReader
+from config.settings import settings
+from backend.analyzer.parser.pdf_parser import pdf_parser, extract_page_range
+from backend.utils.error_handler import error_handler
+from backend.utils.logger import logger
+
+# 파서 출력이 바뀌면 올려서 파싱 캐시를 무효화
+PARSER_VERSION = "1"
+
+
+def parse_file(file_path: str, file_name: str) -> Tuple[bool, Dict | str]:
+    """
+    단일 파일 파싱 (워커 프로세스에서 실행되므로 모듈 최상위 함수로 유지)
+
+    Args:
+        file_path: 파일 경로
+        file_name: 원본 파일명 (확장자 판별용)
+
+    Returns:
+        (성공 여부, {"text", "stats"} 또는 에러 메시지)
+    """
+    from backend.analyzer.parser.pdf_parser import pdf_parser
+    from backend.analyzer.parser.hwp_parser import hwp_parser
+    from backend.analyzer.parser.pptx_parser import pptx_parser
+
+    start_time = time.perf_counter()
+    ext = os.path.splitext(file_name)[1].lower()
+
+    if ext == ".pdf":
+        success, result = pdf_parser.extract_text(file_path)
+    elif ext == ".hwp":
+        success, result = hwp_parser.extract_text(file_path)
+    elif ext == ".pptx":
+        success, result = pptx_parser.extract_text(file_path)
+    else:
+        return False, f"지원하지 않는 파일 형식: {ext}"
+
+    if not success:
+        return False, result
+
+    if not isinstance(result, dict):
+        result = {"text": result}
+
+    return True, _with_stats(file_path, ext, result, start_time)
+
+
+def _with_stats(file_path: str, ext: str, result: Dict, start_time: float) -> Dict:
+    """파서 결과를 {"text", "stats"} 형식으로 변환"""
+    text = result.get("text", "")
+    stats = {
+        "format": ext.lstrip("."),
+        "bytes": os.path.getsize(file_path),
+        "chars": len(text),
+        "elapsed": round(time.perf_counter() - start_time, 3),
+    }
+    for count_key in ("total_pages", "total_sections", "total_slides"):
+        if count_key in result:
+            stats[count_key] = result[count_key]
+
+    return {"text": text, "stats": stats}
+
+
+class ParseExecutor:
+    """파싱 프로세스 풀 관리 클래스"""
+
+    def __init__(self, max_workers: int = None, timeout: int = None, page_workers: int = None):
+        """
+        실행기 초기화
+
+        Args:
+            max_workers: 워커 프로세스 수 (0이면 현재 프로세스에서 직접 파싱)
+            timeout: 작업 1개(파일 또는 PDF 페이지 구간)당 파싱 제한 시간 (초)
+            page_workers: 대용량 PDF를 나눌 페이지 구간 수 (1이면 파일 단위로만 파싱)
+        """
+        self.max_workers = settings.PARSE_WORKERS if max_workers is None else max_workers
+        self.timeout = timeout or settings.PARSE_TIMEOUT_SECONDS
+        self.page_workers = settings.PDF_PAGE_WORKERS if page_workers is None else page_workers
+        self._pool = None
+        self._lock = threading.Lock()
+        # 제출 수를 워커 수로 제한하여 제출된 작업은 곧바로 실행됨 (타임아웃이 대기열 시간을 포함하지 않도록)
+        self._slots = threading.BoundedSemaphore(max(self.max_workers, 1))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀 지연 생성"""
+        with self._lock:
+            if self._pool is None:
+                # 서버 프로세스는 스레드/gRPC 채널을 보유하므로 fork 대신 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"파싱 프로세스 풀 생성: {self.max_workers}개 워커")
+            return self._pool
+
+    def _kill_pool(self, pool: ProcessPoolExecutor):
+        """폭주한 워커를 포함한 풀 전체를 강제 종료 (다음 요청 시 재생성)"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+
+        # ProcessPoolExecutor는 개별 워커 종료를 지원하지 않으므로 프로세스를 직접 종료
+        for process in list((pool._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("파싱 프로세스 풀 강제 종료")
+
+    def _submit(self, pool: ProcessPoolExecutor, fn, *args) -> Future:
+        """빈 워커 슬롯을 확보한 뒤 작업 제출 (작업이 끝나거나 취소되면 슬롯 반환)"""
+        self._slots.acquire()
+        try:
+            future = pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _wait(self, pool: ProcessPoolExecutor, future: Future):
+        """
+        작업 결과 대기 (제한 시간 초과 시 아직 시작되지 않은 작업은 취소만 하고,
+        실행 중인 작업만 풀을 종료하여 멈춤)
+        """
+        try:
+            return future.result(timeout=self.timeout)
+        except FuturesTimeoutError:
+            if not future.cancel():
+                self._kill_pool(pool)
+            raise
+
+    def _page_shards(self, file_path: str, file_name: str) -> List[Tuple[int, int]]:
+        """대용량 PDF의 페이지 구간 (대상이 아니거나 읽을 수 없으면 빈 리스트, 오류는 파일 단위 파싱에서 보고)"""
+        if self.page_workers <= 1 or os.path.splitext(file_name)[1].lower() != ".pdf":
+            return []
+        try:
+            return pdf_parser.page_shards(PdfReader(file_path), self.page_workers)
+        except Exception:
+            return []
+
+    def _parse_pdf_shards(
+        self, pool: ProcessPoolExecutor, file_path: str, shards: List[Tuple[int, int]]
+    ) -> Tuple[bool, Dict | str]:
+        """PDF 페이지 구간을 파싱 풀의 워커들에 나누어 추출한 뒤 원래 순서대로 병합"""
+        start_time = time.perf_counter()
+        logger.info(f"PDF 페이지 병렬 추출: {shards[-1][1]}페이지, {len(shards)}개 구간")
+        futures = []
+        try:
+            for start, end in shards:
+                futures.append(self._submit(pool, extract_page_range, file_path, start, end))
+            pages_text = [text for future in futures for text in self._wait(pool, future)]
+        except (FuturesTimeoutError, BrokenProcessPool, RuntimeError):
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            return error_handler.handle_parsing_error(e, "PDF")
+
+        result = pdf_parser.build_result(PdfReader(file_path), pages_text)
+        return True, _with_stats(file_path, ".pdf", result, start_time)
+
+    def parse(self, file_path: str, file_name: str) -> Tuple[bool, Dict | str]:
+        """
+        파일 파싱 (프로세스 풀로 위임, 대용량 PDF는 페이지 구간별로 여러 워커에 분배)
+
+        Args:
+            file_path: 파일 경로
+            file_name: 원본 파일명
+
+        Returns:
+            (성공 여부, {"text", "stats"} 또는 에러 메시지)
+        """
+        if self.max_workers <= 0:
+            return parse_file(file_path, file_name)
+
+        shards = self._page_shards(file_path, file_name)
+
+        # 다른 파일의 타임아웃으로 풀이 재생성된 경우 1회 재시도
+        for attempt in range(2):
+            # 빈 워커가 생길 때까지 대기 (대기 시간은 파싱 제한 시간에 포함하지 않음)
+            pool = self._get_pool()
+            try:
+                if shards:
+                    return self._parse_pdf_shards(pool, file_path, shards)
+                return self._wait(pool, self._submit(pool, parse_file, file_path, file_name))
+
+            except FuturesTimeoutError:
+                logger.error(f"파싱 시간 초과 ({self.timeout}초): {file_name}")
+                return False, f"파싱 시간이 초과되었습니다. ({self.timeout}초) 문서가 너무 크거나 손상되었을 수 있습니다."
+
+            except (BrokenProcessPool, RuntimeError):
+                # 워커 비정상 종료 또는 다른 요청에 의해 풀이 종료된 직후
+                logger.warning(f"파싱 워커가 비정상 종료됨: {file_name} (시도 {attempt + 1})")
+                self._kill_pool(pool)
+
+        return False, "파싱 워커가 비정상 종료되었습니다. 파일이 손상되었을 수 있습니다."
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            logger.info("파싱 프로세스 풀 종료")
+
+
+# 전역 인스턴스
+parse_executor = ParseExecutor()
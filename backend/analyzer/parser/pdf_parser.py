@@ -1,20 +1,35 @@
 """
 PDF 파일 파싱
 pypdf를 사용한 텍스트 추출
+(대용량 PDF의 페이지 구간 병렬 추출은 ParseExecutor가 파싱 프로세스 풀에 구간별로 분배)
 """
 from pypdf import PdfReader
-from typing import Dict, List
+from typing import Dict, List, Tuple
+from config.settings import settings
 from backend.utils.logger import logger
 from backend.utils.error_handler import error_handler
 
 
+def extract_page_range(file_path: str, start: int, end: int) -> List[str]:
+    """
+    페이지 구간 텍스트 추출 (파싱 워커 프로세스에서 실행, 워커마다 별도 PdfReader 사용)
+    
+    Args:
+        file_path: PDF 파일 경로
+        start: 시작 페이지 인덱스 (포함)
+        end: 끝 페이지 인덱스 (미포함)
+    """
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() for i in range(start, end)]
+
+
 class PDFParser:
     """PDF 파서 클래스"""
     
     @staticmethod
     def extract_text(file_path: str) -> tuple[bool, str | Dict]:
         """
-        PDF 파일에서 텍스트 추출
+        PDF 파일에서 텍스트 추출 (현재 프로세스에서 순차 추출)
         
         Args:
             file_path: PDF 파일 경로
@@ -26,34 +41,63 @@ class PDFParser:
             logger.info(f"PDF 파싱 시작: {file_path}")
             
             reader = PdfReader(file_path)
-            total_pages = len(reader.pages)
-            
-            # 전체 텍스트 추출
-            full_text = ""
-            for page_num, page in enumerate(reader.pages, 1):
-                text = page.extract_text()
-                full_text += f"\n--- 페이지 {page_num} ---\n{text}\n"
-            
-            # 메타데이터 추출
-            metadata = reader.metadata
+            result = PDFParser.build_result(reader, [page.extract_text() for page in reader.pages])
             
-            result = {
-                "text": full_text.strip(),
-                "total_pages": total_pages,
-                "metadata": {
-                    "title": metadata.get("/Title", ""),
-                    "author": metadata.get("/Author", ""),
-                    "subject": metadata.get("/Subject", ""),
-                    "creator": metadata.get("/Creator", "")
-                } if metadata else {}
-            }
-            
-            logger.info(f"PDF 파싱 완료: {total_pages}페이지")
+            logger.info(f"PDF 파싱 완료: {result['total_pages']}페이지")
             return True, result
             
         except Exception as e:
             return error_handler.handle_parsing_error(e, "PDF")
     
+    @staticmethod
+    def build_result(reader: PdfReader, pages_text: List[str]) -> Dict:
+        """
+        페이지별 텍스트를 페이지 구분자와 함께 합치고 메타데이터 추가
+        
+        Args:
+            reader: 메타데이터를 읽을 PdfReader
+            pages_text: 페이지 순서대로의 텍스트 리스트
+        """
+        full_text = "".join(
+            f"\n--- 페이지 {page_num} ---\n{text}\n"
+            for page_num, text in enumerate(pages_text, 1)
+        )
+        
+        metadata = reader.metadata
+        return {
+            "text": full_text.strip(),
+            "total_pages": len(reader.pages),
+            "metadata": {
+                "title": metadata.get("/Title", ""),
+                "author": metadata.get("/Author", ""),
+                "subject": metadata.get("/Subject", ""),
+                "creator": metadata.get("/Creator", "")
+            } if metadata else {}
+        }
+    
+    @staticmethod
+    def page_shards(reader: PdfReader, workers: int = None) -> List[Tuple[int, int]]:
+        """
+        페이지 병렬 추출 구간 계산
+        
+        Args:
+            reader: 대상 PdfReader
+            workers: 구간 수 (없으면 PDF_PAGE_WORKERS)
+        
+        Returns:
+            (시작, 끝) 페이지 인덱스 구간 리스트 (병렬 추출 대상이 아니면 빈 리스트)
+        """
+        workers = settings.PDF_PAGE_WORKERS if workers is None else workers
+        total_pages = len(reader.pages)
+        if workers <= 1 or total_pages < max(settings.PDF_PARALLEL_MIN_PAGES, 2):
+            return []
+        
+        shard_size = -(-total_pages // workers)  # 올림 나눗셈
+        return [
+            (start, min(start + shard_size, total_pages))
+            for start in range(0, total_pages, shard_size)
+        ]
+    
     @staticmethod
     def extract_text_by_page(file_path: str) -> tuple[bool, List[str] | str]:
         """
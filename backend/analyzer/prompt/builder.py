@@ -2,7 +2,7 @@
 프롬프트 빌더
 동적 프롬프트 생성 및 변수 치환
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from backend.analyzer.prompt.templates import prompt_templates
 from backend.utils.logger import logger
 
@@ -110,6 +110,72 @@ class PromptBuilder:
             {"analysis_result": analysis_result}
         )
 
+    
+    @staticmethod
+    def build_session_context(document_text: str, analysis_result: str) -> Optional[str]:
+        """
+        분석 세션의 고정 앞부분 생성 (원문 + 1차 분석 결과)
+        
+        Args:
+            document_text: 문서 텍스트
+            analysis_result: 1차 분석 결과 (JSON 문자열)
+            
+        Returns:
+            세션 컨텍스트 프롬프트
+        """
+        return PromptBuilder.build(
+            "followup",
+            "session_context",
+            {"document_text": document_text, "analysis_result": analysis_result}
+        )
+    
+    @staticmethod
+    def build_followup_prompt(mode: str, instruction: str = "", history: List[Dict[str, str]] = None) -> Optional[str]:
+        """
+        후속 요청 프롬프트 생성 (세션 컨텍스트 뒤에 붙는 가변 부분)
+        요약/전략/레퍼런스는 기존 템플릿을 사용하되 원문/분석 결과 자리에는 세션 컨텍스트 참조 문구를 넣음
+        
+        Args:
+            mode: 요청 유형 (summary, strategy, references, custom)
+            instruction: 사용자 추가 지시
+            history: 이전 후속 요청 목록 [{"request", "reply"}]
+            
+        Returns:
+            후속 요청 프롬프트 (알 수 없는 유형이면 None)
+        """
+        document_reference = prompt_templates.get("followup", "document_reference")
+        analysis_reference = prompt_templates.get("followup", "analysis_reference")
+        
+        if mode == "summary":
+            task = PromptBuilder.build("summary", "summary_prompt", {"document_text": document_reference})
+        elif mode == "strategy":
+            task = PromptBuilder.build_strategy_prompt(analysis_reference)
+        elif mode == "references":
+            task = PromptBuilder.build_reference_prompt(analysis_reference)
+        elif mode == "custom":
+            task = PromptBuilder.build("followup", "custom_prompt")
+        else:
+            logger.error(f"알 수 없는 후속 요청 유형: {mode}")
+            return None
+        
+        if not task:
+            return None
+        
+        turns = [
+            PromptBuilder.build("followup", "history_turn", {"index": str(index), **turn})
+            for index, turn in enumerate(history or [], 1)
+        ]
+        
+        return PromptBuilder.build(
+            "followup",
+            "followup_prompt",
+            {
+                "history": "\n".join(turn for turn in turns if turn) or "(없음)",
+                "task": task,
+                "instruction": instruction or "(없음)",
+            }
+        )
+
 
 # 전역 인스턴스
 prompt_builder = PromptBuilder()
@@ -0,0 +1,118 @@
+"""
+문서 청크 분할
+토큰 예산에 맞춰 파일/페이지/섹션 경계 기준으로 문서를 분할
+"""
+import re
+from typing import List
+from backend.analyzer.prompt.optimizer import token_optimizer
+
+
+# 분할 경계 (우선순위 순): 파일 구분자, 페이지/슬라이드 마커
+_FILE_BOUNDARY_RE = re.compile(r'(?=\n*={80}\n파일: )')
+_PAGE_BOUNDARY_RE = re.compile(r'(?=\n--- (?:페이지|슬라이드) \d+ ---\n)')
+
+# 섹션 제목으로 보이는 줄 (예: "1. 사업 개요", "Ⅱ. 제안요청 내용", "제3장", "가. 사업범위")
+_SECTION_BOUNDARY_RE = re.compile(
+    r'(?=\n(?:\d{1,2}\.\s|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\.\s?|제\s?\d+\s?[장절]|[가-하]\.\s?)\S)'
+)
+
+
+class DocumentChunker:
+    """문서 청크 분할 클래스"""
+
+    @staticmethod
+    def split(text: str, max_tokens: int) -> List[str]:
+        """
+        문서를 토큰 예산 이하의 청크로 분할
+        파일 > 페이지 > 섹션 > 문단 > 줄 경계 순으로 자르며, 작은 조각은 순서대로 다시 묶음
+
+        Args:
+            text: 문서 텍스트
+            max_tokens: 청크당 최대 토큰 수
+
+        Returns:
+            청크 리스트 (원문 순서 유지)
+        """
+        if not text:
+            return []
+
+        units = DocumentChunker._split_units(text, max_tokens)
+        return DocumentChunker._pack(units, max_tokens)
+
+    @staticmethod
+    def split_sections(text: str) -> List[str]:
+        """
+        파일/페이지/섹션 경계 기준으로 문서를 분할 (토큰 예산 없이)
+
+        Returns:
+            섹션 리스트 (원문 순서 유지, 이어 붙이면 원문과 동일)
+        """
+        sections = []
+        for file_part in _FILE_BOUNDARY_RE.split(text):
+            for page_part in _PAGE_BOUNDARY_RE.split(file_part):
+                sections.extend(part for part in _SECTION_BOUNDARY_RE.split(page_part) if part)
+        return sections
+
+    @staticmethod
+    def _split_units(text: str, max_tokens: int) -> List[str]:
+        """예산을 넘는 조각만 더 작은 경계로 재귀 분할"""
+        units = []
+        splitters = (
+            _FILE_BOUNDARY_RE.split,
+            _PAGE_BOUNDARY_RE.split,
+            _SECTION_BOUNDARY_RE.split,
+            lambda part: re.split(r'(?<=\n\n)', part),
+            lambda part: re.split(r'(?<=\n)', part),
+        )
+
+        def descend(part: str, level: int):
+            if token_optimizer.estimate_tokens(part) <= max_tokens:
+                units.append(part)
+                return
+
+            if level >= len(splitters):
+                units.extend(DocumentChunker._hard_split(part, max_tokens))
+                return
+
+            pieces = [piece for piece in splitters[level](part) if piece]
+            if len(pieces) == 1:
+                descend(part, level + 1)
+                return
+
+            for piece in pieces:
+                descend(piece, level + 1)
+
+        descend(text, 0)
+        return units
+
+    @staticmethod
+    def _hard_split(text: str, max_tokens: int) -> List[str]:
+        """경계가 없는 긴 텍스트를 글자 수 기준으로 분할"""
+        tokens = max(token_optimizer.estimate_tokens(text), 1)
+        chars_per_chunk = max(int(len(text) * max_tokens / tokens), 1)
+        return [text[i:i + chars_per_chunk] for i in range(0, len(text), chars_per_chunk)]
+
+    @staticmethod
+    def _pack(units: List[str], max_tokens: int) -> List[str]:
+        """작은 조각을 예산 이내로 순서대로 묶음"""
+        chunks = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for unit in units:
+            unit_tokens = token_optimizer.estimate_tokens(unit)
+            if current and current_tokens + unit_tokens > max_tokens:
+                chunks.append("".join(current))
+                current, current_tokens = [], 0
+
+            current.append(unit)
+            current_tokens += unit_tokens
+
+        if current:
+            chunks.append("".join(current))
+
+        return [chunk for chunk in chunks if chunk.strip()]
+
+
+# 전역 인스턴스
+document_chunker = DocumentChunker()
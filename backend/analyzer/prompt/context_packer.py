@@ -0,0 +1,244 @@
+"""
+컨텍스트 패킹
+요구사항 키워드(Aho-Corasick) + BM25 점수로 섹션을 선별하여 토큰 예산을 채움
+"""
+import math
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Tuple
+from backend.analyzer.prompt.chunker import document_chunker
+from backend.analyzer.prompt.optimizer import token_optimizer
+
+
+# 요구사항 키워드 사전 (키워드: 가중치)
+REQUIREMENT_LEXICON: Dict[str, float] = {
+    # 요구사항/과업 범위
+    "요구사항": 2.0, "과업범위": 2.0, "과업 범위": 2.0, "과업내용": 2.0, "과업 내용": 2.0,
+    "제안요청": 1.5, "세부내용": 1.2, "요구내용": 1.5, "요구 내용": 1.5,
+    # 납품/성능/보안/품질
+    "납품": 1.5, "산출물": 1.2, "성능": 1.5, "보안": 1.5, "품질": 1.2, "규격": 1.2, "사양": 1.2,
+    "기능": 1.0, "인터페이스": 1.0, "데이터": 0.8, "테스트": 1.0, "시험": 0.8,
+    "유지보수": 1.0, "하자보수": 1.0, "교육": 0.8, "기술지원": 1.0, "인력": 1.0,
+    # 사업 개요/평가
+    "사업명": 1.5, "사업기간": 1.5, "사업 기간": 1.5, "사업예산": 1.5, "사업비": 1.5,
+    "추진배경": 1.0, "사업목적": 1.0, "평가": 1.0, "배점": 1.2,
+    # 요구사항 고유번호 접두어 (공공 RFP 표준)
+    "SFR": 2.0, "ECR": 2.0, "PER": 2.0, "SIR": 2.0, "DAR": 2.0, "TER": 2.0,
+    "SER": 2.0, "QUR": 2.0, "COR": 2.0, "PMR": 2.0, "PSR": 2.0,
+}
+
+# 선택되지 않은 구간을 표시하는 구분자
+ELISION_MARKER = "\n...(중략)...\n"
+
+
+class AhoCorasick:
+    """다중 키워드 동시 검색 오토마톤 (문서 1회 스캔)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        오토마톤 생성
+
+        Args:
+            keywords: 검색할 키워드 목록
+        """
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for keyword in dict.fromkeys(keywords):
+            if keyword:
+                self._add(keyword)
+        self._build()
+
+    def _add(self, keyword: str):
+        """트라이에 키워드 추가"""
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+
+        self._output[state] += (len(self.keywords),)
+        self.keywords.append(keyword)
+
+    def _build(self):
+        """실패 링크 계산 (BFS)"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fallback = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = fallback if fallback != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int]]:
+        """
+        텍스트의 키워드 매칭 위치
+
+        Returns:
+            (매칭 끝 위치, 키워드 인덱스) 이터레이터
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for keyword_index in output[state]:
+                    yield pos, keyword_index
+
+
+class ContextPacker:
+    """섹션 단위 관련도 기반 컨텍스트 패킹 클래스"""
+
+    # BM25 파라미터
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, lexicon: Dict[str, float] = None):
+        """
+        패커 초기화
+
+        Args:
+            lexicon: 키워드 사전 (키워드: 가중치)
+        """
+        self.lexicon = dict(lexicon or REQUIREMENT_LEXICON)
+        self._automaton = AhoCorasick(self.lexicon)
+
+    def build_index(self, text: str, keywords: List[str] = None, max_section_tokens: int = None) -> List[Dict]:
+        """
+        문서를 섹션으로 나누고 섹션별 토큰 수/관련도 점수 계산 (문서 1회 스캔)
+
+        Args:
+            text: 문서 텍스트
+            keywords: 추가 우선순위 키워드 (사전에 없으면 가중치 1.0)
+            max_section_tokens: 섹션 최대 토큰 수 (초과 섹션은 더 작은 경계로 분할)
+
+        Returns:
+            [{"text", "tokens", "score"}, ...] (원문 순서)
+        """
+        sections = []
+        for section in document_chunker.split_sections(text):
+            if max_section_tokens and token_optimizer.estimate_tokens(section) > max_section_tokens:
+                sections.extend(document_chunker.split(section, max_section_tokens))
+            else:
+                sections.append(section)
+
+        if not sections:
+            return []
+
+        lexicon = self.lexicon
+        automaton = self._automaton
+        extra = [keyword for keyword in (keywords or []) if keyword and keyword not in lexicon]
+        if extra:
+            lexicon = {**lexicon, **{keyword: 1.0 for keyword in extra}}
+            automaton = AhoCorasick(lexicon)
+
+        # 섹션 시작 오프셋 (매칭 위치 → 섹션 번호)
+        starts = []
+        offset = 0
+        for section in sections:
+            starts.append(offset)
+            offset += len(section)
+
+        term_freqs: List[Dict[int, int]] = [{} for _ in sections]
+        for pos, keyword_index in automaton.iter_matches("".join(sections)):
+            freqs = term_freqs[bisect_right(starts, pos) - 1]
+            freqs[keyword_index] = freqs.get(keyword_index, 0) + 1
+
+        index = [
+            {"text": section, "tokens": token_optimizer.estimate_tokens(section), "score": 0.0}
+            for section in sections
+        ]
+        self._score_bm25(index, term_freqs, [lexicon[keyword] for keyword in automaton.keywords])
+        return index
+
+    def _score_bm25(self, index: List[Dict], term_freqs: List[Dict[int, int]], weights: List[float]):
+        """키워드 사전 전체를 질의로 하는 가중 BM25 점수 계산"""
+        total = len(index)
+        avg_length = sum(max(section["tokens"], 1) for section in index) / total
+
+        doc_freq: Dict[int, int] = {}
+        for freqs in term_freqs:
+            for keyword_index in freqs:
+                doc_freq[keyword_index] = doc_freq.get(keyword_index, 0) + 1
+
+        for section, freqs in zip(index, term_freqs):
+            length_norm = 1 - self.B + self.B * max(section["tokens"], 1) / avg_length
+            score = 0.0
+            for keyword_index, tf in freqs.items():
+                df = doc_freq[keyword_index]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                score += weights[keyword_index] * idf * tf * (self.K1 + 1) / (tf + self.K1 * length_norm)
+            section["score"] = score
+
+    def select(self, index: List[Dict], max_tokens: int) -> str:
+        """
+        점수가 높은 섹션부터 예산을 채운 뒤 원문 순서로 결합
+
+        Args:
+            index: build_index 결과
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            패킹된 텍스트 (생략 구간은 ELISION_MARKER로 표시)
+        """
+        marker_tokens = token_optimizer.estimate_tokens(ELISION_MARKER)
+
+        # 점수 내림차순, 동점이면 문서 앞쪽 우선 (사업 개요가 앞에 오는 RFP 구성)
+        order = sorted(range(len(index)), key=lambda i: (-index[i]["score"], i))
+        selected = set()
+        used = 0
+
+        for i in order:
+            cost = index[i]["tokens"] + marker_tokens
+            if used + cost <= max_tokens:
+                selected.add(i)
+                used += cost
+
+        parts = []
+        previous = -1
+        for i in sorted(selected):
+            if i != previous + 1:
+                parts.append(ELISION_MARKER)
+            parts.append(index[i]["text"])
+            previous = i
+
+        if previous != len(index) - 1 and parts:
+            parts.append(ELISION_MARKER)
+
+        return "".join(parts).strip()
+
+    def pack(self, text: str, max_tokens: int, keywords: List[str] = None) -> str:
+        """
+        토큰 예산에 맞게 관련도 높은 섹션만 원문 순서로 남김
+
+        Args:
+            text: 문서 텍스트
+            max_tokens: 최대 토큰 수
+            keywords: 추가 우선순위 키워드
+
+        Returns:
+            패킹된 텍스트 (예산 이내면 원문 그대로)
+        """
+        if token_optimizer.estimate_tokens(text) <= max_tokens:
+            return text
+
+        # 섹션 하나가 예산 대부분을 차지하지 않도록 분할 단위 제한
+        index = self.build_index(text, keywords, max_section_tokens=max(max_tokens // 8, 1))
+        return self.select(index, max_tokens)
+
+
+# 전역 인스턴스
+context_packer = ContextPacker()
@@ -0,0 +1,169 @@
+"""
+토큰 수 계산
+보정된 오프라인 추정기(섹션/청크별 예산)와 Gemini count_tokens 기반 문서 단위 계산기 제공
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+# 문자 종류별 특징 추출 (각각 정규식 1회 스캔, 매치 리스트를 만들지 않고 개수만 셈)
+_HANGUL_RE = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+_LATIN_WORD_RE = re.compile(r'[A-Za-z]+')
+_DIGIT_RE = re.compile(r'[0-9]')
+_SPACE_RE = re.compile(r'[^\S\n]')
+
+# 특징 이름 (보정 파일의 계수 순서)
+FEATURES = ("hangul", "latin_words", "latin_chars", "digits", "newlines", "spaces", "other")
+
+# 기본 계수 (보정 파일이 없을 때 사용, 1토큰 ≈ 한글 1.5자 / 영문 4자 기준에서 출발)
+DEFAULT_COEFFICIENTS = {
+    "hangul": 0.67,
+    "latin_words": 1.0,
+    "latin_chars": 0.05,
+    "digits": 1.0,
+    "newlines": 1.0,
+    "spaces": 0.0,
+    "other": 0.9,
+}
+
+
+class HeuristicTokenCounter:
+    """문자 종류별 선형 모델 기반 토큰 수 추정기 (오프라인, 보정 가능)"""
+
+    name = "heuristic"
+
+    def __init__(self, coefficients: Dict[str, float] = None, calibration_path: str = None):
+        """
+        추정기 초기화
+
+        Args:
+            coefficients: 특징별 계수 (없으면 보정 파일 또는 기본값)
+            calibration_path: 보정 파일 경로 (bench_token_counter.py 결과)
+        """
+        if coefficients is None:
+            coefficients = self._load_calibration(calibration_path or settings.TOKEN_CALIBRATION_PATH)
+
+        self.coefficients = {**DEFAULT_COEFFICIENTS, **(coefficients or {})}
+        self._weights = [self.coefficients[feature] for feature in FEATURES]
+
+    @staticmethod
+    def _load_calibration(path: str) -> Optional[Dict[str, float]]:
+        """보정 파일에서 계수 로드 (없거나 손상 시 None)"""
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            coefficients = {key: float(value) for key, value in data["coefficients"].items() if key in FEATURES}
+            logger.info(f"토큰 추정 보정값 로드: {path}")
+            return coefficients
+        except Exception as e:
+            logger.warning(f"토큰 추정 보정 파일 로드 실패: {str(e)}")
+            return None
+
+    @staticmethod
+    def features(text: str) -> List[int]:
+        """
+        텍스트의 문자 종류별 특징 벡터 계산
+
+        Returns:
+            FEATURES 순서의 개수 리스트
+        """
+        hangul = sum(1 for _ in _HANGUL_RE.finditer(text))
+        latin_words = latin_chars = 0
+        for match in _LATIN_WORD_RE.finditer(text):
+            latin_words += 1
+            latin_chars += match.end() - match.start()
+        digits = sum(1 for _ in _DIGIT_RE.finditer(text))
+        newlines = text.count("\n")
+        spaces = sum(1 for _ in _SPACE_RE.finditer(text))
+        other = len(text) - hangul - latin_chars - digits - newlines - spaces
+
+        return [hangul, latin_words, latin_chars, digits, newlines, spaces, other]
+
+    def count(self, text: str) -> int:
+        """
+        토큰 수 추정
+
+        Args:
+            text: 텍스트
+
+        Returns:
+            예상 토큰 수
+        """
+        if not text:
+            return 0
+        return int(sum(weight * value for weight, value in zip(self._weights, self.features(text))))
+
+
+class GeminiTokenCounter:
+    """
+    Gemini count_tokens 기반 문서 단위 토큰 계산기 (텍스트 해시 캐시, 실패 시 추정기로 대체)
+    호출마다 네트워크 요청이 발생하므로 섹션/청크별 예산 계산에는 쓰지 않고,
+    맵리듀스 전환처럼 문서 전체에 대한 판단에만 문서당 1회 사용
+    """
+
+    name = "gemini"
+
+    def __init__(self, fallback: HeuristicTokenCounter = None, cache_size: int = None):
+        """
+        계산기 초기화
+
+        Args:
+            fallback: API 실패 시 사용할 추정기
+            cache_size: 캐시할 최대 텍스트 수
+        """
+        self.fallback = fallback or HeuristicTokenCounter()
+        self.cache_size = cache_size or settings.TOKEN_COUNT_CACHE_SIZE
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        """텍스트 해시 (캐시 키)"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def count_async(self, text: str, backend) -> int:
+        """
+        토큰 수 계산 (백엔드의 count_tokens_async 사용, 요청자 키/속도 제한 적용)
+
+        Args:
+            text: 텍스트 (문서 또는 프롬프트 전체)
+            backend: LLMBackend 인스턴스
+
+        Returns:
+            토큰 수 (API 실패 시 추정값)
+        """
+        if not text:
+            return 0
+
+        key = self._hash(text)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        success, result = await backend.count_tokens_async(text)
+        if not success:
+            logger.warning(f"count_tokens 호출 실패, 추정값 사용: {result}")
+            return self.fallback.count(text)
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+
+# 전역 인스턴스 (섹션/청크별 예산은 항상 추정기, TOKEN_COUNTER=gemini이면 문서 전체 토큰 수만 document_token_counter로 계산)
+token_counter = HeuristicTokenCounter()
+document_token_counter = GeminiTokenCounter(fallback=token_counter)
@@ -2,92 +2,36 @@
 제안서 분석기
 Gemini API를 사용한 제안서 요약 및 분석
 """
+import asyncio
+import copy
 import json
-from typing import Dict, Any
-from backend.analyzer.schemas import AnalysisResult
-from backend.analyzer.gemini.client import create_client
-from backend.analyzer.gemini.request import create_request_handler
+import re
+import threading
+import time
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, get_origin
+from config.settings import settings
+from config.api_config import gemini_config
+from backend.analyzer.schemas import (
+    AnalysisResult, ChunkExtract, AnalysisOverview,
+    SummarySection, RequirementsSection, StrategySection, ResourceSection, TodoSection
+)
+from backend.analyzer.backends.base import LLMBackend, create_backend
+from backend.analyzer.gemini.response import response_parser
+from backend.analyzer.gemini.stream_parser import StructuredStreamParser
+from backend.analyzer.prompt.builder import prompt_builder
+from backend.analyzer.prompt.chunker import document_chunker
+from backend.analyzer.prompt.optimizer import token_optimizer
+from backend.analyzer.prompt.token_counter import document_token_counter
 from backend.utils.logger import logger
 from backend.utils.cache import analysis_cache
+from backend.utils.metrics import metrics
+from backend.utils.single_flight import single_flight
 
+# 구조화 분석 프롬프트/스키마 변경 시 올려서 이전 캐시를 무효화
+STRUCTURED_PROMPT_VERSION = "1"
 
-class ProposalAnalyzer:
-    """제안서 분석 클래스"""
-    
-    def __init__(self, api_key: str = None, use_cache: bool = True):
-        """
-        분석기 초기화
-        
-        Args:
-            api_key: Gemini API 키
-            use_cache: 캐싱 사용 여부
-        """
-        self.client = create_client(api_key)
-        self.request_handler = create_request_handler(self.client)
-        self.use_cache = use_cache
-    
-    def analyze_structured(self, document_text: str) -> tuple[bool, Dict | str]:
-        """
-        제안서 구조화 분석 (통합)
-        요약, 상세 분석(동적 요구사항), 수주 전략, To-Do 리스트를 한 번에 생성
-        """
-
-        try:
-            logger.info("제안서 구조화 분석 시작")
-            
-            # 캐시 확인
-            if self.use_cache:
-                cached = analysis_cache.get(document_text, "structured_analysis")
-                if cached:
-                    logger.info("캐시에서 구조화 분석 결과 반환")
-                    # 캐시된 데이터도 누락 필드 보완
-                    self._apply_field_completion(cached)
-                    return True, cached
-            
-            prompt = self._build_structured_analysis_prompt(document_text)
-            
-            # Gemini API 호출 (Structured Output)
-            generation_config = {
-                "response_mime_type": "application/json",
-                "response_schema": AnalysisResult
-            }
-            
-            success, response_text = self.request_handler.send(prompt, generation_config=generation_config)
-            
-            if not success:
-                return False, response_text
-            
-            # JSON 파싱
-            try:
-                parsed = json.loads(response_text)
-            except json.JSONDecodeError:
-                # 가끔 모델이 마크다운 코드 블록(```json ... ```)을 포함할 수 있음
-                import re
-                match = re.search(r'```json\s*({.*})\s*```', response_text, re.DOTALL)
-                if match:
-                    parsed = json.loads(match.group(1))
-                else:
-                    # 그냥 text일 수도 있음 (스키마 강제 실패 시)
-                    logger.error(f"JSON 파싱 실패. 원본 응답:\n{response_text}")
-                    return False, "AI 응답을 구조화된 데이터로 변환하는데 실패했습니다. (JSON Parsing Error)"
-
-            # 누락 필드 보완 적용
-            self._apply_field_completion(parsed)
-
-            # 캐시 저장
-            if self.use_cache:
-                analysis_cache.set(document_text, "structured_analysis", parsed)
-            
-            logger.info("제안서 구조화 분석 완료")
-            return True, parsed
-
-        except Exception as e:
-            logger.error(f"구조화 분석 중 오류: {str(e)}")
-            return False, f"분석 실패: {str(e)}"
-
-    def _build_structured_analysis_prompt(self, document_text: str) -> str:
-        """구조화 분석 프롬프트 생성"""
-        prompt = f"""
+# 구조화 분석 고정 지침 (문서 앞에 붙는 프롬프트 앞부분, 매 호출 동일하므로 컨텍스트 캐시 대상)
+STRUCTURED_ANALYSIS_INSTRUCTIONS = """
 당신은 대한민국 최고의 공공 제안서 분석 전문가이자 수주 컨설턴트입니다.
 다음 제안요청서(RFP)를 정밀 분석하여, 수주를 위한 핵심 정보를 추출하고 전략을 수립해주세요.
 
@@ -161,10 +105,870 @@ class ProposalAnalyzer:
     - Role: "Backend 개발자", Count: 2, Skills: ["Python", "FastAPI", "PostgreSQL"], Reason: "분석 엔진 및 API 서버 구축"
 
 
+[제안요청서 내용]
+"""
+
+# 섹션별 분할 분석: 섹션 이름 -> (응답 스키마, 작성 지침)
+FANOUT_SECTIONS = {
+    "summary": (SummarySection, """
+1. **종합 요약(overview)**: 사업의 배경, 핵심 내용, 중요성을 3~5문장의 스토리텔링 형식으로 작성하세요.
+2. **사업 목적(purpose)**: 이 사업이 왜 발주되었는지, 최종적으로 무엇을 달성하고자 하는지 명확히 기술하세요.
+3. **핵심 키워드(key_keywords)**: 이 사업을 대표하는 핵심 키워드를 반드시 3~5개 추출하세요.
+4. **발주처 중점 포인트(client_priorities)**: 발주처가 가장 중요시하는 요구사항 또는 성공 기준을 반드시 3~5개 도출하세요.
+5. 사업명, 예산, 기간, 기대효과는 원문 표현 그대로 추출하고, 없으면 '내용 없음'으로 적으세요.
+6. total_requirements_count는 0으로 두세요. (요구사항은 별도로 집계됩니다)
+"""),
+    "requirements": (RequirementsSection, """
+1. "요구사항", "과업범위", "제안 내용", "납품 사양", "기술 규격", "성능 기준" 등 **모든 관련 섹션**의 요구사항을 빠짐없이 추출하세요.
+2. 기술명, 버전, 수치, 기준을 반드시 포함하고 "시스템 구축" 같은 추상적 표현은 구체적으로 풀어쓰세요.
+3. 같은 내용을 다른 표현으로 반복하지 말고, 유사 항목은 상세 정보를 모두 포함하여 하나로 통합하세요.
+4. 제안서의 카테고리 명칭과 순서, 용어를 그대로 사용하세요. 임의로 통합하거나 분리하지 마세요.
+"""),
+    "strategy": (StrategySection, """
+1. **앵커 포인트(anchor_points)**: 발주처 핵심 요구사항을 충족하는 구체적 방안 3~5개
+2. **차별화(differentiation)**: 경쟁사 대비 강점 및 경쟁 우위 3~5개
+3. **리스크 대응(risk_mitigation)**: 예상 리스크와 대응 방안 3~5개
+4. **수주 전략(win_strategy)**과 참고할 유사 사업 레퍼런스(references)를 제시하세요.
+"""),
+    "resource_requirements": (ResourceSection, """
+1. 프로젝트 성공을 위해 필요한 핵심 인력 구성을 분석하세요.
+2. 역할(role), 필요 인원(count), 필수 핵심 기술(required_skills), 필요 사유(reason)를 명시하세요.
+   - 예: Role "PM (프로젝트 관리자)", Count 1, Skills ["PMP", "감리 대응", "공공 사업 경험"], Reason "전체 사업 총괄 및 위험 관리"
+"""),
+    "todo_list": (TodoSection, """
+1. 이 제안서를 작성/제출하기 위해 실무자가 바로 수행할 수 있는 구체적인 할 일을 8개 내외로 작성하세요.
+2. 제출 서류, 평가 항목 대응, 기술 검토, 일정 확인 등 RFP 내용에 근거한 작업으로 작성하세요.
+"""),
+}
+
+# 분석 세션 후속 요청 유형 (JSON으로 응답하는 템플릿은 파싱 결과도 함께 반환)
+FOLLOWUP_MODES = ("summary", "strategy", "references", "custom")
+FOLLOWUP_JSON_MODES = ("summary", "references")
+
+# 워커 스레드별 이벤트 루프 (동기 경로에서 asyncio 분석을 실행할 때 재사용)
+_thread_loops = threading.local()
+
+
+def _run_in_thread_loop(coro):
+    """
+    현재 스레드 전용 이벤트 루프에서 코루틴 실행
+    asyncio.run은 호출마다 새 루프를 만들고 닫으므로, 루프별로 생성되는 grpc.aio 채널/클라이언트가
+    작업마다 쌓이지 않도록 스레드당 하나의 루프를 계속 사용
+    """
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+    return loop.run_until_complete(coro)
+
+
+class ProposalAnalyzer:
+    """제안서 분석 클래스"""
+    
+    def __init__(self, api_key: str = None, use_cache: bool = True, backend: LLMBackend = None):
+        """
+        분석기 초기화
+        
+        Args:
+            api_key: Gemini API 키
+            use_cache: 캐싱 사용 여부
+            backend: 모델 호출 백엔드 (없으면 LLM_BACKEND 설정으로 생성)
+        """
+        self.backend = backend or create_backend(api_key)
+        self.use_cache = use_cache
+        # 직전 분석의 모델 호출 단계별 소요시간 (초)
+        self.last_phase_timings: Dict[str, float] = {}
+        # 마지막 구조화 응답 디코딩 보고서 (스키마 검증 여부, 잘린 응답 복구 내역)
+        self.last_decode_report: Dict[str, Any] = {}
+    
+    def analyze_structured(self, document_text: str) -> tuple[bool, Dict | str]:
+        """
+        제안서 구조화 분석 (통합)
+        요약, 상세 분석(동적 요구사항), 수주 전략, To-Do 리스트를 한 번에 생성
+        """
+
+        try:
+            logger.info("제안서 구조화 분석 시작")
+            
+            # 캐시 키(문서 전체 해시)는 여기서 한 번만 계산하여 조회/단일 실행/저장에 함께 사용
+            cache_key = self._structured_cache_key(document_text)
+            cached = self._get_cached_structured(document_text, cache_key)
+            if cached:
+                return True, cached
+            
+            if not self.use_cache:
+                return self._run_structured(document_text)
+            
+            # 같은 문서의 분석이 진행 중이면 새로 호출하지 않고 그 결과를 함께 받음
+            wait_start = time.perf_counter()
+            result, shared = single_flight.do(cache_key, self._run_structured_flight, document_text, cache_key)
+            if shared:
+                return self._coalesced_result(result, wait_start)
+            return result
+
+        except Exception as e:
+            logger.error(f"구조화 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    def _run_structured_flight(self, document_text: str, cache_key: str) -> tuple[bool, Dict | str]:
+        """단일 실행 주도자: 직전 요청이 방금 캐시를 채웠을 수 있으므로 다시 확인 후 분석"""
+        cached = self._get_cached_structured(document_text, cache_key)
+        if cached:
+            return True, cached
+        return self._run_structured(document_text, cache_key)
+
+    def _run_structured(self, document_text: str, cache_key: str = None) -> tuple[bool, Dict | str]:
+        """캐시를 거치지 않는 구조화 분석 (모델 호출, cache_key가 있으면 결과 저장에 사용)"""
+
+        try:
+            # 모델 컨텍스트를 초과하는 대용량 문서는 맵리듀스 분석
+            if self._should_map_reduce(document_text):
+                return _run_in_thread_loop(self._map_reduce_async(document_text, cache_key))
+            
+            if settings.ANALYSIS_FANOUT_ENABLED:
+                return _run_in_thread_loop(self._fanout_async(document_text, cache_key))
+            
+            prompt = self._build_structured_analysis_prompt(document_text)
+            
+            # Gemini API 호출 (Structured Output)
+            call_start = time.perf_counter()
+            success, response_text, meta = self.backend.send_detailed(
+                prompt,
+                generation_config=self._structured_generation_config(),
+                prefix=STRUCTURED_ANALYSIS_INSTRUCTIONS
+            )
+            self.last_phase_timings = {"structured": round(time.perf_counter() - call_start, 3)}
+            
+            if not success:
+                return False, response_text
+            
+            return self._finalize_structured(document_text, response_text, meta.get("finish_reason"), cache_key)
+
+        except Exception as e:
+            logger.error(f"구조화 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    async def analyze_structured_async(self, document_text: str) -> tuple[bool, Dict | str]:
+        """
+        제안서 구조화 분석 (asyncio)
+        analyze_structured와 동일한 결과를 반환하되 모델 호출을 await로 처리
+        """
+
+        try:
+            logger.info("제안서 구조화 분석 시작 (async)")
+            
+            cache_key = self._structured_cache_key(document_text)
+            cached = self._get_cached_structured(document_text, cache_key)
+            if cached:
+                return True, cached
+            
+            return await self._analyze_uncached_async(document_text, cache_key)
+
+        except Exception as e:
+            logger.error(f"구조화 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    async def _analyze_uncached_async(self, document_text: str, cache_key: Optional[str]) -> tuple[bool, Dict | str]:
+        """캐시 미스 이후 분석 (같은 문서의 분석이 진행 중이면 새로 호출하지 않고 그 결과를 함께 받음)"""
+        if not self.use_cache:
+            return await self._run_structured_async(document_text)
+        
+        wait_start = time.perf_counter()
+        result, shared = await single_flight.do_async(
+            cache_key, self._run_structured_flight_async, document_text, cache_key
+        )
+        if shared:
+            return self._coalesced_result(result, wait_start)
+        return result
+
+    async def _run_structured_flight_async(self, document_text: str, cache_key: str) -> tuple[bool, Dict | str]:
+        """단일 실행 주도자 (asyncio): 캐시 재확인 후 분석"""
+        cached = self._get_cached_structured(document_text, cache_key)
+        if cached:
+            return True, cached
+        return await self._run_structured_async(document_text, cache_key)
+
+    async def _run_structured_async(self, document_text: str, cache_key: str = None) -> tuple[bool, Dict | str]:
+        """캐시를 거치지 않는 구조화 분석 (asyncio, cache_key가 있으면 결과 저장에 사용)"""
+
+        try:
+            # 모델 컨텍스트를 초과하는 대용량 문서는 맵리듀스 분석
+            if await self._should_map_reduce_async(document_text):
+                return await self._map_reduce_async(document_text, cache_key)
+            
+            if settings.ANALYSIS_FANOUT_ENABLED:
+                return await self._fanout_async(document_text, cache_key)
+            
+            prompt = self._build_structured_analysis_prompt(document_text)
+            
+            # Gemini API 호출 (Structured Output)
+            call_start = time.perf_counter()
+            success, response_text, meta = await self.backend.async_send_detailed(
+                prompt,
+                generation_config=self._structured_generation_config(),
+                prefix=STRUCTURED_ANALYSIS_INSTRUCTIONS
+            )
+            self.last_phase_timings = {"structured": round(time.perf_counter() - call_start, 3)}
+            
+            if not success:
+                return False, response_text
+            
+            return await self._finalize_structured_async(
+                document_text, response_text, meta.get("finish_reason"), cache_key
+            )
+
+        except Exception as e:
+            logger.error(f"구조화 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    async def analyze_structured_stream(self, document_text: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        제안서 구조화 분석 (스트리밍)
+        모델 응답을 스트리밍으로 받아 섹션이 완성되는 즉시 이벤트로 반환하고, 마지막에 검증된 전체 결과를 반환
+        
+        Yields:
+            (이벤트명, 데이터)
+            - ("section", {"name", "value"}): 최상위 섹션 완료 (summary, requirements, strategy, ...)
+            - ("requirement", {"index", "value"}): 요구사항 카테고리 1개 완료
+            - ("result", AnalysisResult dict): 최종 결과 (누락 필드 보완 및 스키마 검증 완료)
+            - ("error", {"error"}): 분석 실패
+        """
+        logger.info("제안서 구조화 분석 시작 (stream)")
+        
+        try:
+            # 캐시 히트, 대용량(맵리듀스), 섹션별 분할 분석은 완료 후 섹션을 한 번에 전달
+            cache_key = self._structured_cache_key(document_text)
+            cached = self._get_cached_structured(document_text, cache_key)
+            if cached or await self._should_map_reduce_async(document_text) or settings.ANALYSIS_FANOUT_ENABLED:
+                if cached:
+                    success, result = True, cached
+                else:
+                    success, result = await self._analyze_uncached_async(document_text, cache_key)
+                
+                if not success:
+                    yield "error", {"error": str(result)}
+                    return
+                
+                for name, value in result.items():
+                    yield "section", {"name": name, "value": value}
+                yield "result", self._validate_result(result)
+                return
+            
+            parser = StructuredStreamParser(item_fields=["requirements"])
+            prompt = self._build_structured_analysis_prompt(document_text)
+            
+            call_start = time.perf_counter()
+            first_chunk_at = None
+            meta: Dict[str, Any] = {}
+            async for chunk in self.backend.stream_async(
+                prompt,
+                generation_config=self._structured_generation_config(),
+                prefix=STRUCTURED_ANALYSIS_INSTRUCTIONS,
+                meta=meta
+            ):
+                if first_chunk_at is None:
+                    first_chunk_at = round(time.perf_counter() - call_start, 3)
+                
+                for event in parser.feed(chunk):
+                    if event[0] == "item":
+                        yield "requirement", {"index": event[3], "value": event[2]}
+                    else:
+                        yield "section", {"name": event[1], "value": event[2]}
+            
+            self.last_phase_timings = {
+                "first_chunk": first_chunk_at or 0.0,
+                "structured": round(time.perf_counter() - call_start, 3),
+            }
+            
+            success, result = await self._finalize_structured_async(
+                document_text, parser.text, meta.get("finish_reason"), cache_key
+            )
+            if not success:
+                yield "error", {"error": result}
+                return
+            
+            # 이어쓰기로 채운 섹션은 스트림 도중 전달되지 않았으므로 결과 전에 전달
+            for name in self.last_decode_report.get("continued", []):
+                yield "section", {"name": name, "value": result.get(name)}
+            
+            # 디코딩 단계에서 이미 스키마 검증을 통과했으면 다시 검증하지 않음
+            yield "result", result if self.last_decode_report.get("valid") else self._validate_result(result)
+        
+        except Exception as e:
+            logger.error(f"스트리밍 분석 중 오류: {str(e)}")
+            yield "error", {"error": f"분석 실패: {str(e)}"}
+
+    @staticmethod
+    def _validate_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """AnalysisResult 스키마 검증 후 dict 반환 (검증 실패 시 ValidationError)"""
+        return AnalysisResult.model_validate(result).model_dump()
+
+    async def followup_async(
+        self,
+        document_text: str,
+        analysis: Dict[str, Any],
+        mode: str,
+        instruction: str = "",
+        history: List[Dict[str, str]] = None
+    ) -> tuple[bool, Dict | str]:
+        """
+        분석 세션 후속 요청
+        원문 + 1차 분석 결과는 매 요청 동일한 앞부분(prefix)으로 보내 컨텍스트 캐시로 재사용하고,
+        이전 후속 요청 기록과 이번 요청만 가변 부분으로 전송
+        
+        Args:
+            document_text: 세션의 후속 요청용 문서 텍스트 (대용량 문서는 세션을 열 때 이미 압축됨)
+            analysis: 세션의 1차 분석 결과
+            mode: 요청 유형 (summary, strategy, references, custom)
+            instruction: 사용자 추가 지시
+            history: 이전 후속 요청 [{"request", "reply"}]
+        
+        Returns:
+            (성공 여부, {"mode", "content", "data"} 또는 에러 메시지)
+        """
+        context = prompt_builder.build_session_context(
+            document_text, json.dumps(analysis, ensure_ascii=False, indent=2)
+        )
+        prompt = prompt_builder.build_followup_prompt(mode, instruction, history)
+        if not context or not prompt:
+            return False, "후속 요청 프롬프트를 생성할 수 없습니다."
+        
+        # JSON 형식을 요구하는 템플릿은 JSON 모드로 요청
+        json_mode = mode in FOLLOWUP_JSON_MODES
+        call_start = time.perf_counter()
+        success, response_text = await self.backend.async_send(
+            prompt,
+            generation_config={"response_mime_type": "application/json"} if json_mode else None,
+            prefix=context
+        )
+        self.last_phase_timings = {"followup": round(time.perf_counter() - call_start, 3)}
+        
+        if not success:
+            return False, response_text
+        
+        data = self._parse_json_response(response_text) if json_mode else None
+        logger.info(f"후속 요청 완료: {mode}")
+        return True, {"mode": mode, "content": response_text, "data": data}
+
+    async def analyze_fanout_async(self, document_text: str) -> tuple[bool, Dict | str]:
+        """
+        제안서 섹션별 분할 분석
+        요약/요구사항/전략/인력/To-Do를 독립된 호출로 동시에 생성하여 AnalysisResult 형태로 조립
+        (호출마다 문서 전체를 입력하므로 입력 토큰은 섹션 수만큼 늘어남)
+        """
+        cache_key = self._structured_cache_key(document_text)
+        cached = self._get_cached_structured(document_text, cache_key)
+        if cached:
+            return True, cached
+        return await self._fanout_async(document_text, cache_key)
+
+    async def _fanout_async(self, document_text: str, cache_key: str = None) -> tuple[bool, Dict | str]:
+        """섹션별 분할 분석 본체 (캐시 조회는 호출자가 수행)"""
+
+        try:
+            logger.info(f"섹션별 분할 분석 시작: {len(FANOUT_SECTIONS)}개 호출 (동시 실행 {settings.ANALYSIS_FANOUT_CONCURRENCY}개)")
+            semaphore = asyncio.Semaphore(settings.ANALYSIS_FANOUT_CONCURRENCY)
+            timings: Dict[str, float] = {}
+            
+            async def generate(name: str):
+                schema, instructions = FANOUT_SECTIONS[name]
+                async with semaphore:
+                    call_start = time.perf_counter()
+                    success, response_text = await self.backend.async_send(
+                        self._build_section_prompt(document_text, instructions),
+                        generation_config={
+                            "response_mime_type": "application/json",
+                            "response_schema": schema
+                        }
+                    )
+                    timings[name] = round(time.perf_counter() - call_start, 3)
+                return success, response_text
+            
+            total_start = time.perf_counter()
+            results = await asyncio.gather(*(generate(name) for name in FANOUT_SECTIONS))
+            timings["total"] = round(time.perf_counter() - total_start, 3)
+            self.last_phase_timings = timings
+            logger.info(f"섹션별 분할 분석 소요시간: {timings}")
+            
+            parsed: Dict[str, Any] = {}
+            for (name, (schema, _)), (success, response_text) in zip(FANOUT_SECTIONS.items(), results):
+                if not success:
+                    return False, f"{name} 분석 실패: {response_text}"
+                
+                section = self._parse_json_response(response_text, schema)
+                if section is None or name not in section:
+                    return False, f"{name} 분석 결과를 구조화된 데이터로 변환하는데 실패했습니다. (JSON Parsing Error)"
+                parsed[name] = section[name]
+            
+            parsed["summary"]["total_requirements_count"] = sum(
+                len(category.get("items") or []) for category in parsed["requirements"]
+            )
+            
+            # AnalysisResult 필드 순서로 조립
+            parsed = {field: parsed[field] for field in AnalysisResult.model_fields}
+            return self._finalize_parsed(document_text, parsed, cache_key=cache_key)
+
+        except Exception as e:
+            logger.error(f"섹션별 분할 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    @metrics.timed("analysis.prompt_build")
+    def _build_section_prompt(self, document_text: str, instructions: str) -> str:
+        """섹션별 분할 분석 프롬프트 생성"""
+        return f"""
+당신은 대한민국 최고의 공공 제안서 분석 전문가이자 수주 컨설턴트입니다.
+다음 제안요청서(RFP)를 정밀 분석하여 아래 항목만 작성해주세요. 모든 내용은 제안요청서에 근거해야 합니다.
+
+[작성 지침]
+{instructions}
 [제안요청서 내용]
 {document_text}
 """
-        return prompt
+
+    def _structured_cache_key(self, document_text: str) -> Optional[str]:
+        """구조화 분석 캐시 키 (단일 실행 키로도 사용, 캐시 미사용 시 None)"""
+        if not self.use_cache:
+            return None
+        return analysis_cache.make_key(
+            document_text, "structured_analysis", STRUCTURED_PROMPT_VERSION, self.backend.name
+        )
+
+    def _coalesced_result(self, result: tuple[bool, Dict | str], wait_start: float) -> tuple[bool, Dict | str]:
+        """공유받은 결과 반환 (호출자별로 수정할 수 있도록 복사)"""
+        self.last_phase_timings = {"coalesced_wait": round(time.perf_counter() - wait_start, 3)}
+        return copy.deepcopy(result)
+
+    @metrics.timed("analysis.cache_lookup")
+    def _get_cached_structured(self, document_text: str, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """캐시된 구조화 분석 결과 조회 (cache_key: _structured_cache_key 결과)"""
+        self.last_phase_timings = {}
+        if not self.use_cache:
+            return None
+        
+        cached = analysis_cache.get(
+            document_text, "structured_analysis", STRUCTURED_PROMPT_VERSION, self.backend.name, cache_key=cache_key
+        )
+        if cached:
+            logger.info("캐시에서 구조화 분석 결과 반환")
+            # 캐시된 데이터도 누락 필드 보완
+            self._apply_field_completion(cached)
+        return cached
+
+    @staticmethod
+    def _structured_generation_config() -> Dict[str, Any]:
+        """구조화 출력(JSON 스키마) 생성 설정"""
+        return {
+            "response_mime_type": "application/json",
+            "response_schema": AnalysisResult
+        }
+
+    def _finalize_structured(
+        self, document_text: str, response_text: str, finish_reason: str = None, cache_key: str = None
+    ) -> tuple[bool, Dict | str]:
+        """모델 응답 디코딩(AnalysisResult 검증), 잘린 응답 이어쓰기, 누락 필드 보완 및 캐시 저장"""
+        parsed = self._decode_structured(response_text)
+        if parsed is None:
+            return False, "AI 응답을 구조화된 데이터로 변환하는데 실패했습니다. (JSON Parsing Error)"
+        
+        pending = self._truncated_sections(finish_reason)
+        continuation_start = time.perf_counter()
+        for _ in range(gemini_config.MAX_CONTINUATIONS):
+            if not pending:
+                break
+            results = [
+                self.backend.send_detailed(
+                    self._build_continuation_prompt(document_text, name, parsed),
+                    generation_config={"response_mime_type": "application/json", "response_schema": FANOUT_SECTIONS[name][0]},
+                    prefix=STRUCTURED_ANALYSIS_INSTRUCTIONS
+                )
+                for name in pending
+            ]
+            pending = self._stitch_continuations(parsed, pending, results)
+        
+        return self._complete_structured(document_text, parsed, pending, continuation_start, cache_key)
+
+    async def _finalize_structured_async(
+        self, document_text: str, response_text: str, finish_reason: str = None, cache_key: str = None
+    ) -> tuple[bool, Dict | str]:
+        """_finalize_structured의 asyncio 버전 (잘린 섹션들의 이어쓰기를 동시에 요청)"""
+        parsed = self._decode_structured(response_text)
+        if parsed is None:
+            return False, "AI 응답을 구조화된 데이터로 변환하는데 실패했습니다. (JSON Parsing Error)"
+        
+        pending = self._truncated_sections(finish_reason)
+        continuation_start = time.perf_counter()
+        for _ in range(gemini_config.MAX_CONTINUATIONS):
+            if not pending:
+                break
+            results = await asyncio.gather(*(
+                self.backend.async_send_detailed(
+                    self._build_continuation_prompt(document_text, name, parsed),
+                    generation_config={"response_mime_type": "application/json", "response_schema": FANOUT_SECTIONS[name][0]},
+                    prefix=STRUCTURED_ANALYSIS_INSTRUCTIONS
+                )
+                for name in pending
+            ))
+            pending = self._stitch_continuations(parsed, pending, results)
+        
+        return self._complete_structured(document_text, parsed, pending, continuation_start, cache_key)
+
+    @metrics.timed("analysis.decode")
+    def _decode_structured(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """구조화 응답 디코딩 (잘린 응답은 완결된 부분까지 복구, 실패 시 None)"""
+        success, parsed, report = response_parser.decode(response_text, AnalysisResult)
+        report["continued"] = []
+        report["incomplete"] = []
+        self.last_decode_report = report
+        if not success or not isinstance(parsed, dict):
+            return None
+        return parsed
+
+    def _truncated_sections(self, finish_reason: Optional[str]) -> List[str]:
+        """출력 토큰 한도로 잘려 받지 못했거나 일부만 받은 섹션 (이어쓰기 대상)"""
+        report = self.last_decode_report
+        if finish_reason != "MAX_TOKENS" and not report["repaired"]:
+            return []
+        
+        names = [
+            name for name in FANOUT_SECTIONS
+            if name in report["missing"] or name == report["truncated_field"]
+        ]
+        if names:
+            logger.warning(f"출력 토큰 한도로 잘린 구조화 응답 이어쓰기: {', '.join(names)}")
+        return names
+
+    @metrics.timed("analysis.prompt_build")
+    def _build_continuation_prompt(self, document_text: str, name: str, parsed: Dict[str, Any]) -> str:
+        """
+        잘린 섹션 이어쓰기 프롬프트 (분석 지침 앞부분은 첫 호출과 동일하게 컨텍스트 캐시 사용)
+        요구사항은 이미 받은 카테고리를 알려주고 마지막 카테고리부터 이어서 작성하도록 요청
+        """
+        _, instructions = FANOUT_SECTIONS[name]
+        seed = ""
+        categories = [
+            category.get("category") for category in parsed.get("requirements") or []
+            if isinstance(category, dict) and category.get("category")
+        ]
+        if name == "requirements" and categories:
+            seed = f"""
+이미 작성된 요구사항 카테고리: {", ".join(categories)}
+마지막 카테고리 "{categories[-1]}"는 중간에 끊겼으므로 이 카테고리부터 이어서 작성하고, 그 앞의 카테고리는 다시 작성하지 마세요.
+"""
+        return f"""{self._build_structured_analysis_prompt(document_text)}
+[이어쓰기]
+이전 응답이 출력 길이 제한으로 중간에 끊겼습니다. 위 분석 지침 중 아래 항목만 작성하세요.
+{instructions}{seed}"""
+
+    def _stitch_continuations(
+        self, parsed: Dict[str, Any], names: List[str], results: List[tuple]
+    ) -> List[str]:
+        """
+        이어쓰기 응답을 기존 결과에 병합
+        
+        Returns:
+            다음 이어쓰기가 필요한 섹션 (요청 실패 또는 이어쓰기 응답도 잘린 경우)
+        """
+        pending = []
+        for name, (success, response_text, meta) in zip(names, results):
+            if not success:
+                logger.warning(f"{name} 이어쓰기 실패: {response_text}")
+                pending.append(name)
+                continue
+            
+            decoded, section, report = response_parser.decode(response_text, FANOUT_SECTIONS[name][0])
+            if not decoded or not isinstance(section, dict) or name not in section:
+                pending.append(name)
+                continue
+            
+            value = section[name]
+            if name == "requirements" and parsed.get("requirements"):
+                # 이미 받은 카테고리 뒤에 이어 붙이고, 다시 작성된 마지막 카테고리는 항목 단위로 중복 제거
+                value, _ = self._merge_chunk_extracts([{"requirements": parsed["requirements"]}, {"requirements": value}])
+            parsed[name] = value
+            
+            if name not in self.last_decode_report["continued"]:
+                self.last_decode_report["continued"].append(name)
+            if meta.get("finish_reason") == "MAX_TOKENS" or report["repaired"]:
+                pending.append(name)
+        return pending
+
+    def _complete_structured(
+        self,
+        document_text: str,
+        parsed: Dict[str, Any],
+        pending: List[str],
+        continuation_start: float,
+        cache_key: str = None
+    ) -> tuple[bool, Dict]:
+        """이어쓰기 결과 정리 후 누락 필드 보완 및 캐시 저장"""
+        report = self.last_decode_report
+        report["incomplete"] = pending
+        
+        if report["continued"]:
+            continuation_seconds = time.perf_counter() - continuation_start
+            self.last_phase_timings["continuation"] = round(continuation_seconds, 3)
+            metrics.record("analysis.continuation", continuation_seconds)
+            # 섹션별 이어쓰기에서는 요약의 요구사항 수를 집계하지 않으므로 다시 계산
+            summary = parsed.get("summary")
+            if isinstance(summary, dict):
+                summary["total_requirements_count"] = sum(
+                    len(category.get("items") or []) for category in parsed.get("requirements") or []
+                    if isinstance(category, dict)
+                )
+            logger.info(f"잘린 구조화 응답 이어쓰기 완료: {report['continued']} (미완료 {pending})")
+        
+        # 받지 못한 목록 필드는 빈 목록으로 두어 응답 형태 유지 (객체 필드는 누락 필드 보완 단계에서 채움)
+        for name, field in AnalysisResult.model_fields.items():
+            if name not in parsed and get_origin(field.annotation) is list:
+                parsed[name] = []
+        
+        # 이어쓰기로도 채우지 못한 불완전한 결과는 캐시하지 않음 (다음 요청에서 다시 생성)
+        complete = not pending and (not report["repaired"] or bool(report["continued"]))
+        return self._finalize_parsed(document_text, parsed, cache=complete, cache_key=cache_key)
+
+    def _finalize_parsed(
+        self, document_text: str, parsed: Dict[str, Any], cache: bool = True, cache_key: str = None
+    ) -> tuple[bool, Dict]:
+        """누락 필드 보완 및 캐시 저장 (cache_key가 있으면 문서를 다시 해시하지 않음)"""
+        # 누락 필드 보완 적용
+        self._apply_field_completion(parsed)
+
+        # 캐시 저장
+        if self.use_cache and cache:
+            analysis_cache.set(
+                document_text, "structured_analysis", parsed, STRUCTURED_PROMPT_VERSION, self.backend.name,
+                cache_key=cache_key
+            )
+        
+        logger.info("제안서 구조화 분석 완료")
+        return True, parsed
+
+    @staticmethod
+    @metrics.timed("analysis.decode")
+    def _parse_json_response(response_text: str, schema: type = None) -> Optional[Dict[str, Any]]:
+        """모델 JSON 응답 디코딩 (스키마 검증 및 잘린 응답 복구 포함, 실패 시 None)"""
+        success, data, _ = response_parser.decode(response_text, schema)
+        return data if success and isinstance(data, dict) else None
+
+    @staticmethod
+    def _should_map_reduce(document_text: str) -> bool:
+        """맵리듀스 분석 대상 여부 (추정 토큰 수가 임계값 초과)"""
+        if not settings.ANALYSIS_MAP_REDUCE_ENABLED:
+            return False
+        return token_optimizer.estimate_tokens(document_text) > settings.ANALYSIS_MAP_REDUCE_THRESHOLD_TOKENS
+
+    async def _should_map_reduce_async(self, document_text: str) -> bool:
+        """맵리듀스 분석 대상 여부 (TOKEN_COUNTER=gemini이면 문서 전체를 count_tokens로 1회 계산)"""
+        if not settings.ANALYSIS_MAP_REDUCE_ENABLED:
+            return False
+        if settings.TOKEN_COUNTER.lower() != "gemini":
+            return self._should_map_reduce(document_text)
+        tokens = await document_token_counter.count_async(document_text, self.backend)
+        return tokens > settings.ANALYSIS_MAP_REDUCE_THRESHOLD_TOKENS
+
+    async def analyze_map_reduce_async(self, document_text: str) -> tuple[bool, Dict | str]:
+        """
+        제안서 맵리듀스 분석 (모델 컨텍스트를 초과하는 대용량 RFP)
+        청크별 요구사항 추출(map)을 동시에 실행하고, 병합된 추출 결과로 요약/전략 등을 생성(reduce)
+        """
+        cache_key = self._structured_cache_key(document_text)
+        cached = self._get_cached_structured(document_text, cache_key)
+        if cached:
+            return True, cached
+        return await self._map_reduce_async(document_text, cache_key)
+
+    async def _map_reduce_async(self, document_text: str, cache_key: str = None) -> tuple[bool, Dict | str]:
+        """맵리듀스 분석 본체 (캐시 조회는 호출자가 수행)"""
+
+        try:
+            # 청크 분할과 reduce 컨텍스트 압축은 대용량 문서 전체를 훑는 CPU 작업이므로 이벤트 루프 밖에서 동시에 1회만 수행
+            chunks, context = await asyncio.gather(
+                asyncio.to_thread(document_chunker.split, document_text, settings.ANALYSIS_CHUNK_TOKENS),
+                asyncio.to_thread(token_optimizer.compress, document_text, settings.ANALYSIS_REDUCE_CONTEXT_TOKENS),
+            )
+            logger.info(f"맵리듀스 분석 시작: {len(chunks)}개 청크 (동시 실행 {settings.ANALYSIS_MAP_CONCURRENCY}개)")
+            
+            # 1. Map: 청크별 요구사항 추출
+            semaphore = asyncio.Semaphore(settings.ANALYSIS_MAP_CONCURRENCY)
+            
+            async def extract(index: int, chunk: str):
+                async with semaphore:
+                    return await self._extract_chunk_async(chunk, index, len(chunks))
+            
+            map_start = time.perf_counter()
+            results = await asyncio.gather(
+                *(extract(index, chunk) for index, chunk in enumerate(chunks, 1))
+            )
+            self.last_phase_timings = {"map": round(time.perf_counter() - map_start, 3)}
+            
+            extracts = []
+            for index, (success, result) in enumerate(results, 1):
+                if not success:
+                    return False, f"청크 {index}/{len(chunks)} 분석 실패: {result}"
+                extracts.append(result)
+            
+            requirements, key_facts = self._merge_chunk_extracts(extracts)
+            logger.info(f"청크 추출 병합 완료: {len(requirements)}개 카테고리, 핵심 사실 {len(key_facts)}개")
+            
+            # 2. Reduce: 요약, 전략, 인력, To-Do 생성
+            prompt = self._build_reduce_prompt(context, requirements, key_facts)
+            reduce_start = time.perf_counter()
+            success, response_text = await self.backend.async_send(
+                prompt,
+                generation_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": AnalysisOverview
+                }
+            )
+            self.last_phase_timings["reduce"] = round(time.perf_counter() - reduce_start, 3)
+            
+            if not success:
+                return False, response_text
+            
+            overview = self._parse_json_response(response_text, AnalysisOverview)
+            if overview is None:
+                return False, "AI 응답을 구조화된 데이터로 변환하는데 실패했습니다. (JSON Parsing Error)"
+            
+            summary = overview.get("summary") or {}
+            summary["total_requirements_count"] = sum(len(category["items"]) for category in requirements)
+            
+            parsed = {
+                "summary": summary,
+                "requirements": requirements,
+                "strategy": overview.get("strategy") or {},
+                "resource_requirements": overview.get("resource_requirements") or [],
+                "todo_list": overview.get("todo_list") or [],
+            }
+            return self._finalize_parsed(document_text, parsed, cache_key=cache_key)
+
+        except Exception as e:
+            logger.error(f"맵리듀스 분석 중 오류: {str(e)}")
+            return False, f"분석 실패: {str(e)}"
+
+    async def _extract_chunk_async(self, chunk: str, index: int, total: int) -> tuple[bool, Dict | str]:
+        """청크 1개에서 요구사항 및 핵심 사실 추출"""
+        prompt = f"""
+당신은 공공 제안요청서(RFP) 분석 전문가입니다.
+아래는 하나의 제안요청서를 {total}개로 나눈 부분 중 {index}번째 부분입니다.
+
+[추출 지침]
+1. 이 부분에 포함된 **모든 요구사항**을 빠짐없이 추출하여 RFP 목차의 카테고리 명칭 그대로 분류하세요.
+   - "요구사항", "과업범위", "제안 내용", "납품 사양", "기술 규격", "성능 기준", "보안" 등 관련 내용을 모두 포함하세요.
+   - 기술명, 버전, 수치, 기준을 그대로 포함하고 추상적으로 요약하지 마세요.
+   - 요구사항 고유번호(예: SFR-001)가 있으면 항목 앞에 그대로 적으세요.
+2. 사업명, 예산, 기간, 발주기관, 사업 목적, 평가 기준 등 핵심 사실이 있으면 원문 그대로 key_facts에 적으세요.
+3. 이 부분에 해당 내용이 없으면 빈 리스트로 응답하세요. 다른 부분의 내용을 추측하지 마세요.
+
+[제안요청서 {index}/{total}]
+{chunk}
+"""
+        success, response_text = await self.backend.async_send(
+            prompt,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": ChunkExtract
+            }
+        )
+        
+        if not success:
+            return False, response_text
+        
+        parsed = self._parse_json_response(response_text, ChunkExtract)
+        if parsed is None:
+            return False, "청크 추출 결과 JSON 파싱 실패"
+        
+        return True, parsed
+
+    @staticmethod
+    def _merge_chunk_extracts(extracts: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+        """
+        청크별 추출 결과 병합
+        카테고리는 처음 등장한 순서로 합치고, 항목/핵심 사실은 공백 차이를 무시하고 중복 제거
+        """
+        def normalize(value: str) -> str:
+            return re.sub(r'\s+', ' ', value).strip()
+        
+        categories: Dict[str, Dict[str, Any]] = {}
+        seen_items: Dict[str, set] = {}
+        key_facts: List[str] = []
+        seen_facts = set()
+        
+        for extract in extracts:
+            for category in extract.get("requirements") or []:
+                name = normalize(category.get("category") or "기타 요구사항")
+                category_key = name.replace(" ", "")
+                
+                if category_key not in categories:
+                    categories[category_key] = {"category": name, "items": []}
+                    seen_items[category_key] = set()
+                
+                for item in category.get("items") or []:
+                    item_key = normalize(item)
+                    if item_key and item_key not in seen_items[category_key]:
+                        seen_items[category_key].add(item_key)
+                        categories[category_key]["items"].append(item.strip())
+            
+            for fact in extract.get("key_facts") or []:
+                fact_key = normalize(fact)
+                if fact_key and fact_key not in seen_facts:
+                    seen_facts.add(fact_key)
+                    key_facts.append(fact.strip())
+        
+        requirements = [category for category in categories.values() if category["items"]]
+        return requirements, key_facts
+
+    @metrics.timed("analysis.prompt_build")
+    def _build_reduce_prompt(
+        self,
+        context: str,
+        requirements: List[Dict[str, Any]],
+        key_facts: List[str]
+    ) -> str:
+        """
+        맵리듀스 reduce 단계 프롬프트 생성
+
+        Args:
+            context: ANALYSIS_REDUCE_CONTEXT_TOKENS로 압축한 문서 발췌
+            requirements: 병합된 요구사항 카테고리
+            key_facts: 병합된 핵심 사실
+        """
+        requirements_text = "\n".join(
+            f"- {category['category']}: " + "; ".join(category["items"])
+            for category in requirements
+        )
+        facts_text = "\n".join(f"- {fact}" for fact in key_facts)
+        
+        return f"""
+당신은 대한민국 최고의 공공 제안서 분석 전문가이자 수주 컨설턴트입니다.
+대용량 제안요청서(RFP)를 부분별로 분석하여 추출한 요구사항과 핵심 사실이 아래에 있습니다.
+이를 종합하여 수주를 위한 요약, 전략, 인력 구성, To-Do 리스트를 작성해주세요.
+
+[작성 지침]
+1. **종합 요약(overview)**: 사업의 배경, 핵심 내용, 중요성을 3~5문장의 스토리텔링 형식으로 작성하세요.
+2. **사업 목적(purpose)**: 이 사업이 왜 발주되었는지, 최종적으로 무엇을 달성하고자 하는지 명확히 기술하세요.
+3. **핵심 키워드(key_keywords)**와 **발주처 중점 포인트(client_priorities)**를 반드시 3~5개씩 작성하세요.
+4. 사업명, 예산, 기간, 기대효과는 핵심 사실에 있는 원문 표현을 그대로 사용하세요. 없으면 '내용 없음'으로 적으세요.
+5. 수주 전략(anchor_points, differentiation, risk_mitigation, win_strategy, references)은 추출된 요구사항에 근거하여 구체적으로 작성하세요.
+6. 인력 구성은 역할, 인원, 필수 기술, 필요 사유를 명시하세요.
+7. To-Do 리스트는 실무자가 바로 수행할 수 있는 8개 내외의 구체적 작업으로 작성하세요.
+
+[핵심 사실]
+{facts_text or "- (추출된 핵심 사실 없음)"}
+
+[추출된 요구사항 (카테고리: 항목)]
+{requirements_text or "- (추출된 요구사항 없음)"}
+
+[제안요청서 발췌]
+{context}
+"""
+
+    @staticmethod
+    def _build_structured_analysis_prompt(document_text: str) -> str:
+        """
+        구조화 분석 프롬프트의 가변 부분 생성
+        고정 지침(STRUCTURED_ANALYSIS_INSTRUCTIONS)은 요청 시 prefix로 전달하여 컨텍스트 캐시로 재사용
+        """
+        return f"{document_text}\n"
     
     def _apply_field_completion(self, parsed: Dict[str, Any]):
         """누락된 필드 자동 보완 (캐시/신규 분석 모두 적용)"""
@@ -271,6 +1075,6 @@ class ProposalAnalyzer:
         parsed['resource_requirements'] = resources
 
 
-def create_analyzer(api_key: str = None) -> ProposalAnalyzer:
+def create_analyzer(api_key: str = None, backend: LLMBackend = None) -> ProposalAnalyzer:
     """분석기 생성"""
-    return ProposalAnalyzer(api_key)
+    return ProposalAnalyzer(api_key, backend=backend)
@@ -40,6 +40,41 @@ class AnalysisResult(BaseModel):
     strategy: StrategyConfig
     resource_requirements: List[ResourceRequirement] = Field(
         description="프로젝트 수행을 위해 필요한 인력 구성 및 요건 (Phase 4)",
-        default=[] 
+        default_factory=list
     )
     todo_list: List[str] = Field(description="이 제안 작업을 완료하기 위해 수행해야 할 구체적인 할 일 목록 (8개 내외)")
+
+class ChunkExtract(BaseModel):
+    requirements: List[RequirementCategory] = Field(
+        description="이 청크에 포함된 요구사항을 RFP 목차 카테고리별로 분류한 리스트 (없으면 빈 리스트)"
+    )
+    key_facts: List[str] = Field(
+        description="이 청크에서 확인되는 사업명, 예산, 기간, 발주기관, 사업 목적, 평가 기준 등 핵심 사실 (원문 그대로)"
+    )
+
+class AnalysisOverview(BaseModel):
+    summary: AnalysisSummary
+    strategy: StrategyConfig
+    resource_requirements: List[ResourceRequirement] = Field(
+        description="프로젝트 수행을 위해 필요한 인력 구성 및 요건"
+    )
+    todo_list: List[str] = Field(description="이 제안 작업을 완료하기 위해 수행해야 할 구체적인 할 일 목록 (8개 내외)")
+
+class SummarySection(BaseModel):
+    summary: AnalysisSummary
+
+class RequirementsSection(BaseModel):
+    requirements: List[RequirementCategory] = Field(
+        description="제안서의 요구사항을 카테고리별로 분류한 리스트"
+    )
+
+class StrategySection(BaseModel):
+    strategy: StrategyConfig
+
+class ResourceSection(BaseModel):
+    resource_requirements: List[ResourceRequirement] = Field(
+        description="프로젝트 수행을 위해 필요한 인력 구성 및 요건"
+    )
+
+class TodoSection(BaseModel):
+    todo_list: List[str] = Field(description="이 제안 작업을 완료하기 위해 수행해야 할 구체적인 할 일 목록 (8개 내외)")
@@ -0,0 +1,99 @@
+"""
+PDF 페이지 병렬 추출 벤치마크
+단일 프로세스와 파싱 풀(N 워커에 페이지 구간 분배) 추출의 소요 시간을 비교
+
+사용법:
+    python backend/benchmarks/bench_pdf_parallel.py [PDF 또는 디렉토리 ...] --workers 2 4 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.settings import settings
+from backend.analyzer.parser.parse_executor import ParseExecutor
+
+DEFAULT_CORPUS_DIR = os.path.join(project_root, "제안서")
+
+
+def collect_pdfs(paths):
+    """입력 경로에서 PDF 파일 목록 수집"""
+    pdfs = []
+    for path in paths:
+        if os.path.isdir(path):
+            pdfs.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(".pdf")
+            )
+        elif path.lower().endswith(".pdf"):
+            pdfs.append(path)
+    return pdfs
+
+
+def time_extraction(executor, pdf_path, repeat):
+    """추출 소요시간 측정 (최솟값, 텍스트 길이)"""
+    best = None
+    text_length = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        success, result = executor.parse(pdf_path, os.path.basename(pdf_path))
+        elapsed = time.perf_counter() - start
+        if not success:
+            raise RuntimeError(result)
+        text_length = len(result["text"])
+        best = elapsed if best is None else min(best, elapsed)
+    return best, text_length, result["stats"]["total_pages"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 페이지 병렬 추출 벤치마크")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_CORPUS_DIR], help="PDF 파일 또는 디렉토리")
+    parser.add_argument("--workers", nargs="+", type=int, default=[2, 4], help="비교할 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    # 샘플 문서가 작아도 병렬 경로를 타도록 최소 페이지 조건 해제
+    settings.PDF_PARALLEL_MIN_PAGES = 0
+
+    pdfs = collect_pdfs(args.paths)
+    if not pdfs:
+        print("벤치마크할 PDF 파일이 없습니다.")
+        return
+
+    header = f"{'파일':<40} {'페이지':>6} {'1proc(s)':>9}" + "".join(
+        f" {f'{n}proc(s)':>9} {'배속':>5}" for n in args.workers
+    )
+    print(header)
+    print("-" * len(header))
+
+    # 기준선은 현재 프로세스에서 직접 파싱, 비교 대상은 워커 기동 비용을 제외하도록 미리 예열한 풀
+    baseline_executor = ParseExecutor(max_workers=0)
+    executors = {workers: ParseExecutor(max_workers=workers, page_workers=workers) for workers in args.workers}
+    for executor in executors.values():
+        time_extraction(executor, pdfs[0], 1)
+
+    try:
+        for pdf_path in pdfs:
+            baseline, baseline_len, pages = time_extraction(baseline_executor, pdf_path, args.repeat)
+            row = f"{os.path.basename(pdf_path)[:40]:<40} {pages:>6} {baseline:>9.3f}"
+
+            for workers, executor in executors.items():
+                elapsed, text_length, _ = time_extraction(executor, pdf_path, args.repeat)
+                if text_length != baseline_len:
+                    print(f"[WARN] 병렬 추출 결과 길이 불일치: {pdf_path} ({text_length} != {baseline_len})")
+                row += f" {elapsed:>9.3f} {baseline / elapsed:>5.2f}"
+
+            print(row)
+    finally:
+        for executor in executors.values():
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+토큰 추정기 보정 벤치마크
+샘플 문서 구간의 실제 Gemini 토큰 수와 추정값을 비교하고, 선형 모델 계수를 다시 맞춤
+
+사용법:
+    # 실제 토큰 수 수집 (GEMINI_API_KEY 필요) + 보정 파일 저장
+    python backend/benchmarks/bench_token_counter.py 제안서 --samples samples.jsonl --output config/token_calibration.json
+
+    # 수집된 샘플로 오프라인 재보정
+    python backend/benchmarks/bench_token_counter.py --samples samples.jsonl --offline --output config/token_calibration.json
+
+실제 값 출처:
+    count_tokens  - models.countTokens 응답의 total_tokens (기본)
+    usage         - generate_content(max_output_tokens=1) 응답의 usage_metadata.prompt_token_count
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.settings import settings
+from config.api_config import gemini_config
+from backend.analyzer.parser.document_integrator import document_integrator
+from backend.analyzer.prompt.token_counter import FEATURES, DEFAULT_COEFFICIENTS, HeuristicTokenCounter
+
+DEFAULT_CORPUS_DIR = os.path.join(project_root, "제안서")
+SUPPORTED_EXTENSIONS = (".pdf", ".hwp", ".pptx")
+SAMPLE_SIZES = (500, 2000, 8000, 32000)
+
+
+def legacy_estimate(text):
+    """기존 추정식 (한글 1.5자 / 기타 4자당 1토큰)"""
+    korean = sum(1 for ch in text if "가" <= ch <= "힣")
+    return int(korean / 1.5 + (len(text) - korean) / 4)
+
+
+def collect_documents(paths):
+    """입력 경로의 문서를 파싱하여 (파일명, 텍스트) 목록 반환"""
+    entries = []
+    for path in paths:
+        if os.path.isdir(path):
+            entries.extend(
+                (os.path.join(path, name), name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(SUPPORTED_EXTENSIONS)
+            )
+        elif path.lower().endswith(SUPPORTED_EXTENSIONS):
+            entries.append((path, os.path.basename(path)))
+
+    documents = []
+    for file_path, name in entries:
+        success, text = document_integrator.parse_file_paths([(file_path, name)])
+        if success:
+            documents.append((name, text))
+        else:
+            print(f"[SKIP] {name}: {text}")
+    return documents
+
+
+def make_samples(documents, per_size, seed):
+    """문서마다 크기별 구간을 무작위로 잘라 샘플 생성"""
+    rng = random.Random(seed)
+    samples = []
+    for name, text in documents:
+        for size in SAMPLE_SIZES:
+            if len(text) < size:
+                continue
+            for _ in range(per_size):
+                start = rng.randrange(0, len(text) - size + 1)
+                samples.append({"source": name, "text": text[start:start + size]})
+    return samples
+
+
+def measure_actual(samples, source):
+    """Gemini API로 실제 토큰 수 측정"""
+    from backend.analyzer.gemini.client_pool import gemini_client_pool
+
+    model = gemini_client_pool.get_model(settings.GEMINI_API_KEY)
+
+    for index, sample in enumerate(samples, 1):
+        if source == "usage":
+            response = model.generate_content(sample["text"], generation_config={"max_output_tokens": 1})
+            sample["actual"] = response.usage_metadata.prompt_token_count
+        else:
+            sample["actual"] = model.count_tokens(sample["text"]).total_tokens
+        print(f"\r실제 토큰 수 측정 {index}/{len(samples)}", end="", flush=True)
+    print()
+
+
+def solve(matrix, vector):
+    """가우스 소거법으로 연립방정식 풀이 (특이 행렬이면 None)"""
+    n = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(n)]
+
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-9:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(n):
+            if r != col:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+
+    return [rows[i][n] / rows[i][i] for i in range(n)]
+
+
+def fit_coefficients(samples):
+    """
+    비음수 최소제곱 근사 (상대 오차 기준)
+    음수 계수가 나온 특징은 0으로 고정하고 다시 맞춤
+    """
+    active = list(range(len(FEATURES)))
+    vectors = [HeuristicTokenCounter.features(sample["text"]) for sample in samples]
+
+    while active:
+        # 긴 샘플이 지배하지 않도록 실제 토큰 수로 나눠 상대 오차를 최소화
+        xtx = [[0.0] * len(active) for _ in active]
+        xty = [0.0] * len(active)
+        for features, sample in zip(vectors, samples):
+            weight = 1.0 / max(sample["actual"], 1) ** 2
+            for i, a in enumerate(active):
+                xty[i] += weight * features[a] * sample["actual"]
+                for j, b in enumerate(active):
+                    xtx[i][j] += weight * features[a] * features[b]
+
+        # 샘플에 없는 특징(특이 행렬)은 기본값 유지를 위해 제외
+        for i in range(len(active)):
+            xtx[i][i] += 1e-6
+
+        solution = solve(xtx, xty)
+        if solution is None:
+            break
+
+        negative = [a for a, value in zip(active, solution) if value < 0]
+        if not negative:
+            fitted = dict(DEFAULT_COEFFICIENTS)
+            fitted.update({FEATURES[a]: 0.0 for a in range(len(FEATURES)) if a not in active})
+            fitted.update({FEATURES[a]: round(value, 4) for a, value in zip(active, solution)})
+            return fitted
+        active = [a for a in active if a not in negative]
+
+    return dict(DEFAULT_COEFFICIENTS)
+
+
+def error_stats(samples, estimate):
+    """추정기의 오차 통계 (평균 절대 백분율 오차, 최대 과소/과대 추정)"""
+    errors = [(estimate(sample["text"]) - sample["actual"]) / max(sample["actual"], 1) for sample in samples]
+    return {
+        "mape": round(100 * sum(abs(e) for e in errors) / len(errors), 2),
+        "max_under": round(100 * min(errors), 2),
+        "max_over": round(100 * max(errors), 2),
+    }
+
+
+def throughput(counter, documents, repeat=3):
+    """전체 문서 1회 추정 처리량 (MB/s)"""
+    text = "".join(text for _, text in documents)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        counter.count(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(text.encode("utf-8")) / 1024 / 1024 / max(best, 1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="토큰 추정기 보정 벤치마크")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_CORPUS_DIR], help="문서 파일 또는 디렉토리")
+    parser.add_argument("--samples", help="샘플/실제 토큰 수 저장 파일 (JSONL, 있으면 재사용)")
+    parser.add_argument("--offline", action="store_true", help="API 호출 없이 --samples 파일만 사용")
+    parser.add_argument("--source", choices=["count_tokens", "usage"], default="count_tokens", help="실제 토큰 수 출처")
+    parser.add_argument("--per-size", type=int, default=3, help="문서/크기별 샘플 수")
+    parser.add_argument("--seed", type=int, default=42, help="샘플링 시드")
+    parser.add_argument("--output", help="보정 파일 저장 경로 (TOKEN_CALIBRATION_PATH)")
+    args = parser.parse_args()
+
+    documents = []
+    if args.samples and os.path.exists(args.samples):
+        with open(args.samples, "r", encoding="utf-8") as f:
+            samples = [json.loads(line) for line in f if line.strip()]
+        print(f"샘플 {len(samples)}개 로드: {args.samples}")
+    elif args.offline:
+        print("--offline 사용 시 --samples 파일이 필요합니다.")
+        return
+    else:
+        if not settings.GEMINI_API_KEY:
+            print("실제 토큰 수 측정에는 GEMINI_API_KEY가 필요합니다.")
+            return
+        documents = collect_documents(args.paths)
+        samples = make_samples(documents, args.per_size, args.seed)
+        if not samples:
+            print("샘플을 만들 문서가 없습니다.")
+            return
+        measure_actual(samples, args.source)
+        if args.samples:
+            with open(args.samples, "w", encoding="utf-8") as f:
+                for sample in samples:
+                    f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+            print(f"샘플 저장: {args.samples}")
+
+    # 절반으로 보정하고 나머지 절반으로 검증
+    rng = random.Random(args.seed)
+    shuffled = samples[:]
+    rng.shuffle(shuffled)
+    train, test = shuffled[::2], shuffled[1::2] or shuffled[::2]
+
+    current = HeuristicTokenCounter()
+    fitted = HeuristicTokenCounter(coefficients=fit_coefficients(train))
+
+    print(f"\n검증 샘플 {len(test)}개 (보정 샘플 {len(train)}개)")
+    print(f"{'추정기':<20} {'MAPE(%)':>8} {'최대과소(%)':>11} {'최대과대(%)':>11}")
+    for label, estimate in (
+        ("기존 추정식", legacy_estimate),
+        ("현재 계수", current.count),
+        ("재보정 계수", fitted.count),
+    ):
+        stats = error_stats(test, estimate)
+        print(f"{label:<20} {stats['mape']:>8} {stats['max_under']:>11} {stats['max_over']:>11}")
+
+    if documents:
+        print(f"\n추정 처리량: {throughput(fitted, documents):.1f} MB/s")
+
+    print("\n재보정 계수:")
+    for feature in FEATURES:
+        print(f"  {feature:<12} {fitted.coefficients[feature]}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "model": gemini_config.MODEL_NAME,
+                "source": args.source,
+                "samples": len(samples),
+                "validation": error_stats(test, fitted.count),
+                "coefficients": fitted.coefficients,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n보정 파일 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
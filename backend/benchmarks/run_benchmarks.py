@@ -0,0 +1,513 @@
+"""
+분석 파이프라인 통합 벤치마크
+문서 파싱, 텍스트 정제, 분석 캐시, PDF 레포트 생성, /api/analyze 동시 부하(스텁 LLM 백엔드)를 측정하고
+결과를 JSON으로 저장하여 실행 간 회귀를 비교
+
+사용법:
+    # 전체 실행 후 결과 저장
+    python backend/benchmarks/run_benchmarks.py --output bench_results.json
+
+    # 일부만 실행 (parse, cleaner, cache, report, api)
+    python backend/benchmarks/run_benchmarks.py --only parse cleaner --repeat 5
+
+    # API 부하: 요청 수/동시 실행 수/스텁 지연 지정
+    python backend/benchmarks/run_benchmarks.py --only api --requests 100 --concurrency 16 --stub-latency 0.5
+
+    # 이전 결과와 비교 (변화율이 --threshold % 이상인 지표 표시)
+    python backend/benchmarks/run_benchmarks.py --output new.json --compare old.json
+"""
+import argparse
+import base64
+import json
+import os
+import platform
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# 프로젝트 루트 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.settings import settings
+from backend.analyzer.parser.document_integrator import document_integrator
+from backend.analyzer.parser.text_cleaner import TextCleaner
+from backend.analyzer.backends.stub import sample_from_model
+from backend.analyzer.schemas import AnalysisResult
+from backend.utils.cache import AnalysisCache
+
+try:
+    import psutil
+except ImportError:  # psutil 미설치 시 /proc에서 RSS 조회 (Linux)
+    psutil = None
+
+DEFAULT_CORPUS_DIR = os.path.join(project_root, "제안서")
+SUPPORTED_EXTENSIONS = (".pdf", ".hwp", ".pptx")
+BENCHMARKS = ("parse", "cleaner", "cache", "report", "api")
+
+
+def percentiles(values):
+    """지연 분포 요약 (ms, nearest-rank 백분위)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(rank(50) * 1000, 3),
+        "p95_ms": round(rank(95) * 1000, 3),
+        "p99_ms": round(rank(99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def rss_mb(pid=None):
+    """프로세스 현재 RSS (MB, 조회 불가 시 None)"""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return round(psutil.Process(pid).memory_info().rss / (1024 * 1024), 1)
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb():
+    """현재 프로세스 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def collect_files(paths):
+    """입력 경로에서 지원 형식 문서 목록 수집"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(SUPPORTED_EXTENSIONS)
+            )
+        elif path.lower().endswith(SUPPORTED_EXTENSIONS):
+            files.append(path)
+    return files
+
+
+def sample_analysis(categories=20, items=10):
+    """레포트/캐시 측정용 분석 결과 (스키마 샘플을 실제 규모로 확장)"""
+    result = sample_from_model(AnalysisResult)
+    result["requirements"] = [
+        {"category": f"요구사항 분류 {c + 1}", "items": [f"요구사항 {c + 1}-{i + 1}: 상세 기준 및 수치" * 3 for i in range(items)]}
+        for c in range(categories)
+    ]
+    result["summary"]["total_requirements_count"] = categories * items
+    return result
+
+
+def bench_parse(files, repeat):
+    """형식별 파싱 처리량 (파싱 캐시 미사용, 파일별 최솟값 기준)"""
+    settings.PARSE_CACHE_ENABLED = False
+    by_format = {}
+    documents = {}
+
+    for file_path in files:
+        name = os.path.basename(file_path)
+        ext = os.path.splitext(name)[1].lower().lstrip(".")
+        size = os.path.getsize(file_path)
+        best = None
+        text = ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            success, text = document_integrator.parse_file_paths([(file_path, name)])
+            elapsed = time.perf_counter() - start
+            if not success:
+                print(f"[WARN] 파싱 실패: {name} ({text})")
+                text = ""
+                break
+            best = elapsed if best is None else min(best, elapsed)
+        if best is None:
+            continue
+
+        documents[name] = text
+        entry = by_format.setdefault(ext, {"files": 0, "bytes": 0, "chars": 0, "seconds": 0.0})
+        entry["files"] += 1
+        entry["bytes"] += size
+        entry["chars"] += len(text)
+        entry["seconds"] += best
+        print(f"  parse {name[:40]:<40} {size / 1024:>8.0f}KB {best:>8.3f}s")
+
+    for entry in by_format.values():
+        entry["seconds"] = round(entry["seconds"], 4)
+        entry["mb_per_s"] = round(entry["bytes"] / (1024 * 1024) / entry["seconds"], 3) if entry["seconds"] else None
+        entry["files_per_s"] = round(entry["files"] / entry["seconds"], 3) if entry["seconds"] else None
+    return by_format, documents
+
+
+def bench_cleaner(documents, repeat):
+    """TextCleaner.clean 처리량 (코퍼스 전체 텍스트, 최솟값 기준)"""
+    texts = list(documents.values())
+    chars = sum(len(text) for text in texts)
+    if not chars:
+        return {"error": "정제할 텍스트가 없습니다."}
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            TextCleaner.clean(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "documents": len(texts),
+        "chars": chars,
+        "seconds": round(best, 4),
+        "mchars_per_s": round(chars / best / 1_000_000, 3),
+    }
+
+
+def bench_cache(documents, entries):
+    """분석 캐시 저장/조회 지연 (메모리 히트, 디스크 히트, 미스)"""
+    texts = list(documents.values()) or ["벤치마크 문서"]
+    result = sample_analysis()
+    cache_dir = tempfile.mkdtemp(prefix="narastore-bench-cache-")
+    try:
+        cache = AnalysisCache(cache_dir=cache_dir)
+        keys = [f"{texts[i % len(texts)]}\n#{i}" for i in range(entries)]
+
+        set_times, memory_times, disk_times, miss_times = [], [], [], []
+        for text in keys:
+            start = time.perf_counter()
+            cache.set(text, "structured_analysis", result, "bench")
+            set_times.append(time.perf_counter() - start)
+        for text in keys:
+            start = time.perf_counter()
+            cache.get(text, "structured_analysis", "bench")
+            memory_times.append(time.perf_counter() - start)
+
+        # 새 인스턴스는 메모리 캐시가 비어 있으므로 첫 조회는 디스크에서 읽음
+        disk_cache = AnalysisCache(cache_dir=cache_dir)
+        for text in keys:
+            start = time.perf_counter()
+            disk_cache.get(text, "structured_analysis", "bench")
+            disk_times.append(time.perf_counter() - start)
+        for text in keys:
+            start = time.perf_counter()
+            disk_cache.get(text, "structured_analysis", "bench-miss")
+            miss_times.append(time.perf_counter() - start)
+
+        return {
+            "entries": entries,
+            "result_bytes": len(json.dumps(result, ensure_ascii=False).encode("utf-8")),
+            "set": percentiles(set_times),
+            "get_memory": percentiles(memory_times),
+            "get_disk": percentiles(disk_times),
+            "get_miss": percentiles(miss_times),
+        }
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def bench_report(repeat):
+    """FullReportGenerator.generate 소요시간"""
+    from backend.report.generator.report_writer import FullReportGenerator
+
+    result = sample_analysis()
+    output_dir = tempfile.mkdtemp(prefix="narastore-bench-report-")
+    try:
+        times = []
+        for index in range(repeat):
+            output_path = os.path.join(output_dir, f"report_{index}.pdf")
+            start = time.perf_counter()
+            success, message = FullReportGenerator.generate(result, output_path)
+            elapsed = time.perf_counter() - start
+            if not success:
+                return {"error": message}
+            times.append(elapsed)
+        return {"bytes": os.path.getsize(output_path), **percentiles(times)}
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url, timeout):
+    """서버 헬스체크 응답 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/api/health", timeout=2):
+                return True
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    return False
+
+
+def _get_json(url):
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def _post_analyze(url, body, timeout):
+    """분석 요청 1건 (소요시간, 성공 여부, 에러)"""
+    request = urllib.request.Request(
+        f"{url}/api/analyze", data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            data = json.loads(response.read())
+        return time.perf_counter() - start, bool(data.get("success")), data.get("error")
+    except Exception as e:
+        return time.perf_counter() - start, False, str(e)
+
+
+def bench_api(files, args):
+    """
+    /api/analyze 동시 부하 (uvicorn 서브프로세스 + 스텁 LLM 백엔드)
+    서버는 빈 작업 디렉토리에서 실행되어 분석 캐시가 비어 있는 상태로 시작하므로,
+    문서별 첫 요청은 모델 호출(단일 실행 합류 포함), 이후 요청은 캐시 히트로 처리됨
+    """
+    if not files:
+        return {"error": "요청할 문서가 없습니다."}
+
+    bodies = []
+    for file_path in files:
+        with open(file_path, "rb") as f:
+            content = base64.b64encode(f.read()).decode("ascii")
+        bodies.append(json.dumps({
+            "filename": os.path.basename(file_path),
+            "file_content": content,
+            "api_key": "benchmark",
+        }).encode("utf-8"))
+
+    server = None
+    workdir = None
+    url = args.url
+    try:
+        if url is None:
+            port = _free_port()
+            url = f"http://127.0.0.1:{port}"
+            workdir = tempfile.mkdtemp(prefix="narastore-bench-server-")
+            env = {
+                **os.environ,
+                "PYTHONPATH": project_root,
+                "LLM_BACKEND": "stub",
+                "LLM_STUB_LATENCY_SECONDS": str(args.stub_latency),
+                "LLM_STUB_JITTER_SECONDS": str(args.stub_jitter),
+                "LLM_STUB_ERROR_RATE": str(args.stub_error_rate),
+                "LLM_STUB_SEED": str(args.seed),
+            }
+            server = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "backend.main:app",
+                 "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+                cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            if not _wait_ready(url, args.startup_timeout):
+                return {"error": f"서버가 {args.startup_timeout}초 안에 시작되지 않았습니다."}
+
+        pid = server.pid if server is not None else args.pid
+        rss_samples = []
+        stop = threading.Event()
+
+        def sample_rss():
+            while not stop.is_set():
+                value = rss_mb(pid) if pid else None
+                if value is not None:
+                    rss_samples.append(value)
+                stop.wait(0.2)
+
+        rss_start = rss_mb(pid) if pid else None
+        sampler = threading.Thread(target=sample_rss, daemon=True)
+        sampler.start()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            outcomes = list(executor.map(
+                lambda index: _post_analyze(url, bodies[index % len(bodies)], args.request_timeout),
+                range(args.requests)
+            ))
+        wall = time.perf_counter() - start
+        stop.set()
+        sampler.join()
+
+        errors = {}
+        for _, success, error in outcomes:
+            if not success:
+                key = (error or "unknown")[:80]
+                errors[key] = errors.get(key, 0) + 1
+        succeeded = [elapsed for elapsed, success, _ in outcomes if success]
+
+        try:
+            runtime = _get_json(f"{url}/api/metrics/runtime")
+        except Exception:
+            runtime = {}
+
+        return {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "documents": len(bodies),
+            "stub": {"latency": args.stub_latency, "jitter": args.stub_jitter, "error_rate": args.stub_error_rate},
+            "wall_seconds": round(wall, 3),
+            "throughput_rps": round(args.requests / wall, 3),
+            "success": len(succeeded),
+            "failed": args.requests - len(succeeded),
+            "errors": errors,
+            "latency": percentiles([elapsed for elapsed, _, _ in outcomes]),
+            "latency_success": percentiles(succeeded),
+            "server_rss_mb": {
+                "start": rss_start,
+                "peak": max(rss_samples) if rss_samples else None,
+                "end": rss_samples[-1] if rss_samples else None,
+            },
+            "server": {
+                name: runtime.get(name) for name in ("analysis_cache", "single_flight", "llm_backend")
+            },
+        }
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def flatten(data, prefix=""):
+    """중첩 결과를 "a.b.c" 경로 -> 숫자 값으로 평탄화 (비교용)"""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(baseline, current, threshold):
+    """두 실행 결과의 수치 지표 비교 (변화율이 threshold % 이상인 항목 출력)"""
+    old = flatten(baseline.get("results", {}))
+    new = flatten(current.get("results", {}))
+    print(f"\n비교: {baseline.get('meta', {}).get('commit')} -> {current.get('meta', {}).get('commit')} (기준 ±{threshold}%)")
+    print(f"{'지표':<55} {'이전':>12} {'현재':>12} {'변화':>8}")
+    changed = 0
+    for path in sorted(set(old) & set(new)):
+        before, after = old[path], new[path]
+        if before == 0:
+            continue
+        delta = (after - before) / abs(before) * 100
+        if abs(delta) >= threshold:
+            changed += 1
+            print(f"{path[:55]:<55} {before:>12.3f} {after:>12.3f} {delta:>+7.1f}%")
+    if not changed:
+        print("기준 이상 변화한 지표가 없습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 파이프라인 통합 벤치마크")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_CORPUS_DIR], help="문서 파일 또는 디렉토리")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS), help="실행할 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="파싱/정제/레포트 반복 횟수")
+    parser.add_argument("--cache-entries", type=int, default=200, help="캐시 측정 항목 수")
+    parser.add_argument("--requests", type=int, default=50, help="API 부하 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="API 동시 요청 수")
+    parser.add_argument("--stub-latency", type=float, default=0.5, help="스텁 모델 평균 지연 (초)")
+    parser.add_argument("--stub-jitter", type=float, default=0.2, help="스텁 모델 지연 변동폭 (초)")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0, help="스텁 모델 실패 비율")
+    parser.add_argument("--seed", type=int, default=42, help="스텁 난수 시드")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (지정 시 서버를 띄우지 않음, 스텁 설정은 서버 환경변수를 따름)")
+    parser.add_argument("--pid", type=int, help="--url 서버의 프로세스 ID (RSS 측정용)")
+    parser.add_argument("--startup-timeout", type=float, default=60, help="서버 시작 대기 시간 (초)")
+    parser.add_argument("--request-timeout", type=float, default=300, help="요청당 타임아웃 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=5.0, help="비교 시 표시할 최소 변화율 (%%)")
+    args = parser.parse_args()
+
+    files = collect_files(args.paths)
+    results = {}
+    documents = {}
+
+    if {"parse", "cleaner", "cache"} & set(args.only):
+        print(f"[parse] {len(files)}개 문서")
+        results["parse"], documents = bench_parse(files, args.repeat if "parse" in args.only else 1)
+        if "parse" not in args.only:
+            del results["parse"]
+    if "cleaner" in args.only:
+        print("[cleaner]")
+        results["cleaner"] = bench_cleaner(documents, args.repeat)
+    if "cache" in args.only:
+        print(f"[cache] {args.cache_entries}개 항목")
+        results["cache"] = bench_cache(documents, args.cache_entries)
+    if "report" in args.only:
+        print("[report]")
+        results["report"] = bench_report(args.repeat)
+    if "api" in args.only:
+        print(f"[api] 요청 {args.requests}건, 동시 {args.concurrency}개")
+        results["api"] = bench_api(files, args)
+
+    output = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "peak_rss_mb": peak_rss_mb(),
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        },
+        "results": results,
+    }
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), output, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+분석 작업 큐
+업로드된 문서의 파싱 및 분석을 백그라운드 워커 풀에서 실행
+"""
+import hashlib
+import hmac
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from config.settings import settings
+from backend.utils.file_handler import file_handler
+from backend.utils.logger import logger
+
+
+class AnalysisJob:
+    """분석 작업 상태"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    def __init__(self, file_path: str, filename: str, api_key: str):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.status = AnalysisJob.QUEUED
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.phase_timings: Dict[str, float] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        # 후속 요청용 분석 세션 ID (완료 시 설정)
+        self.session_id: Optional[str] = None
+
+        # 실행에만 필요한 값 (응답에 노출하지 않음)
+        self._file_path = file_path
+        self._api_key = api_key
+        # 작업을 등록한 API 키 해시 (원문 키는 완료 시 폐기되므로 조회 권한 확인에 사용)
+        self._owner = AnalysisJob._hash_key(api_key)
+
+    @staticmethod
+    def _hash_key(api_key: str) -> str:
+        """API 키 해시 (원문 키를 작업에 남기지 않음)"""
+        return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+    def is_owned_by(self, api_key: str) -> bool:
+        """요청 API 키가 작업을 등록한 키와 같은지 확인"""
+        return hmac.compare_digest(self._owner, AnalysisJob._hash_key(api_key))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (AnalysisJob.COMPLETED, AnalysisJob.FAILED)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 변환"""
+        data = {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "phase_timings": dict(self.phase_timings),
+            "error": self.error,
+            "session_id": self.session_id,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """분석 작업 큐 관리 클래스"""
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_queue_size: int = None,
+        result_ttl_minutes: int = None
+    ):
+        """
+        작업 큐 초기화
+
+        Args:
+            max_workers: 동시에 실행할 분석 작업 수
+            max_queue_size: 대기 가능한 최대 작업 수
+            result_ttl_minutes: 완료된 작업 결과 보관 시간 (분)
+        """
+        self.max_workers = max_workers or settings.JOB_MAX_WORKERS
+        self.max_queue_size = max_queue_size or settings.JOB_QUEUE_MAX_SIZE
+        self.result_ttl = (result_ttl_minutes or settings.JOB_RESULT_TTL_MINUTES) * 60
+
+        self._jobs: Dict[str, AnalysisJob] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="analysis-job"
+        )
+
+    def submit(self, file_path: str, filename: str, api_key: str) -> Tuple[bool, str]:
+        """
+        분석 작업 등록
+
+        Args:
+            file_path: 업로드 파일 임시 경로 (작업이 소유하며 파싱 후 삭제)
+            filename: 원본 파일명
+            api_key: Gemini API 키
+
+        Returns:
+            (성공 여부, 작업 ID 또는 에러 메시지)
+        """
+        with self._lock:
+            self._purge_expired()
+
+            queued = sum(1 for job in self._jobs.values() if job.status == AnalysisJob.QUEUED)
+            if queued >= self.max_queue_size:
+                return False, f"분석 대기열이 가득 찼습니다. (최대 {self.max_queue_size}건) 잠시 후 다시 시도해주세요."
+
+            job = AnalysisJob(file_path, filename, api_key)
+            self._jobs[job.id] = job
+
+        future = self._executor.submit(self._run, job)
+        future.add_done_callback(lambda done: done.cancelled() and self._cancelled(job))
+        logger.info(f"분석 작업 등록: {job.id} ({filename}, 대기 {queued + 1}건)")
+        return True, job.id
+
+    def get(self, job_id: str, api_key: str) -> Optional[AnalysisJob]:
+        """
+        작업 조회 (작업을 등록한 API 키로만 조회 가능)
+
+        Args:
+            job_id: 작업 ID
+            api_key: 요청 API 키
+
+        Returns:
+            작업 (없거나 키가 다르면 None)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or not job.is_owned_by(api_key):
+            return None
+        return job
+
+    def _run(self, job: AnalysisJob):
+        """작업 실행 (워커 스레드)"""
+        from backend.analyzer.parser.document_integrator import document_integrator
+        from backend.analyzer.proposal_analyzer import create_analyzer
+        from backend.storage.session_manager import session_manager
+
+        job.status = AnalysisJob.RUNNING
+        job.started_at = datetime.now()
+        logger.info(f"분석 작업 시작: {job.id}")
+
+        try:
+            # 1. 문서 파싱
+            phase_start = time.perf_counter()
+            try:
+                success, document_text = document_integrator.parse_file_paths(
+                    [(job._file_path, job.filename)]
+                )
+            finally:
+                file_handler.delete_file(job._file_path)
+            job.phase_timings["parse"] = round(time.perf_counter() - phase_start, 3)
+
+            if not success:
+                self._fail(job, f"문서 파싱 실패: {document_text}")
+                return
+
+            # 2. 구조화 분석
+            phase_start = time.perf_counter()
+            analyzer = create_analyzer(job._api_key)
+            success, result = analyzer.analyze_structured(document_text)
+            job.phase_timings["analyze"] = round(time.perf_counter() - phase_start, 3)
+            job.phase_timings.update(
+                {f"analyze.{name}": elapsed for name, elapsed in analyzer.last_phase_timings.items()}
+            )
+
+            if not success:
+                self._fail(job, str(result))
+                return
+
+            job.result = result.model_dump() if hasattr(result, "model_dump") else result
+            job.session_id = session_manager.open(document_text, job.result, job.filename, job._api_key)
+            job.status = AnalysisJob.COMPLETED
+            job.finished_at = datetime.now()
+            job._api_key = None
+            logger.info(f"분석 작업 완료: {job.id} ({job.phase_timings})")
+
+        except Exception as e:
+            logger.error(f"분석 작업 중 오류 ({job.id}): {str(e)}")
+            self._fail(job, f"분석 실패: {str(e)}")
+
+    def _fail(self, job: AnalysisJob, error: str):
+        """작업 실패 처리"""
+        job.error = error
+        job.status = AnalysisJob.FAILED
+        job.finished_at = datetime.now()
+        job._api_key = None
+        logger.warning(f"분석 작업 실패: {job.id} - {error}")
+
+    def _cancelled(self, job: AnalysisJob):
+        """실행 전에 취소된 작업 정리 (서버 종료 시 대기 작업의 임시 파일 삭제 및 실패 처리)"""
+        file_handler.delete_file(job._file_path)
+        self._fail(job, "서버 종료로 작업이 취소되었습니다. 다시 요청해주세요.")
+
+    def _purge_expired(self):
+        """보관 시간이 지난 완료 작업 정리 (lock 보유 상태에서 호출)"""
+        now = datetime.now()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and (now - job.finished_at).total_seconds() > self.result_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 큐 통계 조회"""
+        with self._lock:
+            counts = {
+                status: 0 for status in
+                (AnalysisJob.QUEUED, AnalysisJob.RUNNING, AnalysisJob.COMPLETED, AnalysisJob.FAILED)
+            }
+            for job in self._jobs.values():
+                counts[job.status] += 1
+
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            **counts
+        }
+
+    def shutdown(self):
+        """워커 풀 종료 (대기 작업은 취소 콜백에서 임시 파일 삭제 후 실패 처리)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("분석 작업 큐 종료")
+
+
+# 전역 작업 큐 인스턴스
+job_manager = JobManager()
@@ -2,15 +2,18 @@
 NaraStore FastAPI Backend
 React 프론트엔드와 통신하는 API 서버
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import os
 import sys
 import tempfile
 import base64
+import json
 from datetime import datetime
 import time
 
@@ -24,13 +27,42 @@ if project_root not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from config.settings import settings
 from backend.utils.logger import logger
-from backend.analyzer.proposal_analyzer import create_analyzer
+from backend.utils.metrics import metrics
+from backend.utils.file_handler import file_handler
+from backend.utils.validator import validator
+from backend.utils.upload_limit import UploadSizeLimitMiddleware
+from backend.analyzer.proposal_analyzer import create_analyzer, FOLLOWUP_MODES
+from backend.jobs.job_manager import job_manager
+from backend.utils.cache import analysis_cache
+from backend.analyzer.parser.parse_executor import parse_executor
+from backend.storage.document_store import document_store
+from backend.analyzer.gemini.client_pool import gemini_client_pool
+from backend.analyzer.gemini.rate_limiter import rate_limiter
+from backend.analyzer.gemini.context_cache import context_cache
+from backend.utils.single_flight import single_flight
+from backend.storage.session_manager import session_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 리소스 관리"""
+    analysis_cache.start_janitor()
+    yield
+    analysis_cache.stop_janitor()
+    job_manager.shutdown()
+    parse_executor.shutdown()
+    # 서버 측 컨텍스트 캐시는 TTL 전이라도 저장 비용이 들지 않도록 삭제 후 연결 종료
+    await run_in_threadpool(context_cache.clear, True)
+    gemini_client_pool.clear()
+
 
 app = FastAPI(
     title="NaraStore API",
     description="제안서 분석 API 서버",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -42,12 +74,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 업로드 크기 제한 (multipart 본문이 스풀링되기 전에 Content-Length/수신 바이트로 거부)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 
 class AnalysisRequest(BaseModel):
     """분석 요청 모델"""
     filename: str
     file_content: str  # base64 encoded
     api_key: str
+    include_timings: bool = False  # 응답에 구간별 소요시간 포함
 
 
 class AnalysisResponse(BaseModel):
@@ -55,6 +91,8 @@ class AnalysisResponse(BaseModel):
     success: bool
     data: Optional[Dict[str, Any]] = None  # 구조화된 JSON 데이터
     error: Optional[str] = None
+    session_id: Optional[str] = None  # 후속 요청용 분석 세션 ID
+    timings: Optional[Dict[str, float]] = None  # 구간별 소요시간 (초, include_timings 요청 시)
 
 
 @app.get("/")
@@ -69,74 +107,136 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/api/metrics/runtime")
+async def runtime_metrics():
+    """런타임 지표 (키별 Gemini 호출 예산, 클라이언트 풀, 작업 큐, 캐시, 중복 분석 합류, LLM 백엔드)"""
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "rate_limiter": rate_limiter.get_stats(),
+        "client_pool": gemini_client_pool.get_stats(),
+        "context_cache": context_cache.get_stats(),
+        "jobs": job_manager.get_stats(),
+        "documents": document_store.get_stats(),
+        "sessions": session_manager.get_stats(),
+        "analysis_cache": analysis_cache.get_stats(),
+        "single_flight": single_flight.get_stats(),
+        "llm_backend": _llm_backend_stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus 지표 (구간별 소요시간 히스토그램, 캐시 히트, LLM 재시도/토큰, 파싱 바이트)"""
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _llm_backend_stats() -> Dict[str, Any]:
+    """LLM 백엔드 정보 (스텁은 호출/모의 장애 통계 포함)"""
+    if settings.LLM_BACKEND.lower() == "stub":
+        from backend.analyzer.backends.stub import stub_backend
+        return stub_backend.get_stats()
+    return {"name": settings.LLM_BACKEND}
+
+
+async def _analyze_file(file_path: str, filename: str, api_key: str) -> AnalysisResponse:
+    """
+    디스크에 저장된 파일을 파싱 후 구조화 분석
+    파싱은 스레드풀에서, 모델 호출은 asyncio로 처리하여 이벤트 루프를 점유하지 않음
+    
+    Args:
+        file_path: 업로드 파일이 저장된 경로
+        filename: 원본 파일명 (확장자 판별용)
+        api_key: Gemini API 키
+    """
+    start_time = time.time()
+    
+    # 1. 문서 파싱
+    from backend.analyzer.parser.document_integrator import document_integrator
+    
+    with metrics.span("parse"):
+        success, document_text = await run_in_threadpool(
+            document_integrator.parse_file_paths, [(file_path, filename)]
+        )
+    
+    if not success:
+        return AnalysisResponse(success=False, error=f"문서 파싱 실패: {document_text}")
+    
+    # 2. 구조화 분석 실행
+    analyzer = create_analyzer(api_key)
+    
+    # 통합된 analyze_structured 메서드 호출
+    with metrics.span("analyze"):
+        success, result = await analyzer.analyze_structured_async(document_text)
+    
+    if not success:
+        return AnalysisResponse(success=False, error=str(result))
+    
+    # Pydantic 모델 -> Dict 변환
+    if hasattr(result, "model_dump"):
+        result_dict = result.model_dump()
+    else:
+        result_dict = result
+
+    execution_time = time.time() - start_time
+    logger.info(f"분석 완료 (소요시간: {execution_time:.2f}초)")
+    
+    # 3. 후속 요청용 세션 보관 (원문 + 1차 분석 결과)
+    with metrics.span("session"):
+        session_id = await run_in_threadpool(session_manager.open, document_text, result_dict, filename, api_key)
+    
+    return AnalysisResponse(
+        success=True,
+        data=result_dict,
+        session_id=session_id
+    )
+
+
+def _finish_analysis(
+    response: AnalysisResponse, endpoint: str, timings: Dict[str, float], include_timings: bool
+) -> AnalysisResponse:
+    """분석 요청 결과 지표 기록 (요청 시 구간별 소요시간을 응답에 포함)"""
+    metrics.inc("analyze_requests_total", endpoint=endpoint, outcome="success" if response.success else "failure")
+    if include_timings:
+        response.timings = dict(timings)
+    return response
+
+
 @app.post("/api/analyze", response_model=AnalysisResponse)
 async def analyze_rfp(request: AnalysisRequest):
     """
     제안서 분석 API (구조화된 분석)
     - file_content: base64로 인코딩된 파일 내용
+    - include_timings: true면 응답에 구간별 소요시간 포함
     """
     if not request.api_key:
         raise HTTPException(status_code=400, detail="API Key가 필요합니다")
     
+    with metrics.track_request() as timings:
+        with metrics.span("request"):
+            response = await _analyze_base64(request)
+    return _finish_analysis(response, "analyze", timings, request.include_timings)
+
+
+async def _analyze_base64(request: AnalysisRequest) -> AnalysisResponse:
+    """base64 파일 내용을 임시 파일로 기록한 뒤 분석"""
     tmp_path = None
     try:
-        start_time = time.time()
         logger.info(f"분석 요청 수신: {request.filename}")
         
-        # 1. Base64 디코딩하여 임시 파일 생성
+        # Base64 디코딩하여 임시 파일 생성
         try:
-            file_bytes = base64.b64decode(request.file_content)
-            _, ext = os.path.splitext(request.filename)
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp_file:
-                tmp_file.write(file_bytes)
-                tmp_path = tmp_file.name
+            with metrics.span("decode"):
+                file_bytes = base64.b64decode(request.file_content)
+                _, ext = os.path.splitext(request.filename)
+                
+                with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp_file:
+                    tmp_file.write(file_bytes)
+                    tmp_path = tmp_file.name
+                del file_bytes
         except Exception as e:
              return AnalysisResponse(success=False, error=f"파일 디코딩 실패: {str(e)}")
         
-        # 2. 문서 파싱
-        from backend.analyzer.parser.document_integrator import document_integrator
-        
-        class FileWrapper:
-            def __init__(self, path, name):
-                self.name = name
-                self._path = path
-            
-            def read(self):
-                with open(self._path, 'rb') as f:
-                    return f.read()
-            
-            def getvalue(self):
-                return self.read()
-        
-        file_wrapper = FileWrapper(tmp_path, request.filename)
-        success, document_text = document_integrator.parse_multiple_files([file_wrapper])
-        
-        if not success:
-            return AnalysisResponse(success=False, error=f"문서 파싱 실패: {document_text}")
-        
-        # 3. 구조화 분석 실행
-        analyzer = create_analyzer(request.api_key)
-        
-        # 통합된 analyze_structured 메서드 호출
-        success, result = analyzer.analyze_structured(document_text)
-        
-        if not success:
-            return AnalysisResponse(success=False, error=str(result))
-        
-        # Pydantic 모델 -> Dict 변환
-        if hasattr(result, "model_dump"):
-            result_dict = result.model_dump()
-        else:
-            result_dict = result
-
-        execution_time = time.time() - start_time
-        logger.info(f"분석 완료 (소요시간: {execution_time:.2f}초)")
-        
-        return AnalysisResponse(
-            success=True,
-            data=result_dict
-        )
+        return await _analyze_file(tmp_path, request.filename, request.api_key)
             
     except Exception as e:
         logger.error(f"API 처리 중 오류: {str(e)}")
@@ -149,30 +249,294 @@ async def analyze_rfp(request: AnalysisRequest):
             os.unlink(tmp_path)
 
 
-@app.post("/api/analyze/upload")
+@app.post("/api/analyze/upload", response_model=AnalysisResponse)
 async def analyze_rfp_upload(
     file: UploadFile = File(...),
-    api_key: str = Form(...)
+    api_key: str = Form(...),
+    include_timings: bool = Form(False)
 ):
-    """파일 직접 업로드 방식"""
+    """
+    파일 직접 업로드 방식
+    크기 제한은 UploadSizeLimitMiddleware가 수신 단계에서 적용하고,
+    스풀링된 업로드를 청크 단위로 임시 파일에 복사한 뒤 base64 변환 없이 파서에 전달
+    """
     # [MOCK MODE] API Key 체크 완화
     # if not api_key:
     #     raise HTTPException(status_code=400, detail="API Key가 필요합니다")
     
+    with metrics.track_request() as timings:
+        with metrics.span("request"):
+            response = await _analyze_upload(file, api_key)
+    return _finish_analysis(response, "upload", timings, include_timings)
+
+
+async def _analyze_upload(file: UploadFile, api_key: str) -> AnalysisResponse:
+    """업로드 스트림을 임시 파일로 기록한 뒤 분석"""
+    tmp_path = None
     try:
-        file_content = await file.read()
-        file_content_b64 = base64.b64encode(file_content).decode('utf-8')
+        logger.info(f"업로드 분석 요청 수신: {file.filename}")
         
-        request = AnalysisRequest(
-            filename=file.filename,
-            file_content=file_content_b64,
-            api_key=api_key
-        )
+        is_valid, message = validator.validate_file_extension(file.filename or "")
+        if not is_valid:
+            return AnalysisResponse(success=False, error=message)
         
-        return await analyze_rfp(request)
+        _, ext = os.path.splitext(file.filename)
+        with metrics.span("upload"):
+            success, result = await file_handler.spool_upload(file, suffix=ext)
+        if not success:
+            return AnalysisResponse(success=False, error=result)
+        tmp_path = result
+        
+        return await _analyze_file(tmp_path, file.filename, api_key)
         
     except Exception as e:
+        logger.error(f"업로드 처리 중 오류: {str(e)}")
         return AnalysisResponse(success=False, error=f"업로드 오류: {str(e)}")
+        
+    finally:
+        await file.close()
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+@app.post("/api/jobs", status_code=202)
+async def submit_analysis_job(
+    file: UploadFile = File(...),
+    api_key: str = Form(...)
+):
+    """
+    분석 작업 등록 (비동기)
+    업로드 직후 작업 ID를 반환하고, 파싱/분석은 워커 풀에서 실행
+    """
+    tmp_path = None
+    try:
+        is_valid, message = validator.validate_file_extension(file.filename or "")
+        if not is_valid:
+            return JSONResponse(status_code=400, content={"error": message})
+        
+        _, ext = os.path.splitext(file.filename)
+        success, result = await file_handler.spool_upload(file, suffix=ext)
+        if not success:
+            return JSONResponse(status_code=400, content={"error": result})
+        tmp_path = result
+        
+        success, result = job_manager.submit(tmp_path, file.filename, api_key)
+        if not success:
+            return JSONResponse(status_code=503, content={"error": result})
+        
+        # 임시 파일은 이제 작업이 소유
+        tmp_path = None
+        return {"job_id": result, "status": "queued"}
+        
+    except Exception as e:
+        logger.error(f"작업 등록 중 오류: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": str(e)})
+        
+    finally:
+        await file.close()
+        if tmp_path:
+            file_handler.delete_file(tmp_path)
+
+
+def _require_api_key(x_api_key: Optional[str]) -> str:
+    """X-API-Key 헤더 확인"""
+    if not x_api_key:
+        raise HTTPException(status_code=400, detail="X-API-Key 헤더가 필요합니다")
+    return x_api_key
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_analysis_job(job_id: str, x_api_key: Optional[str] = Header(None)):
+    """분석 작업 상태, 단계별 소요시간 및 결과 조회 (작업을 등록한 API 키로만 조회 가능)"""
+    job = job_manager.get(job_id, _require_api_key(x_api_key))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    return job.to_dict()
+
+
+@app.get("/api/jobs/{job_id}/result", response_model=AnalysisResponse)
+async def get_analysis_job_result(job_id: str, x_api_key: Optional[str] = Header(None)):
+    """완료된 분석 작업 결과 조회 (/api/analyze 와 동일한 응답 형식, 작업을 등록한 API 키로만 조회 가능)"""
+    job = job_manager.get(job_id, _require_api_key(x_api_key))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    if not job.is_finished:
+        raise HTTPException(status_code=409, detail=f"작업이 아직 완료되지 않았습니다 (상태: {job.status})")
+    
+    if job.status == job.FAILED:
+        return AnalysisResponse(success=False, error=job.error)
+    
+    return AnalysisResponse(success=True, data=job.result, session_id=job.session_id)
+
+
+@app.post("/api/documents", status_code=201)
+async def upload_document(file: UploadFile = File(...)):
+    """
+    문서 업로드 및 파싱
+    파싱된 텍스트를 문서 저장소에 보관하고 문서 ID를 반환 (스트리밍 분석 등에서 사용)
+    """
+    tmp_path = None
+    try:
+        is_valid, message = validator.validate_file_extension(file.filename or "")
+        if not is_valid:
+            return JSONResponse(status_code=400, content={"error": message})
+        
+        _, ext = os.path.splitext(file.filename)
+        success, result = await file_handler.spool_upload(file, suffix=ext)
+        if not success:
+            return JSONResponse(status_code=400, content={"error": result})
+        tmp_path = result
+        
+        from backend.analyzer.parser.document_integrator import document_integrator
+        
+        success, document_text = await run_in_threadpool(
+            document_integrator.parse_file_paths, [(tmp_path, file.filename)]
+        )
+        if not success:
+            return JSONResponse(status_code=400, content={"error": f"문서 파싱 실패: {document_text}"})
+        
+        document_id = document_store.put(document_text, file.filename)
+        return {"document_id": document_id, "filename": file.filename, "chars": len(document_text)}
+        
+    except Exception as e:
+        logger.error(f"문서 업로드 중 오류: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": str(e)})
+        
+    finally:
+        await file.close()
+        if tmp_path:
+            file_handler.delete_file(tmp_path)
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """SSE 이벤트 문자열 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.get("/api/analyze/stream")
+async def analyze_stream(document_id: str, x_api_key: Optional[str] = Header(None)):
+    """
+    스트리밍 분석 API (Server-Sent Events)
+    /api/documents 로 업로드한 문서를 분석하며, 섹션이 완성될 때마다 이벤트를 전송
+    
+    이벤트:
+        start        - 분석 시작 ({"document_id", "filename"})
+        section      - 최상위 섹션 완료 ({"name", "value"})
+        requirement  - 요구사항 카테고리 1개 완료 ({"index", "value"})
+        result       - 검증된 최종 AnalysisResult
+        session      - 후속 요청용 분석 세션 ({"session_id"})
+        error        - 분석 실패 ({"error"})
+    """
+    if not x_api_key:
+        raise HTTPException(status_code=400, detail="X-API-Key 헤더가 필요합니다")
+    
+    document = document_store.get(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다. 다시 업로드해주세요.")
+    
+    async def event_stream():
+        start_time = time.time()
+        yield _sse_event("start", {"document_id": document_id, "filename": document["filename"]})
+        
+        try:
+            analyzer = create_analyzer(x_api_key)
+            async for event, data in analyzer.analyze_structured_stream(document["text"]):
+                yield _sse_event(event, data)
+                if event == "result":
+                    session_id = await run_in_threadpool(
+                        session_manager.open, document["text"], data, document["filename"], x_api_key
+                    )
+                    yield _sse_event("session", {"session_id": session_id})
+        except Exception as e:
+            logger.error(f"스트리밍 분석 중 오류: {str(e)}")
+            yield _sse_event("error", {"error": str(e)})
+        
+        logger.info(f"스트리밍 분석 종료 (소요시간: {time.time() - start_time:.2f}초)")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+class FollowupRequest(BaseModel):
+    """후속 요청 모델"""
+    mode: str = "custom"  # summary, strategy, references, custom
+    instruction: str = ""  # 사용자 추가 지시 (custom은 필수)
+
+
+def _session_summary(session_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
+    """세션 조회 응답 (원문 텍스트는 제외)"""
+    return {
+        "session_id": session_id,
+        "filename": session["filename"],
+        "chars": len(session["text"]),
+        "created_at": session["created_at"].isoformat(),
+        "last_used": session["last_used"].isoformat(),
+        "analysis": session["analysis"],
+        "turns": [
+            {"mode": turn["mode"], "request": turn["request"], "reply": turn["reply"]}
+            for turn in session["turns"]
+        ],
+    }
+
+
+@app.get("/api/sessions/{session_id}")
+async def get_session(session_id: str, x_api_key: Optional[str] = Header(None)):
+    """분석 세션 조회 (1차 분석 결과 및 최근 후속 요청, 세션을 연 API 키로만 조회 가능)"""
+    session = session_manager.get(session_id, _require_api_key(x_api_key))
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다. 다시 분석해주세요.")
+    return _session_summary(session_id, session)
+
+
+@app.delete("/api/sessions/{session_id}")
+async def delete_session(session_id: str, x_api_key: Optional[str] = Header(None)):
+    """분석 세션 삭제 (세션을 연 API 키로만 삭제 가능)"""
+    if not session_manager.delete(session_id, _require_api_key(x_api_key)):
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    return {"session_id": session_id, "deleted": True}
+
+
+@app.post("/api/sessions/{session_id}/followup")
+async def session_followup(session_id: str, request: FollowupRequest, x_api_key: Optional[str] = Header(None)):
+    """
+    분석 세션 후속 요청
+    재업로드/재파싱 없이 세션의 원문과 1차 분석 결과를 컨텍스트로 요약/전략/레퍼런스 재작성 또는 자유 질의 수행
+    """
+    _require_api_key(x_api_key)
+    if request.mode not in FOLLOWUP_MODES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 요청 유형입니다: {request.mode} ({', '.join(FOLLOWUP_MODES)})")
+    if request.mode == "custom" and not request.instruction.strip():
+        raise HTTPException(status_code=400, detail="custom 요청에는 instruction이 필요합니다")
+    
+    session = session_manager.get(session_id, x_api_key)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다. 다시 분석해주세요.")
+    
+    try:
+        analyzer = create_analyzer(x_api_key)
+        success, result = await analyzer.followup_async(
+            session["context_text"],
+            session["analysis"],
+            request.mode,
+            request.instruction,
+            session_manager.history(session_id)
+        )
+    except Exception as e:
+        logger.error(f"후속 요청 처리 중 오류: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": str(e)})
+    
+    if not success:
+        return JSONResponse(status_code=502, content={"error": result})
+    
+    turn = session_manager.add_turn(
+        session_id, request.mode, request.instruction or request.mode, result["content"]
+    )
+    return {"session_id": session_id, "turn": turn, **result}
+
 
 class PDFRequest(BaseModel):
     analysis_data: Dict[str, Any]
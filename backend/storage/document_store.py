@@ -0,0 +1,93 @@
+"""
+파싱된 문서 저장소
+업로드/파싱 결과를 문서 ID로 보관하여 스트리밍 분석 등 후속 요청에서 재사용
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+class DocumentStore:
+    """파싱된 문서 텍스트 보관 클래스 (메모리, TTL + 최대 개수 제한)"""
+
+    def __init__(self, ttl_minutes: int = None, max_entries: int = None):
+        """
+        저장소 초기화
+
+        Args:
+            ttl_minutes: 문서 보관 시간 (분)
+            max_entries: 최대 보관 문서 수 (초과 시 오래된 문서부터 삭제)
+        """
+        self.ttl = timedelta(minutes=ttl_minutes or settings.DOCUMENT_STORE_TTL_MINUTES)
+        self.max_entries = max_entries or settings.DOCUMENT_STORE_MAX_ENTRIES
+        self._documents: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, text: str, filename: str) -> str:
+        """
+        문서 저장
+
+        Args:
+            text: 파싱된 문서 텍스트
+            filename: 원본 파일명
+
+        Returns:
+            문서 ID
+        """
+        document_id = uuid.uuid4().hex
+
+        with self._lock:
+            self._purge_expired()
+            self._documents[document_id] = {
+                "text": text,
+                "filename": filename,
+                "created_at": datetime.now(),
+            }
+            while len(self._documents) > self.max_entries:
+                evicted_id, _ = self._documents.popitem(last=False)
+                logger.info(f"문서 저장소 용량 초과로 삭제: {evicted_id}")
+
+        logger.info(f"문서 저장: {document_id} ({filename}, {len(text)}자)")
+        return document_id
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        문서 조회
+
+        Returns:
+            {"text", "filename", "created_at"} 또는 None (없거나 만료)
+        """
+        with self._lock:
+            self._purge_expired()
+            return self._documents.get(document_id)
+
+    def delete(self, document_id: str) -> bool:
+        """문서 삭제"""
+        with self._lock:
+            return self._documents.pop(document_id, None) is not None
+
+    def _purge_expired(self):
+        """만료된 문서 정리 (잠금 보유 상태에서 호출)"""
+        cutoff = datetime.now() - self.ttl
+        while self._documents:
+            document_id, document = next(iter(self._documents.items()))
+            if document["created_at"] >= cutoff:
+                break
+            del self._documents[document_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계 조회"""
+        with self._lock:
+            return {
+                "count": len(self._documents),
+                "total_chars": sum(len(document["text"]) for document in self._documents.values()),
+                "max_entries": self.max_entries,
+            }
+
+
+# 전역 인스턴스
+document_store = DocumentStore()
@@ -0,0 +1,182 @@
+"""
+분석 세션 관리
+파싱된 원문과 1차 분석 결과를 보관하여 후속 요청(요약/전략/레퍼런스 재작성 등)에서 재사용
+세션 ID는 추측할 수 없는 임의 값이며, 세션을 연 API 키로만 조회/삭제/후속 요청 가능
+"""
+import hashlib
+import hmac
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from config.settings import settings
+from backend.analyzer.prompt.optimizer import token_optimizer
+from backend.utils.logger import logger
+
+
+class SessionManager:
+    """분석 세션 보관 클래스 (메모리, 마지막 사용 기준 TTL + 최대 개수 제한)"""
+
+    def __init__(self, ttl_minutes: int = None, max_entries: int = None, max_turns: int = None):
+        """
+        세션 관리자 초기화
+
+        Args:
+            ttl_minutes: 마지막 사용 후 세션 보관 시간 (분)
+            max_entries: 최대 보관 세션 수 (초과 시 가장 오래 사용하지 않은 세션부터 삭제)
+            max_turns: 세션당 보관할 최근 후속 요청 수
+        """
+        self.ttl = timedelta(minutes=ttl_minutes or settings.SESSION_TTL_MINUTES)
+        self.max_entries = max_entries or settings.SESSION_MAX_ENTRIES
+        self.max_turns = max_turns or settings.SESSION_MAX_TURNS
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _owner(api_key: str) -> str:
+        """API 키 해시 (원문 키를 세션에 보관하지 않음)"""
+        return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _context_text(document_text: str) -> str:
+        """
+        후속 요청 컨텍스트용 문서 (모델 컨텍스트를 넘는 대용량 문서는 요구사항 관련 구간 위주로 압축)
+        매 후속 요청마다 같은 결과이므로 세션을 열 때 1회만 계산
+        """
+        threshold = settings.ANALYSIS_MAP_REDUCE_THRESHOLD_TOKENS
+        if settings.ANALYSIS_MAP_REDUCE_ENABLED and token_optimizer.estimate_tokens(document_text) > threshold:
+            return token_optimizer.compress(document_text, threshold)
+        return document_text
+
+    def open(self, document_text: str, analysis: Dict[str, Any], filename: str = "", api_key: str = "") -> str:
+        """
+        세션 생성 (분석할 때마다 새 세션, 같은 문서라도 다른 요청자와 공유하지 않음)
+        대용량 문서 압축이 포함된 CPU 작업이므로 async 경로에서는 스레드풀에서 호출
+
+        Args:
+            document_text: 파싱된 문서 텍스트
+            analysis: 1차 구조화 분석 결과
+            filename: 원본 파일명
+            api_key: 분석을 요청한 API 키 (이후 조회/삭제/후속 요청 시 같은 키 필요)
+
+        Returns:
+            세션 ID (임의 값)
+        """
+        session_id = secrets.token_urlsafe(24)
+        context_text = self._context_text(document_text)
+        now = datetime.now()
+
+        with self._lock:
+            self._purge_expired()
+            self._sessions[session_id] = {
+                "text": document_text,
+                "context_text": context_text,
+                "filename": filename,
+                "analysis": analysis,
+                "owner": self._owner(api_key),
+                "turns": [],
+                "created_at": now,
+                "last_used": now,
+            }
+
+            while len(self._sessions) > self.max_entries:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logger.info(f"세션 보관 개수 초과로 삭제: {evicted_id}")
+
+        logger.info(f"분석 세션 열기: {session_id} ({filename}, {len(document_text)}자)")
+        return session_id
+
+    def _owned(self, session_id: str, api_key: str) -> Optional[Dict[str, Any]]:
+        """요청 API 키가 세션을 연 키와 같을 때만 세션 반환 (잠금 보유 상태에서 호출)"""
+        session = self._sessions.get(session_id)
+        if session is None or not hmac.compare_digest(session["owner"], self._owner(api_key)):
+            return None
+        return session
+
+    def get(self, session_id: str, api_key: str) -> Optional[Dict[str, Any]]:
+        """
+        세션 조회 (조회 시 마지막 사용 시각 갱신)
+
+        Args:
+            session_id: 세션 ID
+            api_key: 요청 API 키
+
+        Returns:
+            {"text", "context_text", "filename", "analysis", "turns", "created_at", "last_used"} 또는 None
+            (없거나 만료되었거나 다른 키로 연 세션이면 존재 여부를 드러내지 않도록 모두 None)
+        """
+        with self._lock:
+            self._purge_expired()
+            session = self._owned(session_id, api_key)
+            if session is not None:
+                session["last_used"] = datetime.now()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def add_turn(self, session_id: str, mode: str, request: str, reply: str) -> int:
+        """
+        후속 요청 기록 추가
+
+        Args:
+            session_id: 세션 ID
+            mode: 요청 유형
+            request: 요청 내용 (사용자 추가 지시 또는 유형명)
+            reply: 모델 답변
+
+        Returns:
+            세션의 후속 요청 번호 (세션이 없으면 0)
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return 0
+            session["turns"].append({
+                "mode": mode,
+                "request": request,
+                "reply": reply,
+                "created_at": datetime.now(),
+            })
+            # 오래된 기록은 버려 다음 요청의 프롬프트가 계속 커지지 않도록 함
+            del session["turns"][:-self.max_turns]
+            session["turn_count"] = session.get("turn_count", 0) + 1
+            return session["turn_count"]
+
+    def history(self, session_id: str) -> List[Dict[str, str]]:
+        """최근 후속 요청 기록 [{"request", "reply"}] (프롬프트 구성용)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return []
+            return [{"request": turn["request"], "reply": turn["reply"]} for turn in session["turns"]]
+
+    def delete(self, session_id: str, api_key: str) -> bool:
+        """세션 삭제 (세션을 연 API 키로만 가능)"""
+        with self._lock:
+            if self._owned(session_id, api_key) is None:
+                return False
+            del self._sessions[session_id]
+            return True
+
+    def _purge_expired(self):
+        """만료된 세션 정리 (잠금 보유 상태에서 호출, 오래 사용하지 않은 순으로 정렬되어 있음)"""
+        cutoff = datetime.now() - self.ttl
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session["last_used"] >= cutoff:
+                break
+            del self._sessions[session_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """세션 통계 조회"""
+        with self._lock:
+            return {
+                "count": len(self._sessions),
+                "total_chars": sum(len(session["text"]) for session in self._sessions.values()),
+                "turns": sum(len(session["turns"]) for session in self._sessions.values()),
+                "max_entries": self.max_entries,
+            }
+
+
+# 전역 인스턴스
+session_manager = SessionManager()
@@ -5,21 +5,60 @@
 import hashlib
 import json
 import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from config.settings import settings
+from config.api_config import gemini_config
 from backend.utils.logger import logger
+from backend.utils.metrics import metrics
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """캐시 항목 직렬화 (공백 없는 compact JSON)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """캐시 항목 역직렬화 (이전 indent=2 형식도 호환)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class AnalysisCache:
     """분석 결과 캐시 관리"""
     
-    def __init__(self, cache_dir: str = None, ttl_hours: int = 24):
+    # 해시 시 한 번에 인코딩할 문자 수 (전체 문서를 한 번에 복사하지 않음)
+    HASH_CHUNK_CHARS = 1024 * 1024
+    
+    def __init__(
+        self,
+        cache_dir: str = None,
+        ttl_hours: int = 24,
+        memory_max_mb: int = None,
+        max_size_mb: int = None,
+        max_entries: int = None
+    ):
         """
-        캐시 초기화
+        캐시 초기화 (메모리 LRU 1차 캐시 + 디스크 2차 캐시)
         
         Args:
             cache_dir: 캐시 저장 디렉토리
             ttl_hours: 캐시 유효 시간 (시간)
+            memory_max_mb: 메모리 캐시 최대 용량 (MB)
+            max_size_mb: 디스크 캐시 최대 용량 (MB, 정리 작업에서 적용)
+            max_entries: 디스크 캐시 최대 항목 수 (정리 작업에서 적용)
         """
         if cache_dir is None:
             cache_dir = os.path.join(os.getcwd(), "data", "cache")
@@ -27,55 +66,212 @@ class AnalysisCache:
         self.cache_dir = cache_dir
         self.ttl = timedelta(hours=ttl_hours)
         
+        # 메모리 캐시: 키 -> (직렬화된 항목, 저장 시각), 직렬화 크기로 용량 계산
+        if memory_max_mb is None:
+            memory_max_mb = settings.ANALYSIS_CACHE_MEMORY_MB
+        self.memory_max_bytes = memory_max_mb * 1024 * 1024
+        self._memory: "OrderedDict[str, tuple[bytes, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            tier: {"hits": 0, "misses": 0, "evictions": 0}
+            for tier in ("memory", "disk")
+        }
+        
+        # 디스크 캐시 상한 (백그라운드 정리 작업에서 적용)
+        self.max_size_bytes = (max_size_mb or settings.ANALYSIS_CACHE_MAX_MB) * 1024 * 1024
+        self.max_entries = max_entries or settings.ANALYSIS_CACHE_MAX_ENTRIES
+        self.eviction_policy = settings.ANALYSIS_CACHE_EVICTION
+        
         # 캐시 디렉토리 생성
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
+        
+        # 디스크 항목 인덱스 (키, 크기, 생성/최근 접근 시각) - 통계/정리 시 디렉토리 스캔 방지
+        self._index_lock = threading.Lock()
+        self._index = sqlite3.connect(
+            os.path.join(self.cache_dir, "index.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._init_index()
+        
+        # 조회 시 접근 시각은 메모리에 모았다가 정리 작업에서 일괄 반영
+        self._pending_access: Dict[str, float] = {}
+        self._janitor_thread: Optional[threading.Thread] = None
+        self._janitor_stop = threading.Event()
     
-    def _get_hash(self, text: str, analysis_type: str) -> str:
-        """텍스트 해시 생성"""
-        content = f"{analysis_type}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def _init_index(self):
+        """인덱스 테이블 생성 및 (최초 1회) 기존 캐시 파일 등록"""
+        with self._index_lock:
+            self._index.execute("PRAGMA journal_mode=WAL")
+            self._index.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    inputs TEXT
+                )
+                """
+            )
+            self._index.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+            self._index.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON entries(created_at)")
+            
+            indexed = self._index.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        
+        if indexed == 0:
+            self._rebuild_index()
+    
+    def _disk_totals(self) -> tuple[int, int]:
+        """디스크 항목 수/총 크기 (여러 워커 프로세스가 공유하는 인덱스에서 조회, 잠금 보유 상태에서 호출)"""
+        return self._index.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+    
+    def _rebuild_index(self):
+        """디렉토리의 기존 캐시 파일로 인덱스 재구성"""
+        rows = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.json'):
+                continue
+            
+            cache_path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(cache_path, 'rb') as f:
+                    raw = f.read()
+                cache_data = _loads(raw)
+                created = datetime.fromisoformat(cache_data.get('cached_at', '')).timestamp()
+            except Exception:
+                created = os.path.getmtime(cache_path)
+                cache_data = {}
+            
+            inputs = cache_data.get('inputs')
+            rows.append((
+                filename[:-len('.json')],
+                len(raw) if cache_data else os.path.getsize(cache_path),
+                created,
+                os.path.getmtime(cache_path),
+                json.dumps(inputs, sort_keys=True) if inputs is not None else None
+            ))
+        
+        if rows:
+            with self._index_lock:
+                self._index.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows
+                )
+            logger.info(f"캐시 인덱스 재구성: {len(rows)}개 항목")
+    
+    @staticmethod
+    def _describe_inputs(text: str, analysis_type: str, prompt_version: str, backend: str) -> Dict[str, Any]:
+        """캐시 항목을 만든 입력 정보 (선택적 무효화 기준)"""
+        return {
+            "analysis_type": analysis_type,
+            "prompt_version": prompt_version,
+            "llm_backend": backend,
+            "model_name": gemini_config.MODEL_NAME,
+            "temperature": gemini_config.TEMPERATURE,
+            "top_p": gemini_config.TOP_P,
+            "top_k": gemini_config.TOP_K,
+            "max_output_tokens": gemini_config.MAX_OUTPUT_TOKENS,
+            "text_length": len(text),
+        }
+    
+    def _get_hash(self, text: str, inputs: Dict[str, Any]) -> str:
+        """
+        전체 문서 + 입력 정보 해시 생성
+        blake2b에 청크 단위로 갱신하여 대용량 문서도 추가 전체 복사 없이 처리
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+        for start in range(0, len(text), self.HASH_CHUNK_CHARS):
+            hasher.update(text[start:start + self.HASH_CHUNK_CHARS].encode("utf-8"))
+        return hasher.hexdigest()
+    
+    def make_key(self, text: str, analysis_type: str, prompt_version: str = "", backend: str = "gemini") -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            text: 문서 텍스트 (전체)
+            analysis_type: 분석 유형
+            prompt_version: 프롬프트 템플릿 버전
+            backend: 결과를 생성한 LLM 백엔드 이름 (스텁 결과가 실제 결과 키를 차지하지 않도록 구분)
+        """
+        inputs = self._describe_inputs(text, analysis_type, prompt_version, backend)
+        return self._get_hash(text, inputs)
     
     def _get_cache_path(self, cache_key: str) -> str:
         """캐시 파일 경로"""
         return os.path.join(self.cache_dir, f"{cache_key}.json")
     
-    def get(self, text: str, analysis_type: str) -> Optional[Dict[str, Any]]:
+    @metrics.timed("cache.get")
+    def get(
+        self, text: str, analysis_type: str, prompt_version: str = "", backend: str = "gemini", cache_key: str = None
+    ) -> Optional[Dict[str, Any]]:
         """
         캐시에서 분석 결과 조회
         
         Args:
             text: 문서 텍스트
             analysis_type: 분석 유형 (summary, analysis, strategy, references)
+            prompt_version: 프롬프트 템플릿 버전
+            backend: LLM 백엔드 이름
+            cache_key: 미리 계산한 make_key 결과 (있으면 문서를 다시 해시하지 않음)
             
         Returns:
             캐시된 결과 또는 None
         """
-        cache_key = self._get_hash(text[:5000], analysis_type)  # 앞 5000자로 해시
-        cache_path = self._get_cache_path(cache_key)
+        cache_key = cache_key or self.make_key(text, analysis_type, prompt_version, backend)
         
-        if not os.path.exists(cache_path):
-            return None
+        # 1차: 메모리 캐시
+        cache_data = self._memory_get(cache_key)
+        if cache_data is not None:
+            self._touch(cache_key)
+            logger.info(f"캐시 히트 (메모리): {analysis_type} ({cache_key[:8]}...)")
+            return cache_data.get('result')
         
+        # 2차: 디스크 캐시
+        cache_path = self._get_cache_path(cache_key)
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # TTL 확인
-            cached_time = datetime.fromisoformat(cache_data.get('cached_at', ''))
-            if datetime.now() - cached_time > self.ttl:
-                logger.info(f"캐시 만료됨: {cache_key}")
-                os.remove(cache_path)
-                return None
-            
-            logger.info(f"캐시 히트: {analysis_type} ({cache_key[:8]}...)")
-            return cache_data.get('result')
-            
+            with open(cache_path, 'rb') as f:
+                raw = f.read()
+            cache_data = _loads(raw)
+        except FileNotFoundError:
+            self._count("disk", "misses")
+            return None
         except Exception as e:
+            self._count("disk", "misses")
             logger.warning(f"캐시 조회 실패: {str(e)}")
             return None
+        
+        # TTL 확인
+        try:
+            cached_time = datetime.fromisoformat(cache_data.get('cached_at', ''))
+        except ValueError:
+            cached_time = datetime.min
+        
+        if datetime.now() - cached_time > self.ttl:
+            # 만료 항목 삭제는 백그라운드 정리 작업에서 처리
+            logger.info(f"캐시 만료됨: {cache_key}")
+            self._count("disk", "misses")
+            return None
+        
+        self._count("disk", "hits")
+        self._touch(cache_key)
+        self._memory_put(cache_key, raw, cached_time.timestamp())
+        logger.info(f"캐시 히트 (디스크): {analysis_type} ({cache_key[:8]}...)")
+        return cache_data.get('result')
     
-    def set(self, text: str, analysis_type: str, result: Dict[str, Any]) -> bool:
+    @metrics.timed("cache.set")
+    def set(
+        self,
+        text: str,
+        analysis_type: str,
+        result: Dict[str, Any],
+        prompt_version: str = "",
+        backend: str = "gemini",
+        cache_key: str = None
+    ) -> bool:
         """
         분석 결과를 캐시에 저장
         
@@ -83,22 +279,35 @@ class AnalysisCache:
             text: 문서 텍스트
             analysis_type: 분석 유형
             result: 분석 결과
+            prompt_version: 프롬프트 템플릿 버전
+            backend: 결과를 생성한 LLM 백엔드 이름
+            cache_key: 미리 계산한 make_key 결과 (있으면 문서를 다시 해시하지 않음)
             
         Returns:
             저장 성공 여부
         """
-        cache_key = self._get_hash(text[:5000], analysis_type)
+        inputs = self._describe_inputs(text, analysis_type, prompt_version, backend)
+        cache_key = cache_key or self._get_hash(text, inputs)
         cache_path = self._get_cache_path(cache_key)
         
         try:
+            cached_at = datetime.now()
             cache_data = {
-                'cached_at': datetime.now().isoformat(),
+                'cached_at': cached_at.isoformat(),
                 'analysis_type': analysis_type,
+                'inputs': inputs,
                 'result': result
             }
+            raw = _dumps(cache_data)
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            # 임시 파일에 기록 후 rename (동시 조회 시 쓰다 만 파일을 읽지 않도록)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, cache_path)
+            
+            self._memory_put(cache_key, raw, cached_at.timestamp())
+            self._index_upsert(cache_key, len(raw), cached_at.timestamp(), inputs)
             
             logger.info(f"캐시 저장: {analysis_type} ({cache_key[:8]}...)")
             return True
@@ -114,27 +323,254 @@ class AnalysisCache:
         Returns:
             삭제된 파일 수
         """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        
         count = 0
         for filename in os.listdir(self.cache_dir):
             if filename.endswith('.json'):
                 os.remove(os.path.join(self.cache_dir, filename))
                 count += 1
         
+        with self._index_lock:
+            self._index.execute("DELETE FROM entries")
+            self._pending_access.clear()
+        
         logger.info(f"캐시 전체 삭제: {count}개 파일")
         return count
     
+    def invalidate(self, **criteria) -> int:
+        """
+        입력 조건이 일치하는 캐시 항목만 삭제
+        예: invalidate(model_name="gemini-2.5-flash"), invalidate(llm_backend="stub"),
+            invalidate(analysis_type="structured_analysis", prompt_version="1")
+        입력 정보가 없는 이전 형식 항목은 더 이상 조회되지 않으므로 함께 삭제
+        
+        Returns:
+            삭제된 파일 수
+        """
+        with self._index_lock:
+            rows = self._index.execute("SELECT key, inputs FROM entries").fetchall()
+        
+        targets = []
+        for cache_key, inputs_json in rows:
+            inputs = json.loads(inputs_json) if inputs_json else None
+            if inputs is None or all(inputs.get(k) == v for k, v in criteria.items()):
+                targets.append(cache_key)
+        
+        count = self._remove_entries(targets)
+        logger.info(f"캐시 선택 삭제: {count}개 파일 (조건: {criteria})")
+        return count
+    
+    def _index_upsert(self, cache_key: str, size: int, created_at: float, inputs: Dict[str, Any]):
+        """인덱스 항목 추가/갱신"""
+        with self._index_lock:
+            self._index.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (cache_key, size, created_at, created_at, json.dumps(inputs, sort_keys=True))
+            )
+    
+    def _touch(self, cache_key: str):
+        """최근 접근 시각 기록 (인덱스 반영은 정리 작업에서 일괄 처리)"""
+        with self._index_lock:
+            self._pending_access[cache_key] = time.time()
+    
+    def _remove_entries(self, cache_keys: list) -> int:
+        """캐시 파일, 인덱스, 메모리 항목 일괄 삭제"""
+        removed = 0
+        for cache_key in cache_keys:
+            try:
+                os.remove(self._get_cache_path(cache_key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"캐시 파일 삭제 실패 ({cache_key[:8]}...): {str(e)}")
+                continue
+            
+            self._memory_discard(cache_key)
+            with self._index_lock:
+                self._index.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
+                self._pending_access.pop(cache_key, None)
+            removed += 1
+        
+        return removed
+    
+    def sweep(self) -> Dict[str, int]:
+        """
+        디스크 캐시 정리: 만료 항목 삭제 후 최대 용량/항목 수 초과분을 제거
+        제거 순서는 ANALYSIS_CACHE_EVICTION 설정 (lru: 최근 접근 순, age: 생성 순)
+        
+        Returns:
+            사유별 삭제 항목 수
+        """
+        # 1. 보류된 접근 시각 반영
+        with self._index_lock:
+            pending, self._pending_access = self._pending_access, {}
+            if pending:
+                self._index.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(ts, key) for key, ts in pending.items()]
+                )
+            
+            # 2. 만료 항목
+            expire_before = time.time() - self.ttl.total_seconds()
+            expired = [row[0] for row in self._index.execute(
+                "SELECT key FROM entries WHERE created_at < ?", (expire_before,)
+            )]
+        
+        result = {"expired": self._remove_entries(expired), "evicted": 0}
+        
+        # 3. 용량/항목 수 초과분: 합계 확인, 제거 대상 선정, 인덱스 삭제를 한 트랜잭션에서 수행
+        #    (인덱스는 여러 워커 프로세스가 공유하므로 다른 프로세스의 저장/정리까지 반영된 합계 기준)
+        order_column = "created_at" if self.eviction_policy == "age" else "last_access"
+        victims = []
+        with self._index_lock:
+            self._index.execute("BEGIN IMMEDIATE")
+            try:
+                count, total = self._disk_totals()
+                if total > self.max_size_bytes or count > self.max_entries:
+                    # 정렬 인덱스를 따라 필요한 만큼만 조회
+                    cursor = self._index.execute(f"SELECT key, size FROM entries ORDER BY {order_column}")
+                    for cache_key, size in cursor:
+                        if total <= self.max_size_bytes and count <= self.max_entries:
+                            break
+                        victims.append(cache_key)
+                        count -= 1
+                        total -= size
+                    cursor.close()
+                    self._index.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+                self._index.execute("COMMIT")
+            except Exception:
+                self._index.execute("ROLLBACK")
+                raise
+        
+        # 파일/메모리 항목 삭제 (인덱스에서는 이미 빠졌으므로 다른 프로세스가 중복 선정하지 않음)
+        self._remove_entries(victims)
+        result["evicted"] = len(victims)
+        for _ in victims:
+            self._count("disk", "evictions")
+        
+        if result["expired"] or result["evicted"]:
+            logger.info(f"캐시 정리 완료: 만료 {result['expired']}개, 용량 초과 {result['evicted']}개 삭제")
+        return result
+    
+    def start_janitor(self, interval_seconds: int = None):
+        """백그라운드 정리 작업 시작"""
+        if self._janitor_thread and self._janitor_thread.is_alive():
+            return
+        
+        interval = interval_seconds or settings.ANALYSIS_CACHE_SWEEP_SECONDS
+        self._janitor_stop.clear()
+        
+        def run():
+            while not self._janitor_stop.wait(interval):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.warning(f"캐시 정리 작업 실패: {str(e)}")
+        
+        self._janitor_thread = threading.Thread(target=run, name="cache-janitor", daemon=True)
+        self._janitor_thread.start()
+        logger.info(f"캐시 정리 작업 시작 (주기: {interval}초)")
+    
+    def stop_janitor(self):
+        """백그라운드 정리 작업 중지"""
+        self._janitor_stop.set()
+        if self._janitor_thread:
+            self._janitor_thread.join(timeout=5)
+            self._janitor_thread = None
+    
+    def _memory_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """메모리 캐시 조회 (만료 항목은 제거)"""
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                self._counters["memory"]["misses"] += 1
+                self._export_count("memory", "misses")
+                return None
+            
+            raw, cached_ts = entry
+            if time.time() - cached_ts > self.ttl.total_seconds():
+                self._memory_bytes -= len(raw)
+                del self._memory[cache_key]
+                self._counters["memory"]["misses"] += 1
+                self._export_count("memory", "misses")
+                return None
+            
+            self._memory.move_to_end(cache_key)
+            self._counters["memory"]["hits"] += 1
+            self._export_count("memory", "hits")
+        
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 매번 역직렬화
+        return _loads(raw)
+    
+    def _memory_put(self, cache_key: str, raw: bytes, cached_ts: float):
+        """메모리 캐시 저장 (용량 초과 시 LRU 순으로 제거)"""
+        if len(raw) > self.memory_max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._memory.pop(cache_key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous[0])
+            
+            self._memory[cache_key] = (raw, cached_ts)
+            self._memory_bytes += len(raw)
+            
+            while self._memory_bytes > self.memory_max_bytes:
+                _, (evicted_raw, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted_raw)
+                self._counters["memory"]["evictions"] += 1
+                self._export_count("memory", "evictions")
+    
+    def _memory_discard(self, cache_key: str):
+        """메모리 캐시 항목 제거"""
+        with self._lock:
+            entry = self._memory.pop(cache_key, None)
+            if entry is not None:
+                self._memory_bytes -= len(entry[0])
+    
+    def _count(self, tier: str, counter: str):
+        """계층별 카운터 증가"""
+        with self._lock:
+            self._counters[tier][counter] += 1
+        self._export_count(tier, counter)
+    
+    @staticmethod
+    def _export_count(tier: str, counter: str):
+        """계층별 카운터를 /metrics 지표로 기록"""
+        if counter == "evictions":
+            metrics.inc("cache_evictions_total", cache="analysis", tier=tier)
+        else:
+            metrics.inc("cache_requests_total", cache="analysis", tier=tier, result="hit" if counter == "hits" else "miss")
+    
     def get_stats(self) -> Dict[str, Any]:
-        """캐시 통계 조회"""
-        files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
-        total_size = sum(
-            os.path.getsize(os.path.join(self.cache_dir, f)) 
-            for f in files
-        )
+        """캐시 통계 조회 (계층별 히트/미스/제거 카운터 포함)"""
+        with self._index_lock:
+            disk_count, total_size = self._disk_totals()
+        
+        with self._lock:
+            memory_stats = {
+                'count': len(self._memory),
+                'size_kb': round(self._memory_bytes / 1024, 2),
+                'max_size_kb': round(self.memory_max_bytes / 1024, 2),
+                **self._counters["memory"]
+            }
+            disk_counters = dict(self._counters["disk"])
         
         return {
-            'count': len(files),
+            'count': disk_count,
             'total_size_kb': round(total_size / 1024, 2),
-            'cache_dir': self.cache_dir
+            'cache_dir': self.cache_dir,
+            'memory': memory_stats,
+            'disk': {
+                'count': disk_count,
+                'size_kb': round(total_size / 1024, 2),
+                'max_size_kb': round(self.max_size_bytes / 1024, 2),
+                'max_entries': self.max_entries,
+                **disk_counters
+            }
         }
 
 
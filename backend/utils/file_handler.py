@@ -6,7 +6,9 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+from config.settings import settings
+from backend.utils.validator import validator
 
 
 class FileHandler:
@@ -52,6 +54,52 @@ class FileHandler:
         temp_file.close()
         return temp_file.name
     
+    @staticmethod
+    async def spool_upload(upload_file, suffix: str = "", chunk_size: int = None) -> Tuple[bool, str]:
+        """
+        업로드 파일을 청크 단위로 임시 파일에 복사 (메모리에 전체를 올리지 않음)
+        
+        multipart 본문은 이 함수가 호출되기 전에 Starlette가 이미 스풀링하므로
+        수신 크기 제한은 UploadSizeLimitMiddleware가 담당하고, 여기서는 파일 크기만 재검증
+        
+        Args:
+            upload_file: FastAPI UploadFile 객체
+            suffix: 임시 파일 확장자
+            chunk_size: 한 번에 읽을 바이트 수 (없으면 설정값)
+            
+        Returns:
+            (성공 여부, 임시 파일 경로 또는 에러 메시지)
+        """
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_BYTES
+        temp_path = FileHandler.create_temp_file(suffix=suffix)
+        written = 0
+        
+        try:
+            with open(temp_path, "wb") as f:
+                while True:
+                    chunk = await upload_file.read(chunk_size)
+                    if not chunk:
+                        break
+                    
+                    written += len(chunk)
+                    # 제한을 넘는 파일은 끝까지 복사하지 않고 중단
+                    is_valid, message = validator.validate_file_size(written)
+                    if not is_valid:
+                        FileHandler.delete_file(temp_path)
+                        return False, message
+                    
+                    f.write(chunk)
+        except Exception:
+            FileHandler.delete_file(temp_path)
+            raise
+        
+        is_valid, message = validator.validate_file_size(written)
+        if not is_valid:
+            FileHandler.delete_file(temp_path)
+            return False, message
+        
+        return True, temp_path
+    
     @staticmethod
     def delete_file(file_path: str) -> bool:
         """파일 삭제"""
@@ -0,0 +1,198 @@
+"""
+경량 지표 수집
+구간 타이머(span)로 히스토그램/카운터를 프로세스 메모리에 모아 Prometheus 텍스트 형식으로 노출하고,
+요청 단위 구간별 소요시간은 contextvars로 수집 (asyncio 태스크와 스레드풀 호출에도 전파됨)
+"""
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+# 구간 소요시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# 지표 설명 (Prometheus HELP)
+METRIC_HELP = {
+    "phase_duration_seconds": "요청 처리 구간별 소요시간 (초)",
+    "analyze_requests_total": "분석 요청 수 (결과별)",
+    "cache_requests_total": "캐시 조회 수 (캐시/계층/결과별)",
+    "cache_evictions_total": "캐시 제거 수 (캐시/계층별)",
+    "llm_requests_total": "LLM 호출 시도 수 (백엔드/결과별)",
+    "llm_retries_total": "LLM 호출 재시도 수 (백엔드/사유별)",
+    "llm_tokens_total": "LLM 토큰 사용량 (백엔드/종류별: prompt, output, cached)",
+    "parsed_bytes_total": "파서가 처리한 원본 파일 크기 (형식별, 바이트)",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# 현재 요청의 구간별 소요시간 (track_request 범위 밖이면 None)
+_request_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+class _Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """카운터/히스토그램 레지스트리 (스레드 안전)"""
+
+    def __init__(self, prefix: str = "narastore", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        레지스트리 초기화
+
+        Args:
+            prefix: 노출 시 지표 이름 앞에 붙일 접두사
+            buckets: 히스토그램 버킷 상한 (초)
+        """
+        self.prefix = prefix
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> LabelKey:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """
+        카운터 증가
+
+        Args:
+            name: 지표 이름 (접두사 제외)
+            value: 증가량
+            **labels: 레이블
+        """
+        if not value:
+            return
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 기록"""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def record(self, phase: str, seconds: float):
+        """
+        이미 측정한 구간 소요시간 기록 (히스토그램 + 현재 요청의 구간별 소요시간에 누적)
+
+        Args:
+            phase: 구간 이름 (예: "parse.extract", "llm.call")
+            seconds: 소요시간 (초)
+        """
+        self.observe("phase_duration_seconds", seconds, phase=phase)
+        timings = _request_timings.get()
+        if timings is not None:
+            with self._lock:
+                timings[phase] = round(timings.get(phase, 0.0) + seconds, 4)
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """구간 타이머 (with 블록 소요시간 기록, 같은 요청에서 반복되면 합산)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def timed(self, phase: str):
+        """함수 전체를 구간으로 기록하는 데코레이터 (동기/async 함수 모두 지원)"""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(phase):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(phase):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def track_request(self) -> Iterator[Dict[str, float]]:
+        """
+        요청 단위 구간별 소요시간 수집 범위
+
+        Yields:
+            범위 안에서 기록된 구간별 소요시간 dict (범위 종료 후에도 유효)
+        """
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        try:
+            yield timings
+        finally:
+            _request_timings.reset(token)
+
+    @staticmethod
+    def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = key + extra
+        if not pairs:
+            return ""
+        escaped = (
+            f'{name}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for name, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{full_name}{self._format_labels(key)} {int(value) if value.is_integer() else value}")
+
+            for name in sorted(self._histograms):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{full_name}_bucket{self._format_labels(key, (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{full_name}_bucket{self._format_labels(key, (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{full_name}_sum{self._format_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{full_name}_count{self._format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """모든 지표 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# 전역 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,163 @@
+"""
+문서 파싱 결과 캐시
+원본 파일 해시로 정제된 텍스트를 저장하여 동일 문서의 재파싱 방지
+"""
+import hashlib
+import os
+import threading
+import zlib
+from typing import Optional, Dict, Any
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+class ParseCache:
+    """파싱 결과 캐시 관리 (내용 주소 기반, 크기 제한 LRU)"""
+
+    FILE_SUFFIX = ".txt.z"
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str = None, max_size_mb: int = None):
+        """
+        캐시 초기화
+
+        Args:
+            cache_dir: 캐시 저장 디렉토리
+            max_size_mb: 캐시 최대 용량 (MB, 초과 시 오래 사용하지 않은 항목부터 삭제)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(settings.BASE_DIR, "data", "parse_cache")
+
+        self.cache_dir = cache_dir
+        self.max_size_bytes = (max_size_mb or settings.PARSE_CACHE_MAX_MB) * 1024 * 1024
+        self._total_size: Optional[int] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, file_path: str, parser_version: str) -> str:
+        """
+        원본 파일 바이트 + 파서 버전으로 캐시 키 생성 (청크 단위 스트리밍 해시)
+
+        Args:
+            file_path: 원본 파일 경로
+            parser_version: 파서 버전 (파서 변경 시 기존 캐시 무효화)
+        """
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(f"parser:{parser_version}\n".encode())
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.READ_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _get_cache_path(self, cache_key: str) -> str:
+        """캐시 파일 경로"""
+        return os.path.join(self.cache_dir, f"{cache_key}{self.FILE_SUFFIX}")
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        캐시에서 파싱 결과 조회
+
+        Returns:
+            정제된 텍스트 또는 None
+        """
+        cache_path = self._get_cache_path(cache_key)
+
+        try:
+            with open(cache_path, "rb") as f:
+                text = zlib.decompress(f.read()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"파싱 캐시 조회 실패: {str(e)}")
+            return None
+
+        # 접근 시각 갱신 (LRU 기준)
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        logger.info(f"파싱 캐시 히트: {cache_key[:8]}...")
+        return text
+
+    def set(self, cache_key: str, text: str) -> bool:
+        """
+        파싱 결과를 압축하여 저장
+
+        Returns:
+            저장 성공 여부
+        """
+        cache_path = self._get_cache_path(cache_key)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            data = zlib.compress(text.encode("utf-8"), 6)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+
+            with self._lock:
+                if self._total_size is not None:
+                    self._total_size += len(data)
+
+            logger.info(f"파싱 캐시 저장: {cache_key[:8]}... ({len(data) / 1024:.1f}KB)")
+            self._evict_if_needed()
+            return True
+
+        except Exception as e:
+            logger.warning(f"파싱 캐시 저장 실패: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def _scan(self) -> list:
+        """캐시 파일 목록 (경로, 크기, 최근 접근 시각)"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(self.FILE_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_if_needed(self):
+        """용량 초과 시 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(size for _, size, _ in self._scan())
+
+            if self._total_size <= self.max_size_bytes:
+                return
+
+            entries = sorted(self._scan(), key=lambda item: item[2])
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+
+            for path, size, _ in entries:
+                if total <= self.max_size_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    evicted += 1
+                except OSError:
+                    pass
+
+            self._total_size = total
+
+        logger.info(f"파싱 캐시 정리: {evicted}개 항목 삭제")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        entries = self._scan()
+        return {
+            "count": len(entries),
+            "total_size_kb": round(sum(size for _, size, _ in entries) / 1024, 2),
+            "max_size_kb": round(self.max_size_bytes / 1024, 2),
+            "cache_dir": self.cache_dir
+        }
+
+
+# 전역 파싱 캐시 인스턴스
+parse_cache = ParseCache()
@@ -0,0 +1,105 @@
+"""
+동일 작업 중복 실행 방지 (single-flight)
+같은 키로 동시에 들어온 요청은 먼저 시작한 1건의 결과를 함께 받음
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from backend.utils.logger import logger
+
+
+class SingleFlight:
+    """키별 진행 중 작업 레지스트리 (스레드/asyncio 호출자 공용)"""
+
+    def __init__(self):
+        """레지스트리 초기화"""
+        # 키 -> 진행 중 작업의 결과 Future (스레드/이벤트 루프 어디서든 대기 가능)
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """진행 중 작업에 합류하거나 새 작업의 주도자로 등록 (Future, 주도자 여부)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+            self._stats["leaders"] += 1
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: BaseException = None):
+        """작업 결과를 대기 중인 호출자에게 전달하고 레지스트리에서 제거"""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        작업 실행 (같은 키의 작업이 진행 중이면 완료될 때까지 대기 후 그 결과 반환)
+
+        Args:
+            key: 작업 식별 키
+            fn: 실행할 함수
+
+        Returns:
+            (결과, 다른 호출의 결과를 공유받았는지 여부)
+        """
+        future, leader = self._join(key)
+        if not leader:
+            logger.info(f"진행 중인 동일 작업에 합류: {key[:8]}...")
+            return future.result(), True
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result, False
+
+    async def do_async(self, key: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        작업 실행 (asyncio, 이벤트 루프를 블로킹하지 않고 대기)
+
+        Args:
+            key: 작업 식별 키
+            fn: 실행할 코루틴 함수
+
+        Returns:
+            (결과, 다른 호출의 결과를 공유받았는지 여부)
+        """
+        future, leader = self._join(key)
+        if not leader:
+            logger.info(f"진행 중인 동일 작업에 합류: {key[:8]}...")
+            # 대기 중인 호출자 1명이 취소되어도 공유 작업은 취소되지 않도록 shield
+            return await asyncio.shield(asyncio.wrap_future(future)), True
+
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            # 주도자가 취소된 경우에도 대기자가 영원히 기다리지 않도록 에러 전달 (대기자까지 취소 전파하지 않음)
+            self._finish(key, future, error=RuntimeError("공유 중인 작업이 취소되었습니다."))
+            raise
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result, False
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 조회 (주도 실행 수, 합류한 대기자 수, 진행 중 작업 수)"""
+        with self._lock:
+            return {"in_flight": len(self._calls), **self._stats}
+
+
+# 전역 인스턴스
+single_flight = SingleFlight()
@@ -0,0 +1,76 @@
+"""
+업로드 크기 제한 미들웨어
+multipart 본문이 Starlette에 의해 디스크로 스풀링되기 전에 크기 제한을 적용
+"""
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from config.settings import settings
+from backend.utils.logger import logger
+
+
+# multipart 경계, 파트 헤더, api_key 등 폼 필드에 허용하는 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    multipart 업로드 요청의 본문 크기를 수신 단계에서 제한하는 ASGI 미들웨어
+
+    - Content-Length 헤더가 제한을 넘으면 본문을 읽지 않고 즉시 413 응답
+    - 헤더가 없거나(청크 전송) 실제 본문이 헤더보다 크면 수신 도중 누적 바이트로 중단
+    """
+
+    def __init__(self, app, max_body_bytes: int = None):
+        self.app = app
+        self.max_body_bytes = max_body_bytes or settings.MAX_FILE_SIZE_BYTES + MULTIPART_OVERHEAD_BYTES
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._is_multipart(scope):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = self._content_length(scope)
+        if content_length is not None and content_length > self.max_body_bytes:
+            logger.warning(f"업로드 거부 (Content-Length {content_length} bytes): {scope.get('path')}")
+            response = JSONResponse(status_code=413, content={"detail": self._message(content_length)})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    logger.warning(f"업로드 수신 중단 ({received} bytes 초과): {scope.get('path')}")
+                    raise HTTPException(status_code=413, detail=self._message(received))
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    def _is_multipart(scope) -> bool:
+        """multipart/form-data 요청 여부"""
+        for name, value in scope.get("headers", []):
+            if name == b"content-type":
+                return value.lower().startswith(b"multipart/form-data")
+        return False
+
+    @staticmethod
+    def _content_length(scope):
+        """Content-Length 헤더 값 (없거나 잘못된 값이면 None)"""
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    @staticmethod
+    def _message(size: int) -> str:
+        """크기 초과 에러 메시지"""
+        current_mb = size / (1024 * 1024)
+        return f"파일 크기가 너무 큽니다. (최대: {settings.MAX_FILE_SIZE_MB}MB, 현재: {current_mb:.2f}MB)"
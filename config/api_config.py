@@ -14,6 +14,7 @@ class GeminiConfig:
     TOP_P: float = 0.95
     TOP_K: int = 40
     MAX_OUTPUT_TOKENS: int = 8192
+    MAX_CONTINUATIONS: int = 2  # 출력 토큰 한도로 잘린 구조화 응답의 이어쓰기 최대 횟수
     
     # 안전 설정
     SAFETY_SETTINGS = [
@@ -37,7 +38,8 @@ class GeminiConfig:
     
     # 재시도 설정
     MAX_RETRIES: int = 3
-    RETRY_DELAY: int = 2  # 초
+    RETRY_DELAY: int = 2  # 초 (지수 백오프 기준값)
+    MAX_RETRY_DELAY: int = 30  # 초 (백오프 상한)
     TIMEOUT: int = 300  # 초
 
 
@@ -3,6 +3,7 @@
 환경변수 로드 및 기본값 설정
 """
 import os
+from typing import Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,6 +22,82 @@ class Settings:
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "50"))
     MAX_FILE_SIZE_BYTES: int = MAX_FILE_SIZE_MB * 1024 * 1024
     ALLOWED_EXTENSIONS: list = [".pdf", ".hwp", ".pptx"]
+    UPLOAD_CHUNK_SIZE_BYTES: int = int(os.getenv("UPLOAD_CHUNK_SIZE_KB", "1024")) * 1024
+    
+    # 문서 파싱 설정 (PARSE_WORKERS=0 이면 프로세스 풀 없이 직접 파싱)
+    PARSE_WORKERS: int = int(os.getenv("PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PARSE_TIMEOUT_SECONDS: int = int(os.getenv("PARSE_TIMEOUT_SECONDS", "120"))
+    PDF_PAGE_WORKERS: int = int(os.getenv("PDF_PAGE_WORKERS", "1"))
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "100"))
+    PARSE_CACHE_ENABLED: bool = os.getenv("PARSE_CACHE_ENABLED", "True").lower() == "true"
+    PARSE_CACHE_MAX_MB: int = int(os.getenv("PARSE_CACHE_MAX_MB", "512"))
+    HWP_PARALLEL_MIN_SECTIONS: int = int(os.getenv("HWP_PARALLEL_MIN_SECTIONS", "4"))
+    
+    # Gemini 클라이언트 풀 설정 (API 키별 연결 재사용)
+    GEMINI_CLIENT_POOL_MAX: int = int(os.getenv("GEMINI_CLIENT_POOL_MAX", "32"))
+    GEMINI_CLIENT_IDLE_SECONDS: int = int(os.getenv("GEMINI_CLIENT_IDLE_SECONDS", "900"))
+    
+    # Gemini 호출 속도 제한 (API 키별 분당 요청/토큰 수, 동시 실행 수, 대기 마감 시간)
+    GEMINI_RPM_LIMIT: int = int(os.getenv("GEMINI_RPM_LIMIT", "60"))
+    GEMINI_TPM_LIMIT: int = int(os.getenv("GEMINI_TPM_LIMIT", "1000000"))
+    GEMINI_MAX_IN_FLIGHT: int = int(os.getenv("GEMINI_MAX_IN_FLIGHT", "4"))
+    GEMINI_QUEUE_TIMEOUT_SECONDS: int = int(os.getenv("GEMINI_QUEUE_TIMEOUT_SECONDS", "120"))
+    
+    # Gemini 접속 지점 (비우면 기본 엔드포인트, 로컬 스텁 서버는 GEMINI_API_INSECURE=true와 함께 사용)
+    GEMINI_API_ENDPOINT: str = os.getenv("GEMINI_API_ENDPOINT", "")
+    GEMINI_API_INSECURE: bool = os.getenv("GEMINI_API_INSECURE", "False").lower() == "true"
+    
+    # LLM 백엔드 (gemini: Gemini API, stub: 네트워크 없이 스키마 샘플을 반환하는 로컬 부하 테스트용 백엔드)
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "gemini")
+    LLM_STUB_LATENCY_SECONDS: float = float(os.getenv("LLM_STUB_LATENCY_SECONDS", "0.5"))
+    LLM_STUB_JITTER_SECONDS: float = float(os.getenv("LLM_STUB_JITTER_SECONDS", "0.2"))
+    LLM_STUB_ERROR_RATE: float = float(os.getenv("LLM_STUB_ERROR_RATE", "0.0"))
+    LLM_STUB_SEED: Optional[int] = int(os.getenv("LLM_STUB_SEED")) if os.getenv("LLM_STUB_SEED") else None
+    
+    # Gemini 컨텍스트 캐시 (고정 분석 지침을 서버 측 캐시로 재사용, 최소 토큰 수 미만이면 전체 프롬프트 전송)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "False").lower() == "true"
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600"))
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "1024"))
+    
+    # 토큰 계산 설정 (heuristic: 보정된 오프라인 추정, gemini: 맵리듀스 판단 시 문서 전체만 count_tokens API로 1회 계산 + 해시 캐시)
+    TOKEN_COUNTER: str = os.getenv("TOKEN_COUNTER", "heuristic")
+    TOKEN_CALIBRATION_PATH: str = os.getenv(
+        "TOKEN_CALIBRATION_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "token_calibration.json")
+    )
+    TOKEN_COUNT_CACHE_SIZE: int = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "1024"))
+    
+    # 대용량 문서 맵리듀스 분석 설정 (추정 토큰 수가 임계값을 넘으면 청크 분할 분석)
+    ANALYSIS_MAP_REDUCE_ENABLED: bool = os.getenv("ANALYSIS_MAP_REDUCE_ENABLED", "True").lower() == "true"
+    ANALYSIS_MAP_REDUCE_THRESHOLD_TOKENS: int = int(os.getenv("ANALYSIS_MAP_REDUCE_THRESHOLD_TOKENS", "120000"))
+    ANALYSIS_CHUNK_TOKENS: int = int(os.getenv("ANALYSIS_CHUNK_TOKENS", "30000"))
+    ANALYSIS_MAP_CONCURRENCY: int = int(os.getenv("ANALYSIS_MAP_CONCURRENCY", "4"))
+    ANALYSIS_REDUCE_CONTEXT_TOKENS: int = int(os.getenv("ANALYSIS_REDUCE_CONTEXT_TOKENS", "20000"))
+    
+    # 섹션별 분할 분석 설정 (요약/요구사항/전략/인력/To-Do를 독립 호출로 동시 생성)
+    ANALYSIS_FANOUT_ENABLED: bool = os.getenv("ANALYSIS_FANOUT_ENABLED", "False").lower() == "true"
+    ANALYSIS_FANOUT_CONCURRENCY: int = int(os.getenv("ANALYSIS_FANOUT_CONCURRENCY", "5"))
+    
+    # 파싱된 문서 저장소 설정 (업로드 후 스트리밍 분석 등에서 재사용)
+    DOCUMENT_STORE_TTL_MINUTES: int = int(os.getenv("DOCUMENT_STORE_TTL_MINUTES", "60"))
+    DOCUMENT_STORE_MAX_ENTRIES: int = int(os.getenv("DOCUMENT_STORE_MAX_ENTRIES", "100"))
+    
+    # 분석 세션 설정 (원문 + 1차 분석 결과를 보관하여 후속 요청에서 재사용, 마지막 사용 기준 TTL)
+    SESSION_TTL_MINUTES: int = int(os.getenv("SESSION_TTL_MINUTES", "120"))
+    SESSION_MAX_ENTRIES: int = int(os.getenv("SESSION_MAX_ENTRIES", "100"))
+    SESSION_MAX_TURNS: int = int(os.getenv("SESSION_MAX_TURNS", "6"))
+    
+    # 분석 결과 캐시 설정 (메모리 1차 캐시 용량, 디스크 상한 및 정리 주기)
+    ANALYSIS_CACHE_MEMORY_MB: int = int(os.getenv("ANALYSIS_CACHE_MEMORY_MB", "64"))
+    ANALYSIS_CACHE_MAX_MB: int = int(os.getenv("ANALYSIS_CACHE_MAX_MB", "512"))
+    ANALYSIS_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+    ANALYSIS_CACHE_SWEEP_SECONDS: int = int(os.getenv("ANALYSIS_CACHE_SWEEP_SECONDS", "300"))
+    ANALYSIS_CACHE_EVICTION: str = os.getenv("ANALYSIS_CACHE_EVICTION", "lru")  # lru | age
+    
+    # 분석 작업 큐 설정
+    JOB_MAX_WORKERS: int = int(os.getenv("JOB_MAX_WORKERS", "2"))
+    JOB_QUEUE_MAX_SIZE: int = int(os.getenv("JOB_QUEUE_MAX_SIZE", "20"))
+    JOB_RESULT_TTL_MINUTES: int = int(os.getenv("JOB_RESULT_TTL_MINUTES", "60"))
     
     # 앱 설정
     APP_TITLE: str = os.getenv("APP_TITLE", "NaraStore 제안서 분석 서비스")
@@ -40,6 +117,9 @@ class Settings:
         if cls.MAX_FILE_SIZE_MB <= 0:
             return False, "MAX_FILE_SIZE_MB는 0보다 커야 합니다."
         
+        if cls.JOB_MAX_WORKERS <= 0 or cls.JOB_QUEUE_MAX_SIZE <= 0:
+            return False, "JOB_MAX_WORKERS와 JOB_QUEUE_MAX_SIZE는 0보다 커야 합니다."
+        
         return True, "설정이 유효합니다."
     
     @classmethod
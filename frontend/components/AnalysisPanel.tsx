@@ -122,7 +122,7 @@ const AnalysisPanel: React.FC<AnalysisPanelProps> = ({ currentRFP, onUpload, isA
       </div>
 
       <div className="flex-1 overflow-y-auto custom-scrollbar px-6 md:px-8 relative min-h-0" id="report-content">
-        {isAnalyzing ? (
+        {isAnalyzing && !currentRFP?.structuredAnalysis ? (
           <div className="absolute inset-0 bg-white/60 backdrop-blur-[2px] z-20 flex flex-col items-center justify-center space-y-4">
             <div className="relative">
               <div className="w-12 h-12 border-4 border-indigo-100 border-t-indigo-600 rounded-full animate-spin"></div>
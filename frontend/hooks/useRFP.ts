@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
-import { RFP, TodoItem } from '../types';
+import { AnalysisResultData, RFP, TodoItem } from '../types';
 import { dbService } from '../services/dbService';
-import { analyzeRFP } from '../services/apiService';
+import { analyzeRFPStream, createEmptyAnalysis } from '../services/apiService';
 
 export const useRFP = (apiKey: string) => {
     const [rfps, setRfps] = useState<RFP[]>([]);
@@ -9,6 +9,8 @@ export const useRFP = (apiKey: string) => {
     const [todos, setTodos] = useState<TodoItem[]>([]);
     const [isAnalyzing, setIsAnalyzing] = useState(false);
     const [analysisError, setAnalysisError] = useState('');
+    // 스트리밍 분석 중 도착한 섹션 (완료 전까지 선택된 RFP에 덧씌워 표시)
+    const [streamingAnalysis, setStreamingAnalysis] = useState<{ rfpId: string; data: AnalysisResultData } | null>(null);
 
     // 1. Subscribe to RFPs
     useEffect(() => {
@@ -60,8 +62,20 @@ export const useRFP = (apiKey: string) => {
             };
             setSelectedRFP(tempRFP);
 
-            // Call Backend
-            const result = await analyzeRFP(file, effectiveApiKey);
+            // Call Backend (SSE): 섹션이 완성될 때마다 패널을 채움
+            let partial = createEmptyAnalysis();
+            const result = await analyzeRFPStream(file, effectiveApiKey, {
+                onSection: (name, value) => {
+                    partial = { ...partial, [name]: value };
+                    setStreamingAnalysis({ rfpId: newRFPId, data: partial });
+                },
+                onRequirement: (index, value) => {
+                    const requirements = [...partial.requirements];
+                    requirements[index] = value;
+                    partial = { ...partial, requirements };
+                    setStreamingAnalysis({ rfpId: newRFPId, data: partial });
+                },
+            });
 
             if (result.success && result.data) {
                 // Success: Update with structured data
@@ -99,6 +113,7 @@ export const useRFP = (apiKey: string) => {
             setAnalysisError('처리 중 오류가 발생했습니다.');
         } finally {
             setIsAnalyzing(false);
+            setStreamingAnalysis(null);
         }
     };
 
@@ -118,9 +133,14 @@ export const useRFP = (apiKey: string) => {
         }
     };
 
+    // 스트리밍 중인 RFP는 도착한 섹션을 덧씌워 반환
+    const displayedRFP = selectedRFP && streamingAnalysis?.rfpId === selectedRFP.id && !selectedRFP.structuredAnalysis
+        ? { ...selectedRFP, structuredAnalysis: streamingAnalysis.data }
+        : selectedRFP;
+
     return {
         rfps,
-        selectedRFP,
+        selectedRFP: displayedRFP,
         setSelectedRFP,
         todos,
         isAnalyzing,
@@ -5,7 +5,7 @@
 
 const API_BASE_URL = `http://${window.location.hostname}:8000`;
 
-import { AnalysisResultData } from '../types';
+import { AnalysisResultData, RequirementCategory } from '../types';
 
 export interface ApiAnalysisResponse {
   success: boolean;
@@ -20,19 +20,14 @@ export interface ApiAnalysisResponse {
  */
 export async function analyzeRFP(file: File, apiKey: string): Promise<ApiAnalysisResponse> {
   try {
-    // 파일을 base64로 인코딩
-    const fileContent = await fileToBase64(file);
+    // multipart 업로드 (base64 변환 없이 서버에서 스트리밍 저장)
+    const formData = new FormData();
+    formData.append('file', file);
+    formData.append('api_key', apiKey);
 
-    const response = await fetch(`${API_BASE_URL}/api/analyze`, {
+    const response = await fetch(`${API_BASE_URL}/api/analyze/upload`, {
       method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        filename: file.name,
-        file_content: fileContent,
-        api_key: apiKey,
-      }),
+      body: formData,
     });
 
     if (!response.ok) {
@@ -52,20 +47,132 @@ export async function analyzeRFP(file: File, apiKey: string): Promise<ApiAnalysi
 }
 
 /**
- * 파일을 base64 문자열로 변환
+ * 스트리밍 분석 이벤트 핸들러
  */
-function fileToBase64(file: File): Promise<string> {
-  return new Promise((resolve, reject) => {
-    const reader = new FileReader();
-    reader.readAsDataURL(file);
-    reader.onload = () => {
-      const result = reader.result as string;
-      // data:application/pdf;base64,... 형식에서 base64 부분만 추출
-      const base64 = result.split(',')[1];
-      resolve(base64);
-    };
-    reader.onerror = (error) => reject(error);
+export interface AnalysisStreamHandlers {
+  /** 최상위 섹션 완료 (summary, requirements, strategy, resource_requirements, todo_list) */
+  onSection?: (name: keyof AnalysisResultData, value: any) => void;
+  /** 요구사항 카테고리 1개 완료 */
+  onRequirement?: (index: number, value: RequirementCategory) => void;
+}
+
+/**
+ * 스트리밍 중 섹션을 채워 넣을 빈 분석 결과
+ */
+export function createEmptyAnalysis(): AnalysisResultData {
+  return {
+    summary: {
+      overview: '',
+      purpose: '',
+      key_keywords: [],
+      client_priorities: [],
+      expected_effects: [],
+      project_name: '',
+      period: '',
+      budget: '',
+      total_requirements_count: 0,
+    },
+    requirements: [],
+    strategy: {
+      anchor_points: [],
+      differentiation: [],
+      risk_mitigation: [],
+      win_strategy: [],
+      references: [],
+    },
+    resource_requirements: [],
+    todo_list: [],
+  };
+}
+
+/**
+ * 문서 업로드 및 파싱 (스트리밍 분석용 문서 ID 발급)
+ * @param file 업로드할 파일
+ */
+export async function uploadDocument(file: File): Promise<string> {
+  const formData = new FormData();
+  formData.append('file', file);
+
+  const response = await fetch(`${API_BASE_URL}/api/documents`, {
+    method: 'POST',
+    body: formData,
   });
+
+  const result = await response.json();
+  if (!response.ok) {
+    throw new Error(result.error || `HTTP error! status: ${response.status}`);
+  }
+  return result.document_id;
+}
+
+/**
+ * 제안서 스트리밍 분석 API 호출 (Server-Sent Events)
+ * 섹션이 완성될 때마다 handlers를 호출하고, 최종 결과를 반환
+ * (EventSource는 헤더를 보낼 수 없으므로 fetch 스트림으로 직접 읽음)
+ * @param file 업로드할 파일
+ * @param apiKey Gemini API Key
+ * @param handlers 섹션/요구사항 완료 콜백
+ */
+export async function analyzeRFPStream(
+  file: File,
+  apiKey: string,
+  handlers: AnalysisStreamHandlers = {}
+): Promise<ApiAnalysisResponse> {
+  try {
+    const documentId = await uploadDocument(file);
+
+    const response = await fetch(
+      `${API_BASE_URL}/api/analyze/stream?document_id=${encodeURIComponent(documentId)}`,
+      { headers: { 'X-API-Key': apiKey, Accept: 'text/event-stream' } }
+    );
+
+    if (!response.ok || !response.body) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let finalResult: ApiAnalysisResponse | null = null;
+
+    const dispatch = (rawEvent: string) => {
+      let event = 'message';
+      const dataLines: string[] = [];
+      for (const line of rawEvent.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        else if (line.startsWith('data:')) dataLines.push(line.slice(5).trimStart());
+      }
+      if (dataLines.length === 0) return;
+      const data = JSON.parse(dataLines.join('\n'));
+
+      if (event === 'section') handlers.onSection?.(data.name, data.value);
+      else if (event === 'requirement') handlers.onRequirement?.(data.index, data.value);
+      else if (event === 'result') finalResult = { success: true, data };
+      else if (event === 'error') finalResult = { success: false, error: data.error };
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        dispatch(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+      }
+    }
+    if (buffer.trim()) dispatch(buffer);
+
+    return finalResult ?? { success: false, error: '분석 결과를 받지 못했습니다. (스트림 종료)' };
+  } catch (error) {
+    console.error('Error streaming RFP analysis:', error);
+    return {
+      success: false,
+      error: error instanceof Error ? error.message : '분석 중 오류가 발생했습니다.',
+    };
+  }
 }
 
 /**
@@ -0,0 +1,10 @@
+"""
+pytest 공통 설정
+프로젝트 루트를 import 경로에 추가 (backend/config 패키지를 루트 기준으로 import)
+"""
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -0,0 +1,116 @@
+"""
+AnalysisCache 디스크 계층 테스트
+공유 인덱스 기준 용량/항목 수 상한, LRU/생성 순 제거, 만료, 정리 작업
+"""
+import os
+import time
+import pytest
+from backend.utils.cache import AnalysisCache
+
+
+def _cache(cache_dir, **kwargs) -> AnalysisCache:
+    return AnalysisCache(cache_dir=str(cache_dir), memory_max_mb=1, max_size_mb=64, max_entries=1000, **kwargs)
+
+
+def _fill(cache, count: int, payload: str = "x" * 1000):
+    """문서 count개의 결과 저장 (생성/접근 시각 순서가 구분되도록 간격을 둠)"""
+    for index in range(count):
+        cache.set(f"문서 {index}", "structured_analysis", {"index": index, "payload": payload})
+        time.sleep(0.002)
+
+
+def _cached_indexes(cache, count: int):
+    return [index for index in range(count) if cache.get(f"문서 {index}", "structured_analysis") is not None]
+
+
+def test_roundtrip_and_backend_isolation(tmp_path):
+    """같은 입력은 히트, 다른 백엔드 결과는 별도 항목"""
+    cache = _cache(tmp_path)
+    cache.set("문서", "structured_analysis", {"a": 1}, backend="stub")
+
+    assert cache.get("문서", "structured_analysis", backend="stub") == {"a": 1}
+    assert cache.get("문서", "structured_analysis") is None
+    assert cache.get_stats()["disk"]["count"] == 1
+
+
+def test_sweep_by_size_keeps_recently_used(tmp_path):
+    """용량 상한을 넘으면 최근 접근이 오래된 항목부터 상한 이하가 될 때까지만 제거"""
+    cache = _cache(tmp_path)
+    _fill(cache, 10)
+    entry_size = cache.get_stats()["disk"]["size_kb"] * 1024 / 10
+    cache.max_size_bytes = int(entry_size * 4.5)
+
+    # 가장 먼저 만든 항목을 최근 사용으로 만듦
+    cache.get("문서 0", "structured_analysis")
+    result = cache.sweep()
+
+    assert result == {"expired": 0, "evicted": 6}
+    assert cache.get_stats()["disk"]["count"] == 4
+    assert cache.get_stats()["disk"]["evictions"] == 6
+    assert _cached_indexes(cache, 10) == [0, 7, 8, 9]
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".json")]) == 4
+
+
+def test_sweep_by_entries_age_policy(tmp_path):
+    """age 정책은 접근 여부와 관계없이 생성 순으로 제거"""
+    cache = _cache(tmp_path)
+    cache.eviction_policy = "age"
+    cache.max_entries = 3
+    _fill(cache, 5)
+    cache.get("문서 0", "structured_analysis")
+
+    assert cache.sweep()["evicted"] == 2
+    assert _cached_indexes(cache, 5) == [2, 3, 4]
+
+
+def test_sweep_expired(tmp_path):
+    """TTL이 지난 항목은 용량과 관계없이 제거"""
+    cache = _cache(tmp_path, ttl_hours=0)
+    _fill(cache, 3)
+
+    assert cache.sweep() == {"expired": 3, "evicted": 0}
+    assert cache.get_stats()["disk"]["count"] == 0
+
+
+def test_caps_apply_across_instances(tmp_path):
+    """같은 디렉토리를 쓰는 다른 인스턴스(워커 프로세스)의 저장/정리도 합계에 반영"""
+    first = _cache(tmp_path)
+    second = _cache(tmp_path)
+    first.set("A", "structured_analysis", {"v": "a"})
+    second.set("B", "structured_analysis", {"v": "b"})
+    second.set("C", "structured_analysis", {"v": "c"})
+
+    assert first.get_stats()["disk"]["count"] == 3
+
+    first.max_entries = 2
+    assert first.sweep()["evicted"] == 1
+    assert second.get_stats()["disk"]["count"] == 2
+    # 다른 인스턴스가 이미 상한을 맞췄으므로 추가 제거 없음
+    second.max_entries = 2
+    assert second.sweep()["evicted"] == 0
+
+
+def test_index_rebuilt_from_existing_files(tmp_path):
+    """인덱스가 비어 있으면 기존 캐시 파일로 재구성"""
+    cache = _cache(tmp_path)
+    _fill(cache, 3)
+    cache._index.execute("DELETE FROM entries")
+
+    reopened = _cache(tmp_path)
+    assert reopened.get_stats()["disk"]["count"] == 3
+
+
+def test_janitor_runs_sweep(tmp_path):
+    """정리 작업 스레드가 주기적으로 상한 적용"""
+    cache = _cache(tmp_path)
+    _fill(cache, 4)
+    cache.max_entries = 1
+    cache.start_janitor(interval_seconds=0.05)
+    try:
+        deadline = time.monotonic() + 5
+        while cache.get_stats()["disk"]["count"] > 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        cache.stop_janitor()
+
+    assert cache.get_stats()["disk"]["count"] == 1
@@ -0,0 +1,63 @@
+"""
+DocumentChunker 테스트
+섹션 분할 왕복(이어 붙이면 원문), 토큰 예산 이내 분할, 경계 우선순위
+"""
+from backend.analyzer.prompt.chunker import document_chunker
+from backend.analyzer.prompt.optimizer import token_optimizer
+
+
+def _document(files: int = 2, pages: int = 3) -> str:
+    """파일 구분자/페이지 마커/섹션 제목이 있는 통합 문서 형식의 텍스트"""
+    parts = []
+    for file_index in range(files):
+        parts.append(f"\n\n{'=' * 80}\n파일: 문서{file_index}.pdf\n{'=' * 80}\n\n")
+        for page in range(1, pages + 1):
+            parts.append(f"\n--- 페이지 {page} ---\n")
+            parts.append(f"\n1. 사업 개요\n사업명은 차세대 시스템 구축이며 사업기간은 {page}개월입니다.\n\n")
+            parts.append("\n가. 과업 범위\n" + "요구사항 SFR-001 기능 구현 및 성능 시험을 수행한다.\n" * 20)
+            parts.append("\nⅡ. 제안요청 내용\n" + "보안 요구사항을 준수하고 산출물을 납품한다. " * 30 + "\n")
+    return "".join(parts)
+
+
+def test_split_sections_round_trips():
+    text = _document()
+    sections = document_chunker.split_sections(text)
+    assert "".join(sections) == text
+    assert len(sections) > 6 * 3
+
+
+def test_split_sections_starts_at_boundaries():
+    sections = document_chunker.split_sections(_document(files=1, pages=2))
+    heads = [section.lstrip("\n").split("\n", 1)[0] for section in sections]
+    assert "--- 페이지 1 ---" in heads
+    assert "1. 사업 개요" in heads
+    assert "가. 과업 범위" in heads
+    assert "Ⅱ. 제안요청 내용" in heads
+
+
+def test_split_sections_without_boundaries():
+    assert document_chunker.split_sections("경계 없는 한 줄") == ["경계 없는 한 줄"]
+    assert document_chunker.split_sections("") == []
+
+
+def test_split_respects_budget_and_order():
+    text = _document(files=3, pages=4)
+    chunks = document_chunker.split(text, 300)
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+    assert all(token_optimizer.estimate_tokens(chunk) <= 300 for chunk in chunks)
+
+
+def test_split_small_text_is_single_chunk():
+    text = _document(files=1, pages=1)
+    assert document_chunker.split(text, 1_000_000) == [text]
+    assert document_chunker.split("", 100) == []
+
+
+def test_split_hard_splits_text_without_boundaries():
+    text = "가" * 20000
+    chunks = document_chunker.split(text, 500)
+    assert "".join(chunks) == text
+    assert len(chunks) > 1
+    # 경계 없는 텍스트는 글자 수 비례로 자르므로 약간의 오차 허용
+    assert all(token_optimizer.estimate_tokens(chunk) <= 500 * 1.1 for chunk in chunks)
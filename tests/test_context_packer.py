@@ -0,0 +1,62 @@
+"""
+ContextPacker 테스트
+예산 이내 패킹, 관련 섹션 우선 선택, 원문 순서 유지, 생략 표시, 키워드 매칭
+"""
+from backend.analyzer.prompt.context_packer import ContextPacker, AhoCorasick, ELISION_MARKER, context_packer
+from backend.analyzer.prompt.optimizer import token_optimizer
+
+
+FILLER = "일반적인 안내 문구가 이어지는 단락입니다. " * 40
+
+
+def _document() -> str:
+    """관련 섹션(요구사항)과 무관한 섹션이 섞인 문서"""
+    sections = []
+    for index in range(1, 21):
+        if index in (5, 13):
+            body = "요구사항 SFR-00{0} 성능 보안 납품 산출물 기준을 충족해야 한다.\n".format(index) * 10
+        else:
+            body = FILLER + "\n"
+        sections.append(f"\n{index}. 항목 {index}\n{body}")
+    return "".join(sections)
+
+
+def test_small_text_is_returned_unchanged():
+    text = "1. 사업 개요\n요구사항 없음"
+    assert context_packer.pack(text, 10_000) == text
+
+
+def test_pack_fits_budget_and_prefers_relevant_sections():
+    text = _document()
+    packed = context_packer.pack(text, 1500)
+    assert token_optimizer.estimate_tokens(packed) <= 1500
+    assert "SFR-005" in packed and "SFR-0013" in packed
+    assert ELISION_MARKER.strip() in packed
+
+
+def test_pack_keeps_document_order():
+    packed = context_packer.pack(_document(), 1500)
+    assert packed.index("SFR-005") < packed.index("SFR-0013")
+
+
+def test_build_index_round_trips_and_scores():
+    text = _document()
+    index = context_packer.build_index(text)
+    assert "".join(section["text"] for section in index) == text
+    scores = {section["text"].lstrip("\n").split("\n", 1)[0]: section["score"] for section in index}
+    assert scores["5. 항목 5"] > scores["4. 항목 4"]
+    assert scores["4. 항목 4"] == 0.0
+
+
+def test_extra_keywords_raise_section_score():
+    text = "\n1. 첫째\n" + FILLER + "\n2. 둘째\n특수장비 도입 계획\n" + FILLER
+    plain = ContextPacker().build_index(text)
+    boosted = ContextPacker().build_index(text, keywords=["특수장비"])
+    assert plain[1]["score"] == 0.0
+    assert boosted[1]["score"] > 0.0
+
+
+def test_aho_corasick_finds_overlapping_keywords():
+    automaton = AhoCorasick(["과업", "과업범위", "범위"])
+    matches = sorted((pos, automaton.keywords[index]) for pos, index in automaton.iter_matches("본 과업범위는"))
+    assert [keyword for _, keyword in matches] == ["과업", "과업범위", "범위"]
@@ -0,0 +1,108 @@
+"""
+HWP 레코드 디코딩 테스트
+BodyText 섹션 레코드를 직접 만들어 PARA_TEXT 추출, 컨트롤 문자 처리, 압축 여부 판별을 확인
+"""
+import io
+import struct
+import zlib
+import pytest
+from backend.analyzer.parser import hwp_parser as hwp_module
+from backend.analyzer.parser.hwp_parser import HWPParser, HWPTAG_PARA_TEXT
+
+HWPTAG_PARA_HEADER = 0x10 + 50
+
+
+def _record(tag: int, payload: bytes, level: int = 0) -> bytes:
+    """레코드 헤더(Tag 10bit | Level 10bit | Size 12bit) + 페이로드, 큰 레코드는 확장 크기 사용"""
+    if len(payload) >= 0xFFF:
+        return struct.pack("<II", tag | (level << 10) | (0xFFF << 20), len(payload)) + payload
+    return struct.pack("<I", tag | (level << 10) | (len(payload) << 20)) + payload
+
+
+def _para(text: str) -> bytes:
+    """문단 헤더 + 문단 텍스트 레코드"""
+    return _record(HWPTAG_PARA_HEADER, b"\x00" * 22) + _record(HWPTAG_PARA_TEXT, text.encode("utf-16-le"), 1)
+
+
+def _deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _file_header(compressed: bool) -> bytes:
+    return b"HWP Document File".ljust(32, b"\x00") + struct.pack("<II", 0x05000300, int(compressed))
+
+
+class _FakeOle:
+    """HWP 파서가 사용하는 olefile.OleFileIO 메서드만 구현한 메모리 OLE 파일"""
+
+    def __init__(self, streams):
+        self._streams = streams
+
+    def exists(self, name):
+        return name in self._streams
+
+    def openstream(self, name):
+        return io.BytesIO(self._streams[name])
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_hwp(monkeypatch):
+    """스트림 dict로 가짜 HWP 파일을 열도록 olefile.OleFileIO 대체"""
+    def install(streams):
+        monkeypatch.setattr(hwp_module.olefile, "OleFileIO", lambda path: _FakeOle(streams))
+    return install
+
+
+def test_para_text_only():
+    """PARA_TEXT 레코드만 디코딩하고 문단 끝은 개행으로 변환"""
+    data = _para("첫 문단\r") + _record(HWPTAG_PARA_HEADER + 5, b"\x01\x02\x03\x04") + _para("둘째 문단\r")
+    assert HWPParser._decompress_section(data, compressed=False) == "첫 문단\n둘째 문단\n"
+
+
+def test_inline_controls():
+    """확장 컨트롤(8 WCHAR)은 제거, 탭 컨트롤은 탭으로 유지, 1 WCHAR 컨트롤은 치환"""
+    table = "\x0b" + "tbl " + "\x00" * 2 + "\x0b"
+    tab = "\t" + "\x00" * 6 + "\t"
+    text = f"표{table}앞{tab}뒤\x18하이픈\x1e묶음\x1f고정\n줄\r"
+    assert HWPParser._decompress_section(_para(text), compressed=False) == "표앞\t뒤-하이픈 묶음 고정\n줄\n"
+
+
+def test_extended_size_record():
+    """0xFFF 이상 크기의 레코드는 다음 4바이트를 실제 크기로 사용"""
+    long_text = "가" * 3000 + "\r"
+    data = _para(long_text) + _para("끝\r")
+    assert HWPParser._decompress_section(data, compressed=False) == "가" * 3000 + "\n끝\n"
+
+
+def test_truncated_record():
+    """잘린 마지막 레코드는 UTF-16 경계까지만 디코딩"""
+    data = _para("완전\r") + _para("잘린 문단\r")[:-3]
+    assert HWPParser._decompress_section(data, compressed=False) == "완전\n잘린 문"
+
+
+def test_compressed_section():
+    """압축된 섹션은 raw deflate 해제 후 디코딩, 압축이 아니면 원본 사용"""
+    data = _para("압축 문단\r")
+    assert HWPParser._decompress_section(_deflate(data), compressed=True) == "압축 문단\n"
+    assert HWPParser._decompress_section(data, compressed=True) == "압축 문단\n"
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+@pytest.mark.parametrize("sections", [1, 5])
+def test_extract_text(fake_hwp, compressed, sections):
+    """FileHeader 압축 플래그와 섹션 수(순차/병렬 디코딩)에 관계없이 섹션 순서대로 병합"""
+    encode = _deflate if compressed else (lambda data: data)
+    streams = {"FileHeader": _file_header(compressed)}
+    for index in range(sections):
+        streams[f"BodyText/Section{index}"] = encode(_para(f"섹션 {index}\r"))
+    fake_hwp(streams)
+
+    success, result = HWPParser.extract_text("sample.hwp")
+
+    assert success
+    assert result["total_sections"] == sections
+    assert result["text"] == "\n\n\n".join(f"섹션 {index}" for index in range(sections))
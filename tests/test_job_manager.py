@@ -0,0 +1,36 @@
+"""
+JobManager 조회 권한 테스트
+작업을 등록한 API 키로만 조회 가능, 원문 키는 작업에 남지 않음
+"""
+from backend.jobs.job_manager import JobManager, AnalysisJob
+
+
+def _manager_with_job(api_key: str):
+    manager = JobManager(max_workers=1, max_queue_size=1, result_ttl_minutes=1)
+    job = AnalysisJob("/nonexistent.pdf", "a.pdf", api_key)
+    manager._jobs[job.id] = job
+    return manager, job
+
+
+def test_owner_can_get_job():
+    manager, job = _manager_with_job("owner-key")
+    assert manager.get(job.id, "owner-key") is job
+    manager.shutdown()
+
+
+def test_other_key_gets_nothing():
+    manager, job = _manager_with_job("owner-key")
+    assert manager.get(job.id, "other-key") is None
+    assert manager.get(job.id, "") is None
+    assert manager.get("missing", "owner-key") is None
+    manager.shutdown()
+
+
+def test_owner_hash_outlives_raw_key():
+    """완료 후 원문 키를 폐기해도 해시로 조회 권한 확인"""
+    manager, job = _manager_with_job("owner-key")
+    manager._fail(job, "실패")
+    assert job._api_key is None
+    assert "owner-key" not in job.to_dict().values()
+    assert manager.get(job.id, "owner-key") is job
+    manager.shutdown()
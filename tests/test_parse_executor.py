@@ -0,0 +1,94 @@
+"""
+ParseExecutor 테스트
+프로세스 풀 파싱 결과, 제한 시간 초과 시 워커 강제 종료 및 풀 재생성
+"""
+import os
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import pytest
+from backend.analyzer.parser.parse_executor import ParseExecutor, parse_file
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "제안서")
+SAMPLE_PDF = os.path.join(SAMPLE_DIR, "공고서.pdf")
+
+pytestmark = pytest.mark.skipif(not os.path.exists(SAMPLE_PDF), reason="샘플 제안서 PDF 없음")
+
+
+@pytest.fixture
+def executor():
+    instance = ParseExecutor(max_workers=1, timeout=30, page_workers=1)
+    yield instance
+    instance.shutdown()
+
+
+def test_pool_parse_matches_direct_parse(executor):
+    success, result = executor.parse(SAMPLE_PDF, "공고서.pdf")
+    assert success
+    assert result["text"] == parse_file(SAMPLE_PDF, "공고서.pdf")[1]["text"]
+    assert result["stats"]["format"] == "pdf"
+
+
+def test_unsupported_extension(executor):
+    success, message = executor.parse(SAMPLE_PDF, "공고서.txt")
+    assert not success
+    assert ".txt" in message
+
+
+def test_timeout_kills_running_worker(executor):
+    executor.timeout = 1
+    pool = executor._get_pool()
+    future = executor._submit(pool, time.sleep, 30)
+    processes = list(pool._processes.values())
+
+    started = time.monotonic()
+    with pytest.raises(FuturesTimeoutError):
+        executor._wait(pool, future)
+    assert time.monotonic() - started < 5
+
+    for process in processes:
+        process.join(5)
+        assert not process.is_alive()
+    assert executor._pool is None
+
+
+def test_parse_timeout_returns_error_and_pool_recovers(executor):
+    executor.timeout = 0.01
+    success, message = executor.parse(SAMPLE_PDF, "공고서.pdf")
+    assert not success
+    assert "시간이 초과" in message
+    assert executor._pool is None
+
+    # 다음 요청은 새 풀에서 정상 처리되고, 슬롯도 반환되어 있음
+    executor.timeout = 30
+    success, result = executor.parse(SAMPLE_PDF, "공고서.pdf")
+    assert success and result["text"]
+
+
+def test_sharded_pdf_matches_single_parse(monkeypatch):
+    """페이지 구간으로 나눈 병렬 추출 결과가 파일 단위 파싱과 동일 (페이지 순서 유지)"""
+    from config.settings import settings
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 2)
+    sharded = ParseExecutor(max_workers=2, timeout=60, page_workers=3)
+    try:
+        assert len(sharded._page_shards(SAMPLE_PDF, "공고서.pdf")) == 3
+        success, result = sharded.parse(SAMPLE_PDF, "공고서.pdf")
+    finally:
+        sharded.shutdown()
+
+    expected = parse_file(SAMPLE_PDF, "공고서.pdf")[1]
+    assert success
+    assert result["text"] == expected["text"]
+    assert result["stats"]["total_pages"] == expected["stats"]["total_pages"]
+
+
+def test_sharded_pdf_timeout_kills_pool(monkeypatch):
+    from config.settings import settings
+    monkeypatch.setattr(settings, "PDF_PARALLEL_MIN_PAGES", 2)
+    sharded = ParseExecutor(max_workers=2, timeout=0.01, page_workers=3)
+    try:
+        success, message = sharded.parse(SAMPLE_PDF, "공고서.pdf")
+        assert not success
+        assert "시간이 초과" in message
+        assert sharded._pool is None
+    finally:
+        sharded.shutdown()
@@ -0,0 +1,142 @@
+"""
+RateLimiter 테스트
+FIFO 대기 순서, 마감 시간 초과, 동시 실행 수 제한, 실제 사용량 정산, 429 보류, 유휴 예산 정리
+"""
+import asyncio
+import threading
+import time
+import pytest
+from backend.analyzer.gemini.rate_limiter import RateLimiter, RateLimitTimeout
+
+
+def test_tokens_budget_and_settlement():
+    """TPM 예산 차감 후 실제 사용량과의 차이를 돌려받음"""
+    limiter = RateLimiter(rpm=600, tpm=1000, max_in_flight=4, queue_timeout=1)
+    lease = limiter.acquire("key", 800)
+    lease.release(actual_tokens=200)
+
+    # 추정 800 중 600을 돌려받아 800 토큰 요청이 바로 통과
+    started = time.monotonic()
+    limiter.acquire("key", 800).release()
+    assert time.monotonic() - started < 0.1
+
+
+def test_deadline_expiry_fails_fast():
+    """마감 전에 예산이 찰 수 없으면 기다리지 않고 바로 실패"""
+    limiter = RateLimiter(rpm=1, tpm=1000, max_in_flight=4, queue_timeout=0.5)
+    limiter.acquire("key", 1).release()
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("key", 1)
+    assert time.monotonic() - started < 0.1
+    assert limiter.get_stats()["keys"][limiter._key("key")[:8]]["timeouts"] == 1
+
+
+def test_in_flight_limit_waits_then_times_out():
+    """동시 실행 슬롯이 반환되지 않으면 마감 시간까지 대기 후 실패, 대기열에 남지 않음"""
+    limiter = RateLimiter(rpm=6000, tpm=100000, max_in_flight=1, queue_timeout=0.2)
+    held = limiter.acquire("key", 1)
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("key", 1)
+    assert 0.15 < time.monotonic() - started < 1
+    assert limiter.get_stats()["keys"][limiter._key("key")[:8]]["queued"] == 0
+
+    held.release()
+    limiter.acquire("key", 1).release()
+
+
+def test_keys_are_independent():
+    """키별 예산은 서로 영향을 주지 않음"""
+    limiter = RateLimiter(rpm=6000, tpm=100000, max_in_flight=1, queue_timeout=0.2)
+    held = limiter.acquire("a", 1)
+    limiter.acquire("b", 1).release()
+    held.release()
+
+
+def test_fifo_order_threads():
+    """슬롯이 반환되면 먼저 대기한 스레드부터 획득"""
+    limiter = RateLimiter(rpm=6000, tpm=100000, max_in_flight=1, queue_timeout=5)
+    held = limiter.acquire("key", 1)
+    order = []
+
+    def worker(index):
+        lease = limiter.acquire("key", 1)
+        order.append(index)
+        lease.release()
+
+    threads = []
+    for index in range(5):
+        thread = threading.Thread(target=worker, args=(index,))
+        thread.start()
+        threads.append(thread)
+        # 대기열 진입 순서를 고정
+        while limiter.get_stats()["keys"][limiter._key("key")[:8]]["queued"] < index + 1:
+            time.sleep(0.005)
+
+    held.release()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_fifo_order_async():
+    """코루틴 대기도 FIFO 순서로 획득하고, 취소된 대기는 대기열에서 제거"""
+    limiter = RateLimiter(rpm=6000, tpm=100000, max_in_flight=1, queue_timeout=5)
+
+    async def main():
+        held = await limiter.acquire_async("key", 1)
+        order = []
+
+        async def worker(index):
+            lease = await limiter.acquire_async("key", 1)
+            order.append(index)
+            await asyncio.sleep(0)
+            lease.release()
+
+        tasks = []
+        for index in range(4):
+            tasks.append(asyncio.create_task(worker(index)))
+            await asyncio.sleep(0.01)
+
+        tasks[1].cancel()
+        held.release()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return order
+
+    assert asyncio.run(main()) == [0, 2, 3]
+    assert limiter.get_stats()["keys"][limiter._key("key")[:8]]["queued"] == 0
+
+
+def test_throttled_key_is_blocked():
+    """429 보고 후 retry_after 동안 신규 호출 보류"""
+    limiter = RateLimiter(rpm=6000, tpm=100000, max_in_flight=4, queue_timeout=1)
+    limiter.report_throttled("key", retry_after=0.2)
+
+    started = time.monotonic()
+    limiter.acquire("key", 1).release()
+    assert time.monotonic() - started >= 0.15
+
+
+def test_parse_retry_after():
+    """429 메시지에서 재시도 대기 시간 추출"""
+    assert RateLimiter.parse_retry_after(Exception("429 Quota exceeded. Please retry in 12.5s.")) == 12.5
+    assert RateLimiter.parse_retry_after(Exception("500 internal")) is None
+    assert RateLimiter.is_throttled(Exception("429 RESOURCE_EXHAUSTED"))
+
+
+def test_idle_budgets_pruned():
+    """유휴 상태로 버킷이 가득 찬 예산만 정리"""
+    limiter = RateLimiter(rpm=60000, tpm=1000000, max_in_flight=4, queue_timeout=1)
+    limiter.PRUNE_INTERVAL_SECONDS = 0
+    held = limiter.acquire("busy", 1)
+    for index in range(20):
+        limiter.acquire(f"idle-{index}", 1).release()
+
+    time.sleep(0.05)
+    limiter.acquire("new", 1).release()
+
+    assert set(limiter._budgets) == {limiter._key("busy"), limiter._key("new")}
+    held.release()
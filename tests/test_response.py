@@ -0,0 +1,106 @@
+"""
+GeminiResponse.decode / _close_truncated 테스트
+잘린 응답 복구, 이스케이프 문자열, 중첩 구조, 스키마 검증 보고서
+"""
+import json
+from typing import List
+from pydantic import BaseModel
+from backend.analyzer.gemini.response import GeminiResponse
+
+
+class _Sample(BaseModel):
+    title: str
+    items: List[str]
+
+
+def test_decode_valid_with_schema():
+    """온전한 응답은 스키마로 바로 검증"""
+    success, data, report = GeminiResponse.decode('{"title": "a", "items": ["x"]}', _Sample)
+    assert success
+    assert data == {"title": "a", "items": ["x"]}
+    assert report["valid"] and not report["repaired"]
+
+
+def test_decode_code_fence_and_leading_prose():
+    """코드 블록과 앞쪽 설명문 제거"""
+    success, data, _ = GeminiResponse.decode('결과입니다.\n```json\n{"title": "a", "items": []}\n```\n끝')
+    assert success and data == {"title": "a", "items": []}
+
+    success, data, _ = GeminiResponse.decode('분석 결과: {"title": "b", "items": []}')
+    assert success and data["title"] == "b"
+
+
+def test_decode_trailing_prose_is_not_repair():
+    """최상위 값이 닫힌 뒤 붙은 설명문은 잘라내기만 함"""
+    success, data, report = GeminiResponse.decode('{"title": "a", "items": []} 이상입니다.', _Sample)
+    assert success and data == {"title": "a", "items": []}
+    assert not report["repaired"]
+
+
+def test_decode_truncated_drops_unfinished_string():
+    """닫히지 않은 문자열 값은 버리고 앞의 필드만 복구"""
+    success, data, report = GeminiResponse.decode('{"title": "a", "items": ["x", "y", "unfini', _Sample)
+    assert success
+    assert data == {"title": "a", "items": ["x", "y"]}
+    assert report["repaired"]
+    assert report["salvaged"] == ["title", "items"]
+    assert report["truncated_field"] == "items"
+    assert report["missing"] == []
+
+
+def test_decode_truncated_reports_missing_fields():
+    """끊긴 지점 이후의 스키마 필드는 누락으로 보고"""
+    success, data, report = GeminiResponse.decode('{"title": "a", "ite', _Sample)
+    assert success
+    assert data == {"title": "a"}
+    assert report["truncated_field"] is None
+    assert report["missing"] == ["items"]
+    assert not report["valid"]
+
+
+def test_decode_nothing_salvageable():
+    """복구할 필드가 없으면 실패"""
+    success, message, _ = GeminiResponse.decode('{"tit')
+    assert not success
+    assert "복구" in message
+
+
+def test_decode_unparseable():
+    """JSON이 아닌 응답은 실패"""
+    success, message, _ = GeminiResponse.decode("죄송합니다. 분석할 수 없습니다.")
+    assert not success
+    assert isinstance(message, str)
+
+
+def test_close_truncated_escaped_quotes():
+    """이스케이프된 따옴표/역슬래시는 문자열 끝으로 보지 않음"""
+    text = '{"a": "he said \\"hi\\"", "b": "ends with backslash \\\\", "c": "cut \\"mid'
+    repaired, depth = GeminiResponse._close_truncated(text)
+    assert depth == 1
+    assert json.loads(repaired) == {"a": 'he said "hi"', "b": "ends with backslash \\"}
+
+
+def test_close_truncated_braces_inside_strings():
+    """문자열 안의 괄호는 중첩 깊이에 영향 없음"""
+    repaired, depth = GeminiResponse._close_truncated('{"a": "{[not json]}", "b": [1, 2')
+    assert depth == 2
+    assert json.loads(repaired) == {"a": "{[not json]}", "b": [1]}
+
+
+def test_close_truncated_nested():
+    """중첩 객체/배열을 마지막 완결 지점에서 닫음"""
+    repaired, depth = GeminiResponse._close_truncated('{"a": {"b": [{"c": "d"}, {"e": "f"}, {"g": tr')
+    assert json.loads(repaired) == {"a": {"b": [{"c": "d"}, {"e": "f"}, {}]}}
+    assert depth == 4
+
+
+def test_close_truncated_dangling_key_and_literal():
+    """값 없는 키와 끊긴 숫자/리터럴은 버림"""
+    assert json.loads(GeminiResponse._close_truncated('{"a": 1, "b": ')[0]) == {"a": 1}
+    assert json.loads(GeminiResponse._close_truncated('{"a": "x", "b": 12')[0]) == {"a": "x"}
+    assert json.loads(GeminiResponse._close_truncated('{"a": [true, fal')[0]) == {"a": [True]}
+
+
+def test_close_truncated_mismatched_closer():
+    """짝이 맞지 않는 괄호는 복구 불가"""
+    assert GeminiResponse._close_truncated('{"a": [1, 2}') is None
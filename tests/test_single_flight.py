@@ -0,0 +1,131 @@
+"""
+SingleFlight 테스트
+동시 동일 키 요청 병합, 에러 전달, 키 분리, 주도자 취소 시 대기자 해제
+"""
+import asyncio
+import threading
+import time
+import pytest
+from backend.utils.single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def work():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "result"
+
+    results = []
+
+    def caller():
+        results.append(flight.do("key", work))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(1)
+    followers = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join(2)
+
+    assert calls == [1]
+    assert sorted(results, key=lambda item: item[1]) == [("result", False)] + [("result", True)] * 4
+    assert flight.get_stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+
+def test_error_is_shared_and_key_released():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    errors = []
+
+    def caller():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(1)
+    follower = threading.Thread(target=caller)
+    follower.start()
+    for thread in (leader, follower):
+        thread.join(2)
+
+    assert errors == ["boom", "boom"]
+    # 실패 후에는 같은 키로 새로 실행
+    assert flight.do("key", lambda: "retry") == ("retry", False)
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.get_stats()["coalesced"] == 0
+
+
+def test_async_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    async def main():
+        return await asyncio.gather(*[flight.do_async("key", work) for _ in range(5)])
+
+    results = asyncio.run(main())
+    assert calls == [1]
+    assert [shared for _, shared in results].count(False) == 1
+    assert all(result == {"ok": True} for result, _ in results)
+
+
+def test_cancelled_follower_does_not_cancel_leader():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        leader = asyncio.create_task(flight.do_async("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do_async("key", work))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(main()) == ("done", False)
+
+
+def test_cancelled_leader_releases_followers():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(10)
+
+    async def main():
+        leader = asyncio.create_task(flight.do_async("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do_async("key", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(follower, 1)
+
+    asyncio.run(main())
+    assert flight.get_stats()["in_flight"] == 0
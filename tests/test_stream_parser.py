@@ -0,0 +1,81 @@
+"""
+StructuredStreamParser 테스트
+조각 경계(토큰/이스케이프 중간)와 무관하게 같은 이벤트를 내보내는지 확인
+"""
+import json
+import pytest
+from backend.analyzer.gemini.stream_parser import StructuredStreamParser
+
+DOCUMENT = {
+    "summary": "문서 \"요약\" {괄호} [배열] \\ 역슬래시, 쉼표",
+    "requirements": [
+        {"category": "기능", "items": [{"id": 1, "text": "a, b"}], "note": None},
+        {"category": "보안", "items": [], "note": "}]"},
+    ],
+    "score": 12.5,
+    "tags": ["x", "y"],
+    "done": True,
+}
+TEXT = "```json\n" + json.dumps(DOCUMENT, ensure_ascii=False, indent=2) + "\n```"
+
+
+def _run(chunks):
+    parser = StructuredStreamParser(item_fields=["requirements"])
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    return parser, events
+
+
+def test_single_chunk_events():
+    """최상위 필드와 배열 요소 이벤트"""
+    parser, events = _run([TEXT])
+
+    fields = [(event[1], event[2]) for event in events if event[0] == "field"]
+    assert fields == list(DOCUMENT.items())
+
+    items = [event[1:] for event in events if event[0] == "item"]
+    assert items == [("requirements", DOCUMENT["requirements"][0], 0), ("requirements", DOCUMENT["requirements"][1], 1)]
+
+    assert parser.is_complete
+    assert parser.result() == DOCUMENT
+
+
+def test_item_event_precedes_field_event():
+    """배열 요소는 필드 전체가 닫히기 전에 내보냄"""
+    _, events = _run([TEXT])
+    kinds = [(event[0], event[1]) for event in events]
+    assert kinds.index(("item", "requirements")) < kinds.index(("field", "requirements"))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+def test_chunk_boundaries(size):
+    """조각 크기와 무관하게 같은 이벤트 (키/문자열/이스케이프/숫자 중간에서 끊기는 경우 포함)"""
+    _, expected = _run([TEXT])
+    _, events = _run([TEXT[start:start + size] for start in range(0, len(TEXT), size)])
+    assert events == expected
+
+
+def test_split_inside_escape_sequence():
+    """역슬래시 직후에서 끊겨도 이스케이프된 따옴표를 문자열 끝으로 보지 않음"""
+    text = '{"a": "x\\"}, y", "b": 1}'
+    split = text.index("\\") + 1
+    parser, events = _run([text[:split], text[split:]])
+    assert events == [("field", "a", 'x"}, y'), ("field", "b", 1)]
+    assert parser.is_complete
+
+
+def test_incomplete_stream():
+    """끊긴 스트림은 완료된 필드만 내보내고 result는 실패"""
+    parser, events = _run(['{"a": 1, "b": [1, 2'])
+    assert events == [("field", "a", 1)]
+    assert not parser.is_complete
+    with pytest.raises(json.JSONDecodeError):
+        parser.result()
+
+
+def test_item_index_resets_per_field():
+    """요소 인덱스는 배열 필드마다 0부터 시작"""
+    parser = StructuredStreamParser(item_fields=["a", "b"])
+    events = parser.feed('{"a": [{"x": 1}, {"x": 2}], "b": [{"y": 1}]}')
+    assert [(event[1], event[3]) for event in events if event[0] == "item"] == [("a", 0), ("a", 1), ("b", 0)]
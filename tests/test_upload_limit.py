@@ -0,0 +1,71 @@
+"""
+UploadSizeLimitMiddleware 테스트
+Content-Length 사전 거부, 청크 전송 중 초과 중단, 제한 이하 업로드 통과
+"""
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+from backend.utils.upload_limit import UploadSizeLimitMiddleware
+
+
+def _client(max_body_bytes: int):
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_bytes=max_body_bytes)
+    received = []
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        received.append(len(await file.read()))
+        return {"size": received[-1]}
+
+    @app.post("/json")
+    async def json_body(payload: dict):
+        return {"keys": len(payload)}
+
+    return TestClient(app), received
+
+
+def test_small_upload_passes():
+    client, received = _client(4096)
+    response = client.post("/upload", files={"file": ("a.pdf", b"x" * 1000)})
+    assert response.status_code == 200
+    assert received == [1000]
+
+
+def test_content_length_rejected_before_endpoint():
+    """Content-Length가 제한을 넘으면 엔드포인트가 호출되지 않음"""
+    client, received = _client(4096)
+    response = client.post("/upload", files={"file": ("a.pdf", b"x" * 10000)})
+    assert response.status_code == 413
+    assert "파일 크기가 너무 큽니다" in response.json()["detail"]
+    assert received == []
+
+
+def test_chunked_upload_stopped_while_receiving():
+    """Content-Length 없이 전송되면 누적 수신 바이트로 중단"""
+    client, received = _client(4096)
+    boundary = "limit-test"
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="a.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode()
+
+    def body():
+        yield head
+        for _ in range(100):
+            yield b"x" * 1024
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    response = client.post(
+        "/upload",
+        content=body(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    assert response.status_code == 413
+    assert received == []
+
+
+def test_non_multipart_requests_are_not_limited():
+    client, _ = _client(16)
+    response = client.post("/json", json={str(index): index for index in range(100)})
+    assert response.status_code == 200